@@ -3,8 +3,19 @@ const state = {
   query: '',
   category: 'All',
   lastTrigger: null,
+  // Built once per catalog load; filtering only toggles `hidden` on these.
+  cards: [],
+  groups: [],
+  searchTimer: null,
+  // Chart URL -> rendered iframe, least recently viewed first.
+  frames: new Map(),
+  activeFrame: null,
+  prefetched: new Set(),
 };
 
+const SEARCH_DEBOUNCE_MS = 120;
+const DEFAULT_FRAME_POOL = 3;
+
 const elements = {
   latestDataDate: document.getElementById('latestDataDate'),
   totalChartCount: document.getElementById('totalChartCount'),
@@ -21,6 +32,7 @@ const elements = {
   closeViewer: document.getElementById('closeViewer'),
   frameWrap: document.getElementById('chartFrameWrap'),
   frame: document.getElementById('chartFrame'),
+  framePreview: document.getElementById('framePreview'),
 };
 
 const reducedMotion = window.matchMedia('(prefers-reduced-motion: reduce)');
@@ -39,19 +51,54 @@ function formatDate(value) {
   }).format(date);
 }
 
+// Mirrors chart_catalog._search_tokens: accent- and case-folded letter/digit runs.
+function searchTokens(text) {
+  return text
+    .normalize('NFKD')
+    .replace(/\p{M}/gu, '')
+    .toLocaleLowerCase()
+    .split(/[^\p{L}\p{N}]+/u)
+    .filter(Boolean);
+}
+
 function chartSearchText(chart) {
-  return [chart.title, chart.description, chart.category, ...chart.tags]
-    .join(' ')
-    .toLocaleLowerCase();
+  // Catalogs written before search_tokens existed fall back to the visible fields.
+  const tokens =
+    chart.search_tokens ||
+    searchTokens([chart.title, chart.description, chart.category, ...chart.tags].join(' '));
+  return tokens.join(' ');
 }
 
-function filteredCharts() {
-  const normalizedQuery = state.query.trim().toLocaleLowerCase();
-  return state.catalog.charts.filter(chart => {
-    const matchesCategory = state.category === 'All' || chart.category === state.category;
-    const matchesQuery = !normalizedQuery || chartSearchText(chart).includes(normalizedQuery);
-    return matchesCategory && matchesQuery;
+function matchesQuery(card, terms) {
+  return terms.every(term => card.searchText.includes(term));
+}
+
+const compactNumber = new Intl.NumberFormat('en-US', {
+  notation: 'compact',
+  maximumSignificantDigits: 3,
+});
+
+function formatChange(summary, days) {
+  const percent = summary[`pct_change_${days}d`];
+  const change = percent ?? summary[`change_${days}d`];
+  if (change === null || change === undefined) return null;
+  const sign = change > 0 ? '+' : change < 0 ? '−' : '';
+  const magnitude = compactNumber.format(Math.abs(change));
+  return { text: `${sign}${magnitude}${percent === null ? '' : '%'} ${days}d`, change };
+}
+
+// Latest value of the chart's primary series, precomputed by the build.
+function createSummary(summary) {
+  const stat = makeElement('p', 'card-stat');
+  stat.title = `${summary.series} as of ${formatDate(summary.date)}`;
+  stat.appendChild(makeElement('span', 'card-stat-value', compactNumber.format(summary.value)));
+  [30, 365].forEach(days => {
+    const change = formatChange(summary, days);
+    if (!change) return;
+    const direction = change.change > 0 ? 'up' : change.change < 0 ? 'down' : 'flat';
+    stat.appendChild(makeElement('span', `card-stat-change ${direction}`, change.text));
   });
+  return stat;
 }
 
 function makeElement(tag, className, text) {
@@ -70,8 +117,10 @@ function renderFilters() {
     button.setAttribute('aria-pressed', String(category === state.category));
     button.addEventListener('click', () => {
       state.category = category;
-      renderFilters();
-      renderCards();
+      elements.filters.querySelectorAll('.filter-button').forEach(filter => {
+        filter.setAttribute('aria-pressed', String(filter.dataset.category === category));
+      });
+      applyFilters();
     });
     elements.filters.appendChild(button);
   });
@@ -80,12 +129,26 @@ function renderFilters() {
 function createCard(chart) {
   const article = makeElement('article', 'chart-card');
   if (chart.featured) article.appendChild(makeElement('span', 'featured-label', 'Featured'));
+  if (chart.preview) {
+    const preview = makeElement('img', 'card-preview');
+    preview.src = chart.preview;
+    preview.alt = '';
+    preview.width = 240;
+    preview.height = 72;
+    preview.loading = 'lazy';
+    preview.decoding = 'async';
+    article.appendChild(preview);
+  }
 
   const title = makeElement('h4', '', chart.title);
   const description = makeElement('p', 'card-description', chart.description);
   const tags = makeElement('ul', 'tag-list');
   chart.tags.slice(0, 4).forEach(tag => tags.appendChild(makeElement('li', '', tag)));
 
+  // Warm the browser cache before the click so the viewer opens from disk.
+  article.addEventListener('pointerenter', () => prefetchChart(chart));
+  article.addEventListener('focusin', () => prefetchChart(chart));
+
   const actions = makeElement('div', 'card-actions');
   const viewButton = makeElement('button', 'button button-primary', 'View chart');
   viewButton.type = 'button';
@@ -97,28 +160,16 @@ function createCard(chart) {
   standalone.rel = 'noopener noreferrer';
 
   actions.append(viewButton, standalone);
-  article.append(title, description, tags, actions);
+  article.appendChild(title);
+  if (chart.summary?.value != null) article.appendChild(createSummary(chart.summary));
+  article.append(description, tags, actions);
   return article;
 }
 
 function renderCards() {
-  const charts = filteredCharts();
-  elements.groups.replaceChildren();
-  elements.groups.setAttribute('aria-busy', 'false');
-  elements.resultsCount.textContent = `${charts.length} of ${state.catalog.chart_count} charts`;
-
-  if (!charts.length) {
-    elements.groups.appendChild(
-      makeElement('p', 'no-results', 'No charts match this search. Try another term or category.')
-    );
-    return;
-  }
-
   const fragment = document.createDocumentFragment();
-  state.catalog.categories.forEach((category, categoryIndex) => {
-    const categoryCharts = charts.filter(chart => chart.category === category);
-    if (!categoryCharts.length) return;
-
+  state.cards = [];
+  state.groups = state.catalog.categories.map((category, categoryIndex) => {
     const section = makeElement('section', 'category-group');
     const headingId = `category-${categoryIndex}`;
     section.setAttribute('aria-labelledby', headingId);
@@ -126,14 +177,109 @@ function renderCards() {
     const header = makeElement('div', 'category-heading');
     const title = makeElement('h3', 'category-title', category);
     title.id = headingId;
-    header.append(title, makeElement('span', 'category-count', `${categoryCharts.length} charts`));
+    const count = makeElement('span', 'category-count');
+    header.append(title, count);
 
     const grid = makeElement('div', 'chart-grid');
-    categoryCharts.forEach(chart => grid.appendChild(createCard(chart)));
+    const cards = state.catalog.charts
+      .filter(chart => chart.category === category)
+      .map(chart => ({ chart, element: createCard(chart), searchText: chartSearchText(chart) }));
+    cards.forEach(card => grid.appendChild(card.element));
+    state.cards.push(...cards);
+
     section.append(header, grid);
     fragment.appendChild(section);
+    return { category, section, count, cards };
+  });
+
+  const noResults = makeElement(
+    'p',
+    'no-results',
+    'No charts match this search. Try another term or category.'
+  );
+  state.noResults = noResults;
+  fragment.appendChild(noResults);
+  elements.groups.replaceChildren(fragment);
+  elements.groups.setAttribute('aria-busy', 'false');
+  applyFilters();
+}
+
+function applyFilters() {
+  const terms = searchTokens(state.query);
+  let visibleTotal = 0;
+  state.groups.forEach(group => {
+    const categoryMatches = state.category === 'All' || group.category === state.category;
+    let visible = 0;
+    group.cards.forEach(card => {
+      const show = categoryMatches && matchesQuery(card, terms);
+      if (card.element.hidden === show) card.element.hidden = !show;
+      if (show) visible += 1;
+    });
+    group.section.hidden = visible === 0;
+    group.count.textContent = `${visible} charts`;
+    visibleTotal += visible;
+  });
+  state.noResults.hidden = visibleTotal > 0;
+  elements.resultsCount.textContent = `${visibleTotal} of ${state.catalog.chart_count} charts`;
+}
+
+function prefetchChart(chart) {
+  if (state.prefetched.has(chart.url) || state.frames.has(chart.url)) return;
+  state.prefetched.add(chart.url);
+  const link = document.createElement('link');
+  link.rel = 'prefetch';
+  link.as = 'document';
+  link.href = chart.url;
+  document.head.appendChild(link);
+}
+
+function framePoolSize() {
+  const size = Number(state.catalog?.viewer_frame_pool);
+  return Number.isInteger(size) && size > 0 ? size : DEFAULT_FRAME_POOL;
+}
+
+function createFrame() {
+  // The page ships one empty iframe; the rest of the pool is created on demand.
+  const unused = state.frames.size === 0;
+  const frame = unused ? elements.frame : makeElement('iframe', 'chart-frame');
+  if (!unused) elements.frameWrap.appendChild(frame);
+  frame.addEventListener('load', () => {
+    if (!frame.getAttribute('src')) return;
+    frame.dataset.loaded = 'true';
+    if (frame === state.activeFrame) elements.frameWrap.classList.add('loaded');
+  });
+  return frame;
+}
+
+function frameFor(chart) {
+  let frame = state.frames.get(chart.url);
+  if (frame) {
+    state.frames.delete(chart.url);
+  } else if (state.frames.size >= framePoolSize()) {
+    // Reuse the least recently viewed document's iframe for the new chart.
+    const [evictedUrl, evicted] = state.frames.entries().next().value;
+    state.frames.delete(evictedUrl);
+    frame = evicted;
+  } else {
+    frame = createFrame();
+  }
+  state.frames.set(chart.url, frame);
+  if (frame.getAttribute('src') !== chart.url) {
+    delete frame.dataset.loaded;
+    frame.src = chart.url;
+  }
+  return frame;
+}
+
+function showFrame(frame) {
+  state.activeFrame = frame;
+  state.frames.forEach(candidate => {
+    const active = candidate === frame;
+    candidate.classList.toggle('warm-frame', !active);
+    candidate.inert = !active;
+    if (active) candidate.removeAttribute('aria-hidden');
+    else candidate.setAttribute('aria-hidden', 'true');
   });
-  elements.groups.appendChild(fragment);
 }
 
 function openChart(chart, updateHistory, trigger = null) {
@@ -145,14 +291,18 @@ function openChart(chart, updateHistory, trigger = null) {
   elements.viewerTitle.textContent = chart.title;
   elements.viewerDescription.textContent = chart.description;
   elements.standaloneLink.href = chart.url;
-  elements.frame.title = `${chart.title} — interactive Bitcoin chart`;
-  elements.frame.style.height = `${Math.max(520, chart.height)}px`;
-  elements.frameWrap.classList.remove('loaded');
-
-  if (elements.frame.getAttribute('src') !== chart.url) {
-    elements.frame.src = chart.url;
+  const frame = frameFor(chart);
+  frame.title = `${chart.title} — interactive Bitcoin chart`;
+  frame.style.height = `${Math.max(520, chart.height)}px`;
+  showFrame(frame);
+  elements.frameWrap.classList.toggle('loaded', frame.dataset.loaded === 'true');
+  // The build-time sparkline paints immediately while the Plotly document loads.
+  if (chart.preview) {
+    elements.framePreview.src = chart.preview;
+    elements.framePreview.hidden = false;
   } else {
-    elements.frameWrap.classList.add('loaded');
+    elements.framePreview.removeAttribute('src');
+    elements.framePreview.hidden = true;
   }
 
   if (updateHistory) {
@@ -165,9 +315,8 @@ function openChart(chart, updateHistory, trigger = null) {
 }
 
 function closeViewer(updateHistory = true, restoreFocus = false) {
+  // Pooled frames stay loaded so reopening a recent chart is instant.
   elements.viewer.hidden = true;
-  elements.frame.removeAttribute('src');
-  elements.frameWrap.classList.remove('loaded');
   if (updateHistory) {
     const url = new URL(window.location.href);
     url.searchParams.delete('chart');
@@ -220,7 +369,10 @@ async function loadCatalog() {
 
 elements.search.addEventListener('input', event => {
   state.query = event.target.value;
-  renderCards();
+  clearTimeout(state.searchTimer);
+  state.searchTimer = setTimeout(() => {
+    if (state.catalog) applyFilters();
+  }, SEARCH_DEBOUNCE_MS);
 });
 
 elements.closeViewer.addEventListener('click', () => {
@@ -228,8 +380,6 @@ elements.closeViewer.addEventListener('click', () => {
   document.getElementById('catalog').scrollIntoView({ behavior: scrollBehavior(), block: 'start' });
 });
 
-elements.frame.addEventListener('load', () => elements.frameWrap.classList.add('loaded'));
-
 const navToggle = document.getElementById('navToggle');
 const navLinks = document.getElementById('navLinks');
 
@@ -275,3 +425,10 @@ document.addEventListener('keydown', event => {
 });
 
 loadCatalog();
+
+// sw.js is generated by the catalog build; repeat visits are then served from cache.
+if ('serviceWorker' in navigator) {
+  window.addEventListener('load', () => {
+    navigator.serviceWorker.register('sw.js').catch(error => console.warn(error));
+  });
+}
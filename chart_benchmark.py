@@ -0,0 +1,115 @@
+"""
+Master CSV parsing benchmark.
+
+Writes a synthetic ``master_metrics_data.csv.gz`` shaped like the published
+file (one row per day since 2010, every template metric plus filler columns,
+full-precision floats with leading NaN runs) and times each master CSV engine
+on it:
+
+    uv run --no-sync --with pyarrow python chart_benchmark.py
+    uv run --no-sync --with pyarrow python chart_benchmark.py --like-source
+
+``--like-source`` copies the column count from the configured Report Library
+source's header. Engines whose optional package is missing are reported and
+skipped. Both engines must return the same template columns; the benchmark
+fails if they differ.
+"""
+
+import argparse
+import datetime
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+import chart_definitions
+from chart_data import (
+    MASTER_CSV,
+    MASTER_ENGINES,
+    load_master_metrics,
+    master_schema,
+    read_csv_header,
+)
+
+FIRST_DATE = "2010-07-18"
+DEFAULT_COLUMNS = 1000
+
+
+def synthetic_master(rows, columns, seed=0):
+    """Return a master-shaped frame: template metrics first, then filler metrics."""
+    rng = np.random.default_rng(seed)
+    names = list(master_schema())
+    names += [f"metric_{index}" for index in range(columns - len(names))]
+    names = names[:columns]
+    index = pd.date_range(FIRST_DATE, periods=rows, freq="D", name="time")
+    steps = rng.normal(0.0005, 0.03, size=(rows, len(names)))
+    values = np.exp(np.cumsum(steps, axis=0)) * rng.uniform(0.01, 1e6, size=len(names))
+    # Many published metrics start years after the price history does.
+    starts = rng.integers(0, rows // 2, size=len(names))
+    values[np.arange(rows)[:, None] < starts] = np.nan
+    return pd.DataFrame(values, index=index, columns=names)
+
+
+def time_engine(engine, repeat):
+    """Return ``(frame, [seconds, ...])`` for ``repeat`` loads with one engine."""
+    timings = []
+    frame = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        frame = load_master_metrics(engine=engine)
+        timings.append(time.perf_counter() - started)
+    return frame, timings
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Compare master CSV engines.")
+    rows = (datetime.date.today() - datetime.date.fromisoformat(FIRST_DATE)).days + 1
+    parser.add_argument("--rows", type=int, default=rows)
+    parser.add_argument("--columns", type=int, default=DEFAULT_COLUMNS)
+    parser.add_argument(
+        "--like-source",
+        action="store_true",
+        help="Use the column count of the configured source's master header.",
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    columns = len(read_csv_header(MASTER_CSV)) - 1 if args.like_source else args.columns
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / MASTER_CSV
+        synthetic_master(args.rows, columns).to_csv(path, compression="gzip")
+        print(
+            f"Synthetic {MASTER_CSV}: {args.rows} rows x {columns} columns, "
+            f"{path.stat().st_size / 1e6:.1f} MB compressed"
+        )
+        chart_definitions.REPORT_CSV_DIR = directory
+
+        frames = {}
+        for engine in MASTER_ENGINES:
+            try:
+                frames[engine], timings = time_engine(engine, args.repeat)
+            except ImportError as error:
+                print(f"{engine:>8}: skipped ({error})")
+                continue
+            print(
+                f"{engine:>8}: best {min(timings):.2f}s, "
+                f"median {statistics.median(timings):.2f}s over {len(timings)} runs"
+            )
+
+    if len(frames) > 1:
+        template_columns = [column for column in master_schema() if column in frames["c"]]
+        reference = frames["c"][template_columns]
+        for engine, frame in frames.items():
+            pd.testing.assert_frame_equal(frame[template_columns], reference, check_freq=False)
+        print("Engines agree on every template column.")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
+import hashlib
 import html
 import json
 import re
 import shutil
+import unicodedata
 from collections import OrderedDict
 from datetime import datetime, timezone
 from pathlib import Path
@@ -163,6 +165,11 @@ FEATURED_FILES = {
     "Bitcoin_Cycle_Low",
 }
 
+# Rendered chart documents the catalog viewer keeps alive in hidden iframes, so
+# returning to a recently viewed chart does not reload Plotly. Each one holds a
+# full Plotly document in memory, hence the small default.
+VIEWER_FRAME_POOL = 3
+
 TAG_RULES = OrderedDict(
     [
         ("marketcap", "market cap"),
@@ -200,6 +207,141 @@ TAG_RULES = OrderedDict(
 )
 
 
+# The app shell the catalog's service worker downloads on install. catalog.json is
+# listed too: it changes every build, which also changes the manifest version.
+PRECACHE_PATTERNS = (
+    "index.html",
+    "catalog.json",
+    "assets/*",
+    "plotly.min.js",
+    "previews/*.svg",
+)
+# Chart documents, listed with their hashes but cached only once opened: a full
+# download of the library on install would fetch every chart a reader never views.
+PAGE_PATTERN = "*.html"
+
+SERVICE_WORKER = """\
+// Generated by chart_catalog.py. Do not edit; rebuild the catalog instead.
+const MANIFEST_VERSION = '__MANIFEST_VERSION__';
+const MANIFEST_URL = 'precache-manifest.json';
+const CACHE_NAME = 'chart-library';
+const PAGE_CACHE_NAME = 'chart-library-pages';
+
+let current = null;
+
+function scoped(path) {
+  return new URL(path, self.registration.scope).href;
+}
+
+// Chart pages are cached under their content hash, so a cached copy is current
+// exactly while the manifest lists that hash.
+function pageKey(path, hash) {
+  return scoped(`${path}?v=${hash}`);
+}
+
+async function storedManifest(cache) {
+  const response = await cache.match(scoped(MANIFEST_URL));
+  const stored = response ? await response.json() : {};
+  return { files: stored.files || {}, pages: stored.pages || {} };
+}
+
+// Drop cached chart pages whose hash changed or that are no longer published.
+async function prunePages(pages) {
+  const cache = await caches.open(PAGE_CACHE_NAME);
+  const keys = await cache.keys();
+  await Promise.all(
+    keys
+      .filter(request => {
+        const url = new URL(request.url);
+        return pages[manifestPath(url)] !== url.searchParams.get('v');
+      })
+      .map(request => cache.delete(request))
+  );
+}
+
+// Fetch only the shell entries whose content hash differs from the cached manifest.
+async function syncPrecache() {
+  const cache = await caches.open(CACHE_NAME);
+  const response = await fetch(`${MANIFEST_URL}?v=${MANIFEST_VERSION}`, { cache: 'no-cache' });
+  if (!response.ok) throw new Error(`Precache manifest request failed: ${response.status}`);
+  const manifest = await response.json();
+  const previous = (await storedManifest(cache)).files;
+
+  const changed = Object.keys(manifest.files).filter(
+    path => previous[path] !== manifest.files[path]
+  );
+  await Promise.all(
+    changed.map(async path => {
+      const file = await fetch(path, { cache: 'no-cache' });
+      if (!file.ok) throw new Error(`Precache request for ${path} failed: ${file.status}`);
+      await cache.put(scoped(path), file);
+    })
+  );
+  await Promise.all(
+    Object.keys(previous)
+      .filter(path => !(path in manifest.files))
+      .map(path => cache.delete(scoped(path)))
+  );
+  await prunePages(manifest.pages);
+  await cache.put(
+    scoped(MANIFEST_URL),
+    new Response(JSON.stringify(manifest), { headers: { 'Content-Type': 'application/json' } })
+  );
+  current = manifest;
+}
+
+async function currentManifest() {
+  if (!current) current = await storedManifest(await caches.open(CACHE_NAME));
+  return current;
+}
+
+function manifestPath(url) {
+  const scope = new URL(self.registration.scope);
+  if (url.origin !== scope.origin || !url.pathname.startsWith(scope.pathname)) return null;
+  const path = decodeURIComponent(url.pathname.slice(scope.pathname.length));
+  return path === '' ? 'index.html' : path;
+}
+
+// A chart page is fetched the first time it is opened after its hash changed;
+// until the next change it is served from the cache without a network request.
+async function respondWithPage(path, hash) {
+  const cache = await caches.open(PAGE_CACHE_NAME);
+  const key = pageKey(path, hash);
+  const cached = await cache.match(key);
+  if (cached) return cached;
+  const response = await fetch(key, { cache: 'no-cache' });
+  if (response.ok) await cache.put(key, response.clone());
+  return response;
+}
+
+async function respond(request, path) {
+  const manifest = await currentManifest();
+  if (path in manifest.files) {
+    const cached = await caches.match(scoped(path), { cacheName: CACHE_NAME });
+    if (cached) return cached;
+  } else if (path in manifest.pages) {
+    return respondWithPage(path, manifest.pages[path]);
+  }
+  return fetch(request);
+}
+
+self.addEventListener('install', event => {
+  event.waitUntil(syncPrecache().then(() => self.skipWaiting()));
+});
+
+self.addEventListener('activate', event => {
+  event.waitUntil(self.clients.claim());
+});
+
+self.addEventListener('fetch', event => {
+  if (event.request.method !== 'GET') return;
+  const path = manifestPath(new URL(event.request.url));
+  if (path === null || path === MANIFEST_URL) return;
+  event.respondWith(respond(event.request, path));
+});
+"""
+
+
 def _date_string(value) -> str:
     if hasattr(value, "date"):
         value = value.date()
@@ -249,6 +391,17 @@ def _tags(title: str, category: str, series: list[str]) -> list[str]:
     return tags
 
 
+def _search_tokens(*texts: str) -> list[str]:
+    """Return the sorted, de-duplicated search tokens of some catalog text.
+
+    Text is accent-folded, case-folded, and split on anything that is not a
+    letter or digit; catalog.js normalizes queries the same way.
+    """
+    folded = unicodedata.normalize("NFKD", " ".join(texts))
+    folded = "".join(char for char in folded if not unicodedata.combining(char))
+    return sorted(set(re.findall(r"[^\W_]+", folded.casefold())))
+
+
 def _chart_height(chart_path: Path, fallback: int | None = None) -> int:
     with chart_path.open(encoding="utf-8") as handle:
         prefix = handle.read(30_000)
@@ -256,7 +409,7 @@ def _chart_height(chart_path: Path, fallback: int | None = None) -> int:
     return int(match.group(1)) if match else (fallback or 700)
 
 
-def _ensure_document_title(chart_path: Path, title: str) -> None:
+def _ensure_document_title(chart_path: Path, title: str) -> bool:
     document = chart_path.read_text(encoding="utf-8")
     title_markup = f"<title>{html.escape(title)} | Secret Satoshis</title>"
     if re.search(r"<title>.*?</title>", document, flags=re.IGNORECASE | re.DOTALL):
@@ -271,23 +424,13 @@ def _ensure_document_title(chart_path: Path, title: str) -> None:
         updated = document.replace("</head>", f"{title_markup}</head>", 1)
     else:
         raise ValueError(f"Chart has no <head> element: {chart_path}")
-    if updated != document:
-        chart_path.write_text(updated, encoding="utf-8")
+    if updated == document:
+        return False
+    chart_path.write_text(updated, encoding="utf-8")
+    return True
 
 
-def build_chart_catalog(
-    *,
-    report_date,
-    chart_templates: list[dict],
-    cycle_templates: list[dict],
-    output_dir: str | Path = "Charts",
-    logo_path: str | Path = "Secret_Satoshis_Logo.png",
-) -> dict:
-    """Write catalog.json and validate all standalone chart outputs."""
-    output_dir = Path(output_dir)
-    output_dir.mkdir(parents=True, exist_ok=True)
-    (output_dir / "assets").mkdir(parents=True, exist_ok=True)
-
+def _source_metadata(chart_templates: list[dict], cycle_templates: list[dict]) -> dict:
     metadata = {
         template["filename"]: {
             "title": template["title"],
@@ -297,48 +440,58 @@ def build_chart_catalog(
         for template in [*chart_templates, *cycle_templates]
     }
     metadata.update(SPECIAL_CHARTS)
+    return metadata
 
-    categorized = [filename for files in CATEGORY_FILES.values() for filename in files]
-    if len(categorized) != EXPECTED_CHART_COUNT or len(set(categorized)) != len(categorized):
-        raise ValueError("The category registry must contain 59 unique chart filenames.")
 
-    generated = {
-        path.stem: path
-        for path in output_dir.glob("*.html")
-        if path.name != "index.html"
+def _catalog_entry(
+    filename: str,
+    category: str,
+    metadata: dict,
+    chart_path: Path,
+    rendered: dict | None = None,
+    summary: dict | None = None,
+) -> dict:
+    """Build one catalog entry, from its render-manifest entry when there is one.
+
+    Without ``rendered`` the chart document is read for its height and title.
+    ``summary`` is the chart's latest-value statistics, if it has any.
+    """
+    chart_metadata = metadata.get(filename)
+    if not chart_metadata:
+        raise ValueError(f"No source metadata found for {filename}")
+    title = chart_metadata["title"]
+    series = chart_metadata.get("series", [])
+    description = chart_metadata.get("description") or _description(filename, series)
+    tags = _tags(title, category, series)
+    if rendered is None:
+        _ensure_document_title(chart_path, title)
+        height = _chart_height(chart_path, chart_metadata.get("height"))
+        preview_path = chart_path.parent / "previews" / f"{filename}.svg"
+        preview = f"previews/{filename}.svg" if preview_path.is_file() else None
+    else:
+        if rendered["title"] != title and _ensure_document_title(chart_path, title):
+            # The document changed after rendering; let the precache manifest rehash it.
+            rendered["hash"] = None
+        height = rendered["height"] or chart_metadata.get("height") or 700
+        preview = rendered["preview"]
+    return {
+        "title": title,
+        "filename": filename,
+        "url": f"{filename}.html",
+        "category": category,
+        "description": description,
+        "tags": tags,
+        "featured": filename in FEATURED_FILES,
+        "height": height,
+        "preview": preview,
+        "summary": summary,
+        "search_tokens": _search_tokens(
+            title, description, category, filename, *tags, *series
+        ),
     }
-    if set(categorized) != set(generated):
-        missing = sorted(set(categorized) - set(generated))
-        uncataloged = sorted(set(generated) - set(categorized))
-        raise ValueError(
-            f"Chart/catalog mismatch. Missing outputs: {missing}; "
-            f"uncataloged outputs: {uncataloged}"
-        )
 
-    entries: list[dict] = []
-    for category, filenames in CATEGORY_FILES.items():
-        for filename in filenames:
-            chart_metadata = metadata.get(filename)
-            if not chart_metadata:
-                raise ValueError(f"No source metadata found for {filename}")
-            title = chart_metadata["title"]
-            series = chart_metadata.get("series", [])
-            description = chart_metadata.get("description") or _description(filename, series)
-            _ensure_document_title(generated[filename], title)
-            entries.append(
-                {
-                    "title": title,
-                    "filename": filename,
-                    "url": f"{filename}.html",
-                    "category": category,
-                    "description": description,
-                    "tags": _tags(title, category, series),
-                    "featured": filename in FEATURED_FILES,
-                    "height": _chart_height(generated[filename], chart_metadata.get("height")),
-                }
-            )
 
-    shutil.copy2(logo_path, output_dir / "assets" / "logo.png")
+def _write_catalog(output_dir: Path, report_date, entries: list[dict]) -> dict:
     category_order = {category: index for index, category in enumerate(CATEGORY_FILES)}
     entries.sort(key=lambda entry: (category_order[entry["category"]], entry["title"]))
     catalog = {
@@ -347,9 +500,220 @@ def build_chart_catalog(
         "chart_count": len(entries),
         "generated_at": datetime.now(timezone.utc).replace(microsecond=0).isoformat(),
         "categories": list(CATEGORY_FILES),
+        "viewer_frame_pool": VIEWER_FRAME_POOL,
         "charts": entries,
     }
     (output_dir / "catalog.json").write_text(
         json.dumps(catalog, indent=2) + "\n", encoding="utf-8"
     )
     return catalog
+
+
+def _file_hash(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as handle:
+        for block in iter(lambda: handle.read(1024 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()[:16]
+
+
+def write_service_worker(
+    output_dir: str | Path = "Charts", known_hashes: dict | None = None
+) -> dict:
+    """Write precache-manifest.json and sw.js for the static catalog.
+
+    The manifest maps every app-shell file (``files``) and chart document
+    (``pages``) to a content hash. Its own hash is embedded in sw.js, so any
+    changed file makes browsers install the new worker. The worker downloads
+    the shell entries whose hash changed and drops cached chart documents
+    whose hash changed; a chart is fetched again only when next opened.
+    ``known_hashes`` (relative path -> hash) skips re-reading chart documents
+    whose hash is already known from the render manifest.
+    """
+    known_hashes = known_hashes or {}
+    output_dir = Path(output_dir)
+
+    def hashes(patterns):
+        paths = {
+            path.relative_to(output_dir).as_posix()
+            for pattern in patterns
+            for path in output_dir.glob(pattern)
+            if path.is_file()
+        }
+        return {
+            path: known_hashes.get(path) or _file_hash(output_dir / path) for path in sorted(paths)
+        }
+
+    files = hashes(PRECACHE_PATTERNS)
+    pages = {path: digest for path, digest in hashes([PAGE_PATTERN]).items() if path not in files}
+    listed = json.dumps({"files": files, "pages": pages}, sort_keys=True)
+    version = hashlib.sha256(listed.encode("utf-8")).hexdigest()[:16]
+    manifest = {"version": version, "files": files, "pages": pages}
+    (output_dir / "precache-manifest.json").write_text(
+        json.dumps(manifest, indent=2) + "\n", encoding="utf-8"
+    )
+    (output_dir / "sw.js").write_text(
+        SERVICE_WORKER.replace("__MANIFEST_VERSION__", version), encoding="utf-8"
+    )
+    return manifest
+
+
+def _rendered_hashes(manifest: dict | None) -> dict:
+    return {
+        f"{filename}.html": entry["hash"]
+        for filename, entry in (manifest or {}).items()
+        if entry.get("hash")
+    }
+
+
+def verify_chart_outputs(output_dir: str | Path, manifest: dict) -> None:
+    """Check the chart documents on disk against a render manifest.
+
+    Raises ValueError listing uncataloged documents and documents whose size or
+    content hash differs from what the renderers reported.
+    """
+    output_dir = Path(output_dir)
+    on_disk = {
+        path.stem: path for path in output_dir.glob("*.html") if path.name != "index.html"
+    }
+    problems = [f"uncataloged output: {name}" for name in sorted(set(on_disk) - set(manifest))]
+    for filename, entry in sorted(manifest.items()):
+        path = on_disk.get(filename)
+        if path is None:
+            problems.append(f"missing output: {filename}")
+        elif path.stat().st_size != entry["bytes"]:
+            problems.append(f"size mismatch: {filename}")
+        elif entry.get("hash") and _file_hash(path) != entry["hash"]:
+            problems.append(f"hash mismatch: {filename}")
+    if problems:
+        raise ValueError("Chart outputs do not match the render manifest: " + "; ".join(problems))
+
+
+def category_of(filename: str) -> str:
+    """Return the catalog category a chart filename is registered under."""
+    for category, filenames in CATEGORY_FILES.items():
+        if filename in filenames:
+            return category
+    raise ValueError(f"{filename} is not registered in the chart catalog.")
+
+
+def build_chart_catalog(
+    *,
+    report_date,
+    chart_templates: list[dict],
+    cycle_templates: list[dict],
+    output_dir: str | Path = "Charts",
+    logo_path: str | Path = "Secret_Satoshis_Logo.png",
+    manifest: dict | None = None,
+    verify: bool = False,
+    summaries: dict | None = None,
+) -> dict:
+    """Write catalog.json and validate all standalone chart outputs.
+
+    With a render ``manifest`` (filename -> entry from ``save_chart_html``) the
+    catalog is built from it without reading chart documents; ``verify=True``
+    adds a disk pass comparing every document with its entry. Without one, the
+    output directory is scanned and each document is read. ``summaries``
+    (filename -> ``chart_data.latest_metric_summaries`` entry) lets cards show
+    each chart's latest value without loading it.
+    """
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    (output_dir / "assets").mkdir(parents=True, exist_ok=True)
+
+    metadata = _source_metadata(chart_templates, cycle_templates)
+
+    categorized = [filename for files in CATEGORY_FILES.values() for filename in files]
+    if len(categorized) != EXPECTED_CHART_COUNT or len(set(categorized)) != len(categorized):
+        raise ValueError("The category registry must contain 59 unique chart filenames.")
+
+    if manifest is None:
+        generated = {
+            path.stem: path
+            for path in output_dir.glob("*.html")
+            if path.name != "index.html"
+        }
+    else:
+        if verify:
+            verify_chart_outputs(output_dir, manifest)
+        generated = {filename: output_dir / f"{filename}.html" for filename in manifest}
+    if set(categorized) != set(generated):
+        missing = sorted(set(categorized) - set(generated))
+        uncataloged = sorted(set(generated) - set(categorized))
+        raise ValueError(
+            f"Chart/catalog mismatch. Missing outputs: {missing}; "
+            f"uncataloged outputs: {uncataloged}"
+        )
+
+    rendered = manifest or {}
+    summaries = summaries or {}
+    entries = [
+        _catalog_entry(
+            filename,
+            category,
+            metadata,
+            generated[filename],
+            rendered.get(filename),
+            summaries.get(filename),
+        )
+        for category, filenames in CATEGORY_FILES.items()
+        for filename in filenames
+    ]
+
+    shutil.copy2(logo_path, output_dir / "assets" / "logo.png")
+    catalog = _write_catalog(output_dir, report_date, entries)
+    write_service_worker(output_dir, _rendered_hashes(manifest))
+    return catalog
+
+
+def update_chart_catalog(
+    filenames: list[str],
+    *,
+    report_date,
+    chart_templates: list[dict],
+    cycle_templates: list[dict],
+    output_dir: str | Path = "Charts",
+    manifest: dict | None = None,
+    summaries: dict | None = None,
+) -> dict:
+    """Refresh the catalog.json entries of re-rendered charts in place.
+
+    Used by selective builds: only the named charts are re-validated, and every
+    other entry is carried over unchanged from the existing catalog. A
+    ``report_date`` of ``None`` keeps the catalog's current latest data date.
+    Charts present in the render ``manifest`` are described from it; others
+    are read from disk. ``summaries`` refreshes the latest-value statistics
+    of the re-rendered charts.
+    """
+    output_dir = Path(output_dir)
+    catalog_path = output_dir / "catalog.json"
+    if not catalog_path.is_file():
+        raise FileNotFoundError(
+            f"{catalog_path} does not exist; run a full build before a selective one."
+        )
+
+    metadata = _source_metadata(chart_templates, cycle_templates)
+    rendered = manifest or {}
+    summaries = summaries or {}
+    refreshed = {}
+    for filename in filenames:
+        chart_path = output_dir / f"{filename}.html"
+        if filename not in rendered and not chart_path.is_file():
+            raise ValueError(f"Chart/catalog mismatch. Missing output: {filename}")
+        refreshed[filename] = _catalog_entry(
+            filename,
+            category_of(filename),
+            metadata,
+            chart_path,
+            rendered.get(filename),
+            summaries.get(filename),
+        )
+
+    existing = json.loads(catalog_path.read_text(encoding="utf-8"))
+    entries = [refreshed.pop(entry["filename"], entry) for entry in existing["charts"]]
+    entries.extend(refreshed.values())
+    if report_date is None:
+        report_date = existing["latest_data_date"]
+    catalog = _write_catalog(output_dir, report_date, entries)
+    write_service_worker(output_dir, _rendered_hashes(manifest))
+    return catalog
@@ -0,0 +1,1230 @@
+"""
+Input loading for Bitcoin Chart Library.
+
+Reads Report Library's pre-computed CSVs from the source configured in
+``chart_definitions``. Loaders accept an optional column projection so that a
+run rendering a handful of charts only parses the metrics those charts plot.
+
+``load_inputs`` fetches every input a run needs at once: each file is read on
+its own thread over a shared pool of keep-alive connections, and the master
+file is decompressed and parsed as it streams in, so its parse overlaps the
+downloads of the smaller cycle CSVs.
+"""
+
+import csv
+import gzip
+import hashlib
+import http.client
+import io
+import json
+import os
+import threading
+import time
+import urllib.error
+import urllib.request
+import warnings
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import date, timedelta
+from functools import partial
+from urllib.parse import urljoin, urlsplit
+
+import numpy as np
+import pandas as pd
+
+from chart_definitions import MASTER_SHARD_DIR, csv_path, csv_source_is_remote
+import chart_templates
+from chart_templates import primary_series
+
+MASTER_CSV = "master_metrics_data.csv.gz"
+DRAWDOWN_CSV = "drawdown_data.csv"
+CYCLE_LOW_CSV = "cycle_low_data.csv"
+HALVING_CSV = "halving_data.csv"
+
+# Connections kept open per host; one per input file loaded concurrently.
+POOL_SIZE = 4
+HTTP_TIMEOUT = 60
+# Redirects followed by ConnectionPool before giving up, as urllib does.
+MAX_REDIRECTS = 5
+REDIRECT_STATUSES = (301, 302, 303, 307, 308)
+# Responses meaning a probed optional file is not published. Object stores such
+# as S3 answer 403 rather than 404 for a missing key when listing is not allowed.
+NOT_PUBLISHED_STATUSES = (403, 404, 410)
+
+# CSV parsers for the master file. "pyarrow" needs the optional pyarrow package.
+MASTER_ENGINES = ("c", "pyarrow")
+
+# Incremental ingestion keeps the parsed master frame here between runs.
+INGEST_CACHE_DIR = os.path.join("build", "ingest")
+# A full re-parse at least this often catches restatements older than the tail check.
+FULL_REPARSE_DAYS = 7
+# Already-ingested rows re-parsed and compared on every incremental run.
+TAIL_CHECK_ROWS = 30
+
+# Columnar siblings of MASTER_CSV, in order of preference. Read with the optional
+# pyarrow package when the source publishes one; the CSV is the fallback.
+MASTER_COLUMNAR = tuple(
+    MASTER_CSV.removesuffix(".csv.gz") + suffix for suffix in (".parquet", ".arrow")
+)
+# Schema metadata key holding the JSON source_record of the CSV a columnar copy was
+# written from. Copies published without it are trusted.
+COLUMNAR_SOURCE_KEY = b"source_fingerprint"
+
+# Sharded master layout (see chart_shards.py): the manifest under MASTER_SHARD_DIR,
+# and where decoded shards are cached by content hash between runs.
+SHARD_MANIFEST = "manifest.json"
+SHARD_CACHE_DIR = os.path.join("build", "shards")
+
+# Decimal places chart hover labels and ticks show (",.2f"). Plotted metrics are held
+# as float32 only when every value still rounds to the same label at this precision.
+DISPLAY_DECIMALS = 2
+# Columns whose leading NaN run covers at least this share of rows are held as a
+# block-sparse array: the first observed row plus the dense values after it.
+SPARSE_PREFIX_SHARE = 0.25
+
+# First byte range requested for a remote header; doubled until the line is complete.
+HEADER_RANGE_BYTES = 64 * 1024
+# Trailing bytes hashed by source_fingerprint. A gzip file's last 8 bytes are the
+# CRC-32 and length of everything it decompresses to.
+FINGERPRINT_TAIL_BYTES = 64 * 1024
+
+# Look-back windows, in calendar days, reported beside each chart's latest value.
+SUMMARY_PERIODS = (30, 365)
+
+
+class InputLoadError(Exception):
+    """Raised by ``load_inputs`` when one input cannot be read; names the file."""
+
+    def __init__(self, filename, error):
+        super().__init__(f"{filename}: {error}")
+        self.filename = filename
+
+
+def _proxied(url):
+    """Return whether ``urllib`` would send a request for ``url`` through a proxy."""
+    parts = urlsplit(url)
+    return parts.scheme in urllib.request.getproxies() and not urllib.request.proxy_bypass(
+        parts.hostname or ""
+    )
+
+
+class ConnectionPool:
+    """
+    Keep-alive HTTP(S) connections shared by concurrent downloads.
+
+    ``urllib`` opens a new connection (and TLS handshake) for every request.
+    Connections returned here are reused by the next request to the same host
+    once the previous response has been read to the end.
+    """
+
+    def __init__(self, size=POOL_SIZE, timeout=HTTP_TIMEOUT):
+        self.size = size
+        self.timeout = timeout
+        self._idle = {}
+        self._lock = threading.Lock()
+
+    def _connect(self, scheme, netloc):
+        with self._lock:
+            idle = self._idle.get((scheme, netloc))
+            if idle:
+                return idle.pop()
+        factory = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+        return factory(netloc, timeout=self.timeout)
+
+    def _release(self, key, connection):
+        with self._lock:
+            idle = self._idle.setdefault(key, [])
+            if len(idle) < self.size:
+                idle.append(connection)
+                return
+        connection.close()
+
+    def _get(self, url):
+        """Send ``GET url`` on a pooled connection; return its key, connection and response."""
+        parts = urlsplit(url)
+        if parts.scheme not in ("http", "https"):
+            raise urllib.error.URLError(f"unsupported URL scheme: {url}")
+        key = (parts.scheme, parts.netloc)
+        target = parts.path + (f"?{parts.query}" if parts.query else "")
+        connection = self._connect(*key)
+        try:
+            connection.request("GET", target, headers={"Connection": "keep-alive"})
+            response = connection.getresponse()
+        except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+            # The server closed an idle pooled connection; retry on a fresh one.
+            connection.close()
+            connection.request("GET", target, headers={"Connection": "keep-alive"})
+            response = connection.getresponse()
+        return key, connection, response
+
+    @contextmanager
+    def open(self, url):
+        """
+        Yield the response to ``GET url``, a file-like object streaming the body.
+
+        Redirects are followed for up to ``MAX_REDIRECTS`` hops, each on a
+        connection to the host it points at. When an HTTP(S) proxy is configured
+        for ``url`` the request is left to ``urllib``, which goes through it.
+        """
+        if _proxied(url):
+            # A fresh opener reads the proxy settings now, not at the first urlopen.
+            opener = urllib.request.build_opener(urllib.request.ProxyHandler())
+            with opener.open(url, timeout=self.timeout) as response:
+                yield response
+            return
+        for hops in range(MAX_REDIRECTS + 1):
+            key, connection, response = self._get(url)
+            location = response.getheader("Location")
+            if response.status not in REDIRECT_STATUSES or not location:
+                break
+            if hops == MAX_REDIRECTS:
+                connection.close()
+                raise urllib.error.HTTPError(
+                    url, response.status, "Too many redirects", response.msg, None
+                )
+            response.read()
+            if response.will_close:
+                connection.close()
+            else:
+                self._release(key, connection)
+            url = urljoin(url, location)
+        if response.status != 200:
+            connection.close()
+            raise urllib.error.HTTPError(url, response.status, response.reason, response.msg, None)
+        reusable = False
+        try:
+            yield response
+            response.read()
+            reusable = not response.will_close
+        finally:
+            if reusable:
+                self._release(key, connection)
+            else:
+                connection.close()
+
+    def close(self):
+        with self._lock:
+            idle, self._idle = self._idle, {}
+        for connections in idle.values():
+            for connection in connections:
+                connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+@contextmanager
+def open_input(filename, pool=None):
+    """Yield a binary stream of a Report Library file, over ``pool`` when remote."""
+    path = csv_path(filename)
+    if not csv_source_is_remote():
+        with open(path, "rb") as handle:
+            yield handle
+    elif pool is not None:
+        with pool.open(path) as response:
+            yield response
+    else:
+        with urllib.request.urlopen(path, timeout=HTTP_TIMEOUT) as response:
+            yield response
+
+
+def source_signature(filename=MASTER_CSV):
+    """Return a cheap fingerprint of a Report Library file without reading it."""
+    path = csv_path(filename)
+    if csv_source_is_remote():
+        request = urllib.request.Request(path, method="HEAD")
+        with urllib.request.urlopen(request, timeout=30) as response:
+            return (
+                response.headers.get("ETag"),
+                response.headers.get("Last-Modified"),
+                response.headers.get("Content-Length"),
+            )
+    stat = os.stat(path)
+    return stat.st_mtime_ns, stat.st_size
+
+
+def source_fingerprint(filename=MASTER_CSV):
+    """
+    Return a content fingerprint of a Report Library file from its size and tail.
+
+    Unlike ``source_signature`` it does not change when an unchanged file is
+    copied or re-deployed, so it can be recorded next to data derived from the
+    file and compared later. Only the last ``FINGERPRINT_TAIL_BYTES`` are read;
+    a remote file is fetched with a suffix ``Range`` request. For a gzip file
+    the tail holds the CRC-32 of the whole decompressed content.
+    """
+    path = csv_path(filename)
+    if csv_source_is_remote():
+        request = urllib.request.Request(
+            path, headers={"Range": f"bytes=-{FINGERPRINT_TAIL_BYTES}"}
+        )
+        with urllib.request.urlopen(request, timeout=HTTP_TIMEOUT) as response:
+            tail = response.read()
+            total = response.headers.get("Content-Range", "").rpartition("/")[2]
+        # A server that ignores Range sends the whole file.
+        size = int(total) if response.status == http.client.PARTIAL_CONTENT else len(tail)
+        tail = tail[-FINGERPRINT_TAIL_BYTES:]
+    else:
+        with open(path, "rb") as handle:
+            size = handle.seek(0, os.SEEK_END)
+            handle.seek(max(size - FINGERPRINT_TAIL_BYTES, 0))
+            tail = handle.read()
+    return f"{size}-{hashlib.sha256(tail).hexdigest()}"
+
+
+def _source_validators(filename=MASTER_CSV):
+    """
+    Return a Report Library file's size and modification validators, without reading it.
+
+    Locally these are the size and ``mtime_ns``; remotely the size, ``ETag`` and
+    ``Last-Modified`` from a ``HEAD`` request. Headers the server omits are left out.
+    """
+    path = csv_path(filename)
+    if not csv_source_is_remote():
+        stat = os.stat(path)
+        return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+    request = urllib.request.Request(path, method="HEAD")
+    with urllib.request.urlopen(request, timeout=HTTP_TIMEOUT) as response:
+        headers = response.headers
+    validators = {"etag": headers.get("ETag"), "last_modified": headers.get("Last-Modified")}
+    if (headers.get("Content-Length") or "").isdigit():
+        validators["size"] = int(headers["Content-Length"])
+    return {key: value for key, value in validators.items() if value is not None}
+
+
+def source_record(filename=MASTER_CSV):
+    """
+    Return what a copy derived from a Report Library file records about its source.
+
+    Readers compare the size and modification validators first, which costs a
+    ``stat`` or ``HEAD`` request, and the ``source_fingerprint`` only when
+    those cannot decide (see ``_copy_is_current``).
+
+    Returns:
+    dict: ``size``, ``mtime_ns`` or ``etag``/``last_modified``, and ``fingerprint``.
+    """
+    return {**_source_validators(filename), "fingerprint": source_fingerprint(filename)}
+
+
+def _first_line(raw, filename):
+    stream = gzip.GzipFile(fileobj=raw) if filename.endswith(".gz") else raw
+    try:
+        return stream.readline()
+    except EOFError:
+        # A partial response ended inside the compressed first line.
+        return b""
+
+
+def read_csv_header(filename):
+    """Return the column names of a Report Library CSV without parsing its rows.
+
+    Only the first line is read. A local file is streamed; a remote one is
+    fetched with an HTTP ``Range`` request for its first ``HEADER_RANGE_BYTES``,
+    widened until the decompressed first line is complete. A server that
+    ignores ``Range`` streams the whole file, of which only the start is read.
+    """
+    path = csv_path(filename)
+    if not csv_source_is_remote():
+        with open(path, "rb") as raw:
+            line = _first_line(raw, filename)
+        return next(csv.reader([line.decode("utf-8-sig")]), [])
+
+    size = HEADER_RANGE_BYTES
+    while True:
+        request = urllib.request.Request(path, headers={"Range": f"bytes=0-{size - 1}"})
+        with urllib.request.urlopen(request, timeout=HTTP_TIMEOUT) as response:
+            line = _first_line(response, filename)
+            partial_body = response.status == http.client.PARTIAL_CONTENT
+            total = response.headers.get("Content-Range", "").rpartition("/")[2]
+        if line.endswith(b"\n") or not partial_body or not total.isdigit() or size >= int(total):
+            return next(csv.reader([line.decode("utf-8-sig")]), [])
+        size *= 2
+
+
+def template_metric_gaps(header, templates, required=None):
+    """
+    Check a master header against the metrics chart templates plot.
+
+    Parameters:
+    header (list[str]): Master column names; the first is the date column.
+    templates (list[dict]): Line chart templates. ``y_data`` entries marked
+        ``optional`` are reported separately from required ones.
+    required (dict | None): Further required ``metric -> [chart filename, ...]``
+        for charts drawn from the master file without a template.
+
+    Returns:
+    tuple: ``(missing_required, missing_optional)``, each a
+    ``metric -> [chart filename, ...]`` dict, sorted by metric, of the metrics
+    the header lacks.
+    """
+    published = set(header[1:])
+    missing_required, missing_optional = {}, {}
+    for metric, filenames in (required or {}).items():
+        if metric not in published:
+            missing_required.setdefault(metric, []).extend(filenames)
+    for template in templates:
+        for series in template["y_data"]:
+            if series["data"] in published:
+                continue
+            missing = missing_optional if series.get("optional", False) else missing_required
+            charts = missing.setdefault(series["data"], [])
+            if template["filename"] not in charts:
+                charts.append(template["filename"])
+    return (
+        dict(sorted(missing_required.items())),
+        dict(sorted(missing_optional.items())),
+    )
+
+
+def load_master_metrics(columns=None, pool=None, engine="c"):
+    """
+    Load the master metrics frame indexed by date.
+
+    The file is parsed while it streams in: the header line is read first to
+    resolve the column projection, then the rest of the stream goes straight to
+    the CSV parser.
+
+    Parameters:
+    columns (Iterable[str] | None): Metrics to load. ``None`` loads every column.
+        Requested metrics the source does not publish are left out rather than
+        raising here, so ``create_line_chart`` can still report required metrics
+        as errors and skip optional ones with a warning.
+    pool (ConnectionPool | None): Connections to download a remote file over.
+    engine (str): ``"c"`` for pandas' parser with type inference, or
+        ``"pyarrow"`` for Arrow's multithreaded parser with the explicit
+        ``master_schema`` types.
+
+    Returns:
+    pd.DataFrame: Metrics indexed by a parsed ``DatetimeIndex``.
+    """
+    with open_input(MASTER_CSV, pool) as raw:
+        stream, header = _master_stream(raw)
+        return _parse_master(stream, header, _master_usecols(header, columns), engine)
+
+
+def _master_stream(raw):
+    """Return the decompressed master stream, positioned after its parsed header."""
+    stream = gzip.GzipFile(fileobj=raw) if MASTER_CSV.endswith(".gz") else raw
+    header = next(csv.reader([stream.readline().decode("utf-8-sig")]), [])
+    return stream, header
+
+
+def _master_usecols(header, columns):
+    if columns is None:
+        return None
+    wanted = set(columns)
+    return [header[0], *(column for column in header[1:] if column in wanted)]
+
+
+def master_schema(templates=None):
+    """
+    Return the explicit column types of the master file.
+
+    Every metric a chart template plots is float64. The date index column is
+    typed separately by the parser; unlisted columns are inferred.
+    """
+    templates = chart_templates.chart_templates if templates is None else templates
+    return {
+        series["data"]: "float64" for template in templates for series in template["y_data"]
+    }
+
+
+def _parse_master_arrow(stream, header, usecols):
+    """Parse the master CSV with pyarrow: multithreaded, typed by ``master_schema``."""
+    try:
+        import pyarrow as pa
+        from pyarrow import csv as arrow_csv
+    except ImportError as error:
+        raise ImportError(
+            "The pyarrow engine requires pyarrow: "
+            "uv run --no-sync --with pyarrow python main.py --engine pyarrow"
+        ) from error
+
+    usecols = usecols or header
+    schema = master_schema()
+    column_types = {header[0]: pa.timestamp("us")}
+    column_types.update(
+        (column, pa.float64()) for column in usecols[1:] if schema.get(column) == "float64"
+    )
+    # pyarrow reads ahead on its own thread, so decompression overlaps parsing.
+    table = arrow_csv.read_csv(
+        pa.PythonFile(stream, mode="r"),
+        read_options=arrow_csv.ReadOptions(column_names=header, use_threads=True),
+        convert_options=arrow_csv.ConvertOptions(
+            column_types=column_types, include_columns=usecols
+        ),
+    )
+    return table.to_pandas().set_index(header[0])
+
+
+def _parse_master(stream, header, usecols, engine="c"):
+    if engine == "pyarrow":
+        return _parse_master_arrow(stream, header, usecols)
+    if engine != "c":
+        raise ValueError(f"Unknown master CSV engine {engine!r}; choose from {MASTER_ENGINES}.")
+    return pd.read_csv(
+        stream,
+        header=None,
+        names=header,
+        index_col=0,
+        usecols=usecols,
+        parse_dates=True,
+        low_memory=False,
+    )
+
+
+def shard_filename(name):
+    """Return the Report Library filename of a file in the sharded master layout."""
+    return f"{MASTER_SHARD_DIR}/{name}"
+
+
+def read_shard_manifest(pool=None):
+    """
+    Return the sharded master manifest, or ``None`` when the source publishes none.
+
+    The manifest lists the master's row count, its date index shard and one
+    shard per metric, each with its file name, SHA-256 of the compressed file
+    and the ``[start, stop)`` row range it covers.
+    """
+    try:
+        with open_input(shard_filename(SHARD_MANIFEST), pool) as raw:
+            return json.load(raw)
+    except FileNotFoundError:
+        return None
+    except urllib.error.HTTPError as error:
+        if error.code in NOT_PUBLISHED_STATUSES:
+            return None
+        raise
+
+
+def _load_shard(entry, pool, cache_dir):
+    """
+    Return one shard's values, decoded from the cache when its hash is unchanged.
+
+    A fetched shard is checked against its manifest hash before it is decoded
+    and cached, so a half-published directory fails loudly instead of mixing
+    old and new data.
+    """
+    cached = os.path.join(cache_dir, f"{entry['sha256']}.npy")
+    if os.path.isfile(cached):
+        return np.load(cached, allow_pickle=False)
+    with open_input(shard_filename(entry["file"]), pool) as raw:
+        payload = raw.read()
+    if hashlib.sha256(payload).hexdigest() != entry["sha256"]:
+        raise ValueError(f"{shard_filename(entry['file'])} does not match its manifest hash.")
+    values = np.load(io.BytesIO(gzip.decompress(payload)), allow_pickle=False)
+    os.makedirs(cache_dir, exist_ok=True)
+    partial_path = f"{cached}.{threading.get_ident()}.tmp"
+    with open(partial_path, "wb") as handle:
+        np.save(handle, values, allow_pickle=False)
+    os.replace(partial_path, cached)
+    return values
+
+
+def _prune_shard_cache(cache_dir, manifest):
+    """Remove cached shards no longer listed in the manifest."""
+    current = {manifest["index"]["sha256"]}
+    current.update(entry["sha256"] for entry in manifest["shards"].values())
+    for name in os.listdir(cache_dir):
+        if name.endswith(".npy") and name.removesuffix(".npy") not in current:
+            os.remove(os.path.join(cache_dir, name))
+
+
+def load_master_shards(columns=None, pool=None, cache_dir=SHARD_CACHE_DIR, manifest=None):
+    """
+    Load the master metrics frame from the sharded layout.
+
+    Only the index shard and the shards of requested metrics are fetched, in
+    parallel, and any whose hash matches a cached copy are not fetched at all.
+
+    Parameters:
+    columns (Iterable[str] | None): Metrics to load, as for ``load_master_metrics``.
+    pool (ConnectionPool | None): Connections to download remote shards over.
+    cache_dir (str): Decoded shards are kept here, named by their hash.
+    manifest (dict | None): An already-read manifest; read from the source if ``None``.
+
+    Returns:
+    pd.DataFrame: The same frame ``load_master_metrics`` returns for ``columns``.
+    """
+    if manifest is None:
+        manifest = read_shard_manifest(pool)
+    wanted = None if columns is None else set(columns)
+    names = [name for name in manifest["columns"] if wanted is None or name in wanted]
+    entries = [manifest["index"], *(manifest["shards"][name] for name in names)]
+    with ThreadPoolExecutor(POOL_SIZE) as executor:
+        arrays = list(executor.map(partial(_load_shard, pool=pool, cache_dir=cache_dir), entries))
+    if os.path.isdir(cache_dir):
+        _prune_shard_cache(cache_dir, manifest)
+
+    rows = manifest["rows"]
+    data = {}
+    for name, entry, values in zip(names, entries[1:], arrays[1:]):
+        start, stop = entry["rows"]
+        if (start, stop) == (0, rows):
+            data[name] = values
+            continue
+        # Metrics are stored without their leading and trailing NaN runs.
+        column = np.full(rows, np.nan)
+        column[start:stop] = values
+        data[name] = column
+    index = pd.DatetimeIndex(arrays[0], name=manifest["index"]["name"])
+    return pd.DataFrame(data, index=index, columns=names)
+
+
+class _HttpRangeFile(io.RawIOBase):
+    """
+    A seekable, read-only remote file fetched with HTTP ``Range`` requests.
+
+    pyarrow reads a Parquet footer and then only the column chunks it needs, so
+    wrapping this in ``pyarrow.PythonFile`` downloads just those byte ranges,
+    over one keep-alive connection.
+    """
+
+    def __init__(self, url, size, timeout=HTTP_TIMEOUT):
+        parts = urlsplit(url)
+        factory = http.client.HTTPSConnection if parts.scheme == "https" else http.client.HTTPConnection
+        self._connect = partial(factory, parts.netloc, timeout=timeout)
+        self._connection = None
+        self.url = url
+        self.target = parts.path + (f"?{parts.query}" if parts.query else "")
+        self.size = size
+        self._position = 0
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def tell(self):
+        return self._position
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        base = {io.SEEK_SET: 0, io.SEEK_CUR: self._position, io.SEEK_END: self.size}[whence]
+        self._position = base + offset
+        return self._position
+
+    def readinto(self, buffer):
+        view = memoryview(buffer).cast("B")
+        stop = min(self._position + len(view), self.size)
+        if stop <= self._position:
+            return 0
+        body = self._get(self._position, stop - 1)
+        view[: len(body)] = body
+        self._position += len(body)
+        return len(body)
+
+    def _get(self, first, last):
+        headers = {"Range": f"bytes={first}-{last}", "Connection": "keep-alive"}
+        for retry in (False, True):
+            if self._connection is None:
+                self._connection = self._connect()
+            try:
+                self._connection.request("GET", self.target, headers=headers)
+                response = self._connection.getresponse()
+                body = response.read()
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                # The server closed the idle connection; retry once on a fresh one.
+                self._connection.close()
+                self._connection = None
+                if retry:
+                    raise
+                continue
+            if response.will_close:
+                self._connection.close()
+                self._connection = None
+            if response.status != http.client.PARTIAL_CONTENT:
+                raise urllib.error.HTTPError(
+                    self.url, response.status, response.reason, response.msg, None
+                )
+            return body
+
+    def close(self):
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+        super().close()
+
+
+def _pyarrow_or_none():
+    try:
+        import pyarrow
+    except ImportError:
+        return None
+    return pyarrow
+
+
+def find_columnar_master():
+    """
+    Return the first ``MASTER_COLUMNAR`` file the source publishes, or ``None``.
+
+    Local files are checked with ``os.path.isfile``; remote ones with a ``HEAD``
+    request. Nothing is probed when pyarrow is not installed, since the file
+    could not be read.
+    """
+    if _pyarrow_or_none() is None:
+        return None
+    for filename in MASTER_COLUMNAR:
+        path = csv_path(filename)
+        if not csv_source_is_remote():
+            if os.path.isfile(path):
+                return filename
+            continue
+        request = urllib.request.Request(path, method="HEAD")
+        try:
+            with urllib.request.urlopen(request, timeout=HTTP_TIMEOUT):
+                return filename
+        except urllib.error.HTTPError as error:
+            if error.code not in NOT_PUBLISHED_STATUSES:
+                raise
+    return None
+
+
+@contextmanager
+def _open_columnar(filename):
+    """
+    Yield a pyarrow random-access file for a columnar master.
+
+    Local files are memory-mapped. Remote files are read with ``Range``
+    requests, or downloaded whole when the server does not accept ranges or
+    a proxy is configured.
+    """
+    pa = _pyarrow_or_none()
+    path = csv_path(filename)
+    if not csv_source_is_remote():
+        with pa.memory_map(path, "r") as source:
+            yield source
+        return
+    request = urllib.request.Request(path, method="HEAD")
+    with urllib.request.urlopen(request, timeout=HTTP_TIMEOUT) as response:
+        # Range requests go straight to where any redirects led.
+        path = response.url
+        ranges = response.headers.get("Accept-Ranges", "").lower() == "bytes"
+        size = int(response.headers.get("Content-Length") or 0)
+    if not ranges or not size or _proxied(path):
+        with urllib.request.urlopen(path, timeout=HTTP_TIMEOUT) as response:
+            yield pa.BufferReader(response.read())
+        return
+    with _HttpRangeFile(path, size) as remote:
+        yield pa.PythonFile(remote, mode="r")
+
+
+def _columnar_reader(source, filename):
+    """Return a Parquet or Arrow IPC reader for ``source`` and its Arrow schema."""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    if filename.endswith(".parquet"):
+        # Pre-buffering coalesces the projected column chunks into few reads.
+        reader = pq.ParquetFile(source, pre_buffer=True)
+        return reader, reader.schema_arrow
+    reader = pa.ipc.open_file(source)
+    return reader, reader.schema
+
+
+def _columnar_header(schema):
+    """
+    Return a columnar master's columns in CSV order: the date column, then metrics.
+
+    The date column is the pandas index recorded in the schema's metadata, or
+    else the first column, as in the CSV.
+    """
+    index_columns = (schema.pandas_metadata or {}).get("index_columns", [])
+    named = [name for name in index_columns if isinstance(name, str)]
+    time_column = named[0] if named else schema.names[0]
+    return [time_column, *(name for name in schema.names if name not in {time_column, *named})]
+
+
+def read_columnar_schema(filename):
+    """
+    Return a columnar master's header and the ``source_record`` it was written with.
+
+    Only the file's footer is read. The record is ``None`` for files written
+    without one, such as those published upstream.
+
+    Returns:
+    tuple: ``(header, source)``.
+    """
+    with _open_columnar(filename) as source:
+        _, schema = _columnar_reader(source, filename)
+    recorded = (schema.metadata or {}).get(COLUMNAR_SOURCE_KEY)
+    return _columnar_header(schema), None if recorded is None else json.loads(recorded)
+
+
+def load_master_columnar(filename, columns=None):
+    """
+    Load the master metrics frame from a Parquet or Arrow IPC copy of the CSV.
+
+    Only the requested columns are read: a Parquet file decodes just their
+    column chunks, and an Arrow file's buffers are used in place from the
+    memory map. The date column is the pandas index recorded in the file's
+    metadata, or else its first column, as in the CSV. The file is read
+    as is; ``resolve_master_format`` checks that it is current.
+
+    Parameters:
+    filename (str): One of ``MASTER_COLUMNAR``.
+    columns (Iterable[str] | None): Metrics to load, as for ``load_master_metrics``.
+
+    Returns:
+    pd.DataFrame: The frame ``load_master_metrics`` returns for ``columns``.
+    """
+    try:
+        import pyarrow as pa
+    except ImportError as error:
+        raise ImportError(
+            f"Reading {filename} requires pyarrow: "
+            "uv run --no-sync --with pyarrow python main.py"
+        ) from error
+
+    with _open_columnar(filename) as source:
+        reader, schema = _columnar_reader(source, filename)
+        header = _columnar_header(schema)
+        time_column = header[0]
+        usecols = _master_usecols(header, columns) or header
+        if filename.endswith(".parquet"):
+            table = reader.read(usecols, use_pandas_metadata=False)
+        else:
+            # Only the projected fields' buffers are decoded.
+            fields = [schema.get_field_index(name) for name in usecols]
+            options = pa.ipc.IpcReadOptions(included_fields=fields)
+            table = pa.ipc.open_file(source, options=options).read_all().select(usecols)
+    # Skip pandas metadata so the index is set from the date column alone.
+    frame = table.replace_schema_metadata(None).to_pandas()
+    frame = frame.set_index(time_column)
+    frame.index = pd.DatetimeIndex(frame.index, name=time_column)
+    return frame
+
+
+def _copy_is_current(recorded, filename):
+    """
+    Return whether a copy of the master file was written from the current CSV.
+
+    ``recorded`` is the ``source_record`` stored with the copy when it was
+    written. Copies without one, such as those Report Library publishes, are
+    trusted. Otherwise a different CSV size means the copy is stale and a
+    matching ``ETag``, ``Last-Modified`` or local mtime means it is current;
+    only when neither decides (the copy was written where the CSV had other
+    validators, or the file was touched without changing size) is the CSV's
+    tail fetched and compared with the recorded fingerprint. A stale copy
+    warns that ``filename`` is being skipped.
+    """
+    if recorded is None:
+        return True
+    current = _source_validators()
+    if "size" in current and "size" in recorded and current["size"] != recorded["size"]:
+        is_current = False
+    else:
+        validators = ("etag", "last_modified", "mtime_ns")
+        shared = [key for key in validators if key in current and key in recorded]
+        is_current = bool(shared) and all(current[key] == recorded[key] for key in shared)
+        if not is_current:
+            is_current = recorded.get("fingerprint") == source_fingerprint()
+    if not is_current:
+        warnings.warn(
+            f"Ignoring {filename}: it was not written from the current {MASTER_CSV}. "
+            "Rerun chart_shards.py to refresh it.",
+            RuntimeWarning,
+        )
+    return is_current
+
+
+def resolve_master_format(pool=None):
+    """
+    Choose the fastest current copy of the master file the source publishes.
+
+    A shard manifest is preferred, then a ``MASTER_COLUMNAR`` file when pyarrow
+    is installed, then ``MASTER_CSV``. A shard manifest or columnar file that
+    records a different source than the current CSV is skipped with a warning
+    (see ``_copy_is_current``).
+
+    Parameters:
+    pool (ConnectionPool | None): Connections to read a remote manifest over.
+
+    Returns:
+    tuple: ``(filename, header, manifest)``: the file chosen, its column names
+    (``None`` for the CSV, whose header ``read_csv_header`` reads) and the
+    shard manifest (``None`` unless shards were chosen).
+    """
+    manifest = read_shard_manifest(pool)
+    manifest_file = shard_filename(SHARD_MANIFEST)
+    if manifest is not None and _copy_is_current(manifest.get("source"), manifest_file):
+        return manifest_file, [manifest["index"]["name"], *manifest["columns"]], manifest
+    columnar = find_columnar_master()
+    if columnar is not None:
+        header, recorded = read_columnar_schema(columnar)
+        if _copy_is_current(recorded, columnar):
+            return columnar, header, None
+    return MASTER_CSV, None, None
+
+
+def load_master_frame(
+    columns=None, pool=None, engine="c", shard_cache_dir=SHARD_CACHE_DIR, master_format=None
+):
+    """
+    Load the master metrics frame in the fastest format the source publishes.
+
+    The format is chosen by ``resolve_master_format``, unless ``master_format``
+    passes its earlier result. ``MASTER_CSV`` is parsed with ``engine``.
+    """
+    filename, _, manifest = master_format or resolve_master_format(pool)
+    if manifest is not None:
+        return load_master_shards(columns, pool, shard_cache_dir, manifest)
+    if filename in MASTER_COLUMNAR:
+        return load_master_columnar(filename, columns)
+    return load_master_metrics(columns, pool, engine)
+
+
+def compact_master_frame(frame, columns=None):
+    """
+    Return the master frame in a smaller in-memory layout for rendering.
+
+    - Columns outside ``columns`` are dropped (``None`` keeps every column).
+    - Object columns, left by failed type inference, are parsed as numbers.
+    - float64 columns become float32 when every value rounds to the same
+      ``DISPLAY_DECIMALS`` places either way, so every displayed value is
+      unchanged. Columns where any value would change stay float64.
+    - A float column whose leading NaN run covers ``SPARSE_PREFIX_SHARE`` of
+      the rows becomes a block-sparse array, which stores only the offset of
+      its first observation and the values from there on.
+
+    The index, column order and NaN positions are preserved, and chart code
+    reads the columns as before.
+
+    Parameters:
+    frame (pd.DataFrame): Master metrics from ``load_master_metrics``.
+    columns (Iterable[str] | None): Metrics to keep.
+
+    Returns:
+    pd.DataFrame: The compacted frame.
+    """
+    if columns is not None:
+        wanted = set(columns)
+        frame = frame[[column for column in frame.columns if column in wanted]]
+
+    data = {}
+    for name in frame.columns:
+        column = frame[name]
+        if column.dtype == object:
+            column = pd.to_numeric(column, errors="coerce")
+        if column.dtype != np.float64:
+            data[name] = column.to_numpy()
+            continue
+        values = column.to_numpy()
+        with np.errstate(over="ignore"):
+            narrowed = values.astype(np.float32)
+        # A value near a rounding boundary, however small the error, would flip its label.
+        displayed = np.round(narrowed.astype(np.float64), DISPLAY_DECIMALS)
+        if np.array_equal(displayed, np.round(values, DISPLAY_DECIMALS), equal_nan=True):
+            values = narrowed
+        observed = ~np.isnan(values)
+        prefix = np.argmax(observed) if observed.any() else len(values)
+        if len(values) and prefix / len(values) >= SPARSE_PREFIX_SHARE:
+            values = pd.arrays.SparseArray(values, fill_value=np.nan, kind="block")
+        data[name] = values
+    return pd.DataFrame(data, index=frame.index, columns=frame.columns)
+
+
+def _read_ingest_state(cache_dir):
+    state_path = os.path.join(cache_dir, "master_state.json")
+    frame_path = os.path.join(cache_dir, "master_frame.pkl")
+    try:
+        with open(state_path, encoding="utf-8") as handle:
+            state = json.load(handle)
+        return state, pd.read_pickle(frame_path)
+    except (OSError, ValueError, EOFError):
+        return None, None
+
+
+def _write_ingest_state(cache_dir, state, frame):
+    os.makedirs(cache_dir, exist_ok=True)
+    frame_path = os.path.join(cache_dir, "master_frame.pkl")
+    state_path = os.path.join(cache_dir, "master_state.json")
+    frame.to_pickle(frame_path + ".tmp")
+    os.replace(frame_path + ".tmp", frame_path)
+    with open(state_path + ".tmp", "w", encoding="utf-8") as handle:
+        json.dump(state, handle, indent=2)
+    os.replace(state_path + ".tmp", state_path)
+
+
+def _cache_covers(state, header, columns, today, full_reparse_days):
+    """Return whether the cached frame can be extended rather than re-parsed."""
+    if state is None or state["header"] != header:
+        return False
+    if date.fromisoformat(state["full_parse_date"]) + timedelta(days=full_reparse_days) <= today:
+        return False
+    if state["columns"] is None:
+        return True
+    return columns is not None and set(columns) & set(header[1:]) <= set(state["columns"])
+
+
+def _append_rows(cached, stream, header, usecols, tail_rows):
+    """
+    Parse only the rows dated after ``cached`` and append them.
+
+    Earlier lines are skipped by comparing their leading ``YYYY-MM-DD`` date
+    as bytes, without parsing. The last ``tail_rows`` of those are parsed as well and
+    their hashes compared with the cached rows; ``None`` is returned when they
+    differ, meaning upstream restated data that was already ingested.
+    """
+    last = str(cached.index[-1].date()).encode("ascii")
+    tail = deque(maxlen=tail_rows)
+    new_lines = []
+    for line in stream:
+        if new_lines or line.lstrip(b'"')[:10] > last:
+            new_lines.append(line)
+        else:
+            tail.append(line)
+    if not tail and not new_lines:
+        return cached
+
+    chunk = _parse_master(io.BytesIO(b"".join([*tail, *new_lines])), header, usecols)
+    overlap = chunk.iloc[: len(tail)]
+    try:
+        overlap = overlap.astype(cached.dtypes.to_dict())
+        appended = chunk.iloc[len(tail) :].astype(cached.dtypes.to_dict())
+    except (TypeError, ValueError):
+        return None
+    cached_overlap = cached.reindex(overlap.index)
+    if not np.array_equal(
+        pd.util.hash_pandas_object(overlap).to_numpy(),
+        pd.util.hash_pandas_object(cached_overlap).to_numpy(),
+    ):
+        return None
+    return pd.concat([cached, appended]) if len(appended) else cached
+
+
+def load_master_incremental(
+    columns=None,
+    pool=None,
+    cache_dir=INGEST_CACHE_DIR,
+    full_reparse_days=FULL_REPARSE_DAYS,
+    tail_rows=TAIL_CHECK_ROWS,
+    engine="c",
+):
+    """
+    Load the master metrics frame, re-parsing only rows added since the last run.
+
+    The master file grows by one row per day. The frame parsed by the previous
+    run is kept in ``cache_dir``; this run streams through the file, skips the
+    rows already ingested, parses the rest, and appends them. The whole file
+    is parsed again when there is no usable cache, when the header changed,
+    when ``columns`` asks for metrics the cache lacks, every
+    ``full_reparse_days``, and when the re-parsed ``tail_rows`` overlap no
+    longer matches the cache (an upstream restatement). ``engine`` parses
+    the full file; the few appended rows always use pandas' parser.
+
+    Returns:
+    pd.DataFrame: The same frame ``load_master_metrics(columns)`` returns.
+    """
+    today = date.today()
+    state, cached = _read_ingest_state(cache_dir)
+    with open_input(MASTER_CSV, pool) as raw:
+        stream, header = _master_stream(raw)
+        if (
+            cached is not None
+            and len(cached)
+            and _cache_covers(state, header, columns, today, full_reparse_days)
+        ):
+            usecols = _master_usecols(header, state["columns"])
+            frame = _append_rows(cached, stream, header, usecols, tail_rows)
+        else:
+            state = {
+                "header": header,
+                "columns": None if columns is None else sorted(columns),
+                "full_parse_date": today.isoformat(),
+            }
+            frame = _parse_master(
+                stream, header, _master_usecols(header, state["columns"]), engine
+            )
+    if frame is None:
+        # The tail check found a restatement after the stream was consumed.
+        frame = load_master_metrics(state["columns"], pool, engine)
+        state = {**state, "full_parse_date": today.isoformat()}
+    _write_ingest_state(cache_dir, state, frame)
+    if columns is None:
+        return frame
+    return frame[[column for column in header[1:] if column in set(columns)]]
+
+
+def load_cycle_data(filename, pool=None, template=None):
+    """
+    Load one of the drawdown, cycle-low, or halving CSVs.
+
+    With the ``template`` that plots it, the group column is read as a
+    category and the value column as float64, the day column is stored as an
+    integer type when every day is a whole number, and rows are sorted by day
+    so ``create_days_since_chart`` splits them into series in one pass.
+    """
+    dtype = None
+    if template is not None:
+        x_col = template["x_data"]
+        dtype = {
+            template.get("group_col", "Era"): "category",
+            template.get("value_col", "index_value"): "float64",
+        }
+    with open_input(filename, pool) as raw:
+        frame = pd.read_csv(raw, dtype=dtype)
+    if template is not None and x_col in frame.columns:
+        if pd.api.types.is_numeric_dtype(frame[x_col]):
+            frame[x_col] = pd.to_numeric(frame[x_col], downcast="integer")
+        frame = frame.sort_values(x_col, kind="stable", ignore_index=True)
+    return frame
+
+
+def _timed(load, *args):
+    started = time.perf_counter()
+    result = load(*args)
+    return result, time.perf_counter() - started
+
+
+def load_inputs(
+    master_columns=None,
+    cycle_csvs=(),
+    load_master=True,
+    ingest_dir=None,
+    engine="c",
+    cycle_templates=None,
+    shard_cache_dir=SHARD_CACHE_DIR,
+    master_format=None,
+):
+    """
+    Load the master frame and cycle CSVs concurrently.
+
+    Parameters:
+    master_columns (Iterable[str] | None): Projection passed to ``load_master_frame``,
+        which reads only those metrics' shards when the source is sharded.
+    cycle_csvs (Iterable[str]): Cycle CSV filenames to load.
+    load_master (bool): ``False`` skips the master file entirely.
+    ingest_dir (str | None): Load the master file incrementally, caching the
+        parsed frame here (see ``load_master_incremental``).
+    engine (str): Master CSV parser, one of ``MASTER_ENGINES``.
+    cycle_templates (dict | None): Cycle CSV filename -> the template that
+        plots it, used to type its columns (see ``load_cycle_data``).
+    shard_cache_dir (str): Where decoded master shards are cached between runs.
+    master_format (tuple | None): ``resolve_master_format()`` result to load,
+        when already resolved (e.g. for the header check).
+
+    Returns:
+    tuple: ``(report_data, cycle_data, timings)``: the master frame (or
+    ``None``), a filename -> frame dict of cycle data, and a filename ->
+    seconds dict of how long each file took to fetch and parse.
+
+    Raises:
+    InputLoadError: Naming the first input, in request order, that failed.
+    """
+    cycle_csvs = list(cycle_csvs)
+    cycle_templates = cycle_templates or {}
+    jobs = [
+        (filename, partial(load_cycle_data, template=cycle_templates.get(filename)), filename)
+        for filename in cycle_csvs
+    ]
+    if load_master:
+        # Submitted first: the largest download and parse bounds the whole stage.
+        master_loader = (
+            partial(
+                load_master_frame,
+                engine=engine,
+                shard_cache_dir=shard_cache_dir,
+                master_format=master_format,
+            )
+            if ingest_dir is None
+            else partial(load_master_incremental, cache_dir=ingest_dir, engine=engine)
+        )
+        jobs.insert(0, (MASTER_CSV, master_loader, master_columns))
+    if not jobs:
+        return None, {}, {}
+
+    with ConnectionPool(size=len(jobs)) as pool, ThreadPoolExecutor(len(jobs)) as executor:
+        futures = [
+            (filename, executor.submit(_timed, load, argument, pool))
+            for filename, load, argument in jobs
+        ]
+        results, timings = {}, {}
+        for filename, future in futures:
+            try:
+                results[filename], timings[filename] = future.result()
+            except Exception as error:
+                for _, pending in futures:
+                    pending.cancel()
+                raise InputLoadError(filename, error) from error
+
+    report_data = results.pop(MASTER_CSV, None)
+    return report_data, results, timings
+
+
+def _summary_number(value):
+    """Round a statistic for catalog.json, mapping NaN to ``None``."""
+    return float(f"{value:.6g}") if np.isfinite(value) else None
+
+
+def latest_metric_summaries(frame, templates, periods=SUMMARY_PERIODS):
+    """
+    Summarize the latest value of each template's primary series.
+
+    The primary series is chosen by ``chart_templates.primary_series``. All
+    primary metrics are handled together: one forward-filled array gives each metric's
+    latest observation and, through a single ``searchsorted`` per period, the
+    value in effect that many calendar days earlier.
+
+    Parameters:
+    frame (pd.DataFrame | MetricStore | PolarsMaster): Master metrics indexed by date.
+    templates (list[dict]): Line chart templates.
+    periods (Iterable[int]): Look-back windows in days.
+
+    Returns:
+    dict: Chart filename -> ``{"series", "metric", "date", "value",
+    "change_<n>d", "pct_change_<n>d", ...}``. Templates whose primary metric
+    has no observations are left out. Percentage changes are ``None`` when the
+    earlier value is not positive.
+    """
+    primary = {}
+    for template in templates:
+        series = primary_series(template)
+        if series is not None and series["data"] in frame.columns:
+            primary[template["filename"]] = series
+    metrics = list(dict.fromkeys(series["data"] for series in primary.values()))
+    if not isinstance(frame, pd.DataFrame):
+        frame = frame.select(metrics)
+    if not metrics or frame.empty:
+        return {}
+
+    values = frame[metrics].apply(pd.to_numeric, errors="coerce").to_numpy(dtype=np.float64)
+    observed = ~np.isnan(values)
+    # Row of each metric's last observation, or -1 when it has none.
+    last_row = len(values) - 1 - np.argmax(observed[::-1], axis=0)
+    last_row[~observed.any(axis=0)] = -1
+    filled = pd.DataFrame(values).ffill().to_numpy()
+    columns = np.arange(len(metrics))
+    dates = pd.DatetimeIndex(frame.index).values
+    latest_dates = dates[np.maximum(last_row, 0)]
+    latest = filled[np.maximum(last_row, 0), columns]
+
+    stats = {}
+    for period in periods:
+        rows = np.searchsorted(dates, latest_dates - np.timedelta64(period, "D"), side="right") - 1
+        earlier = np.where(rows >= 0, filled[np.maximum(rows, 0), columns], np.nan)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            percent = np.where(earlier > 0, (latest / earlier - 1) * 100, np.nan)
+        stats[period] = (latest - earlier, percent)
+
+    column_of = {metric: column for column, metric in enumerate(metrics)}
+    summaries = {}
+    for filename, series in primary.items():
+        column = column_of[series["data"]]
+        if last_row[column] < 0:
+            continue
+        summary = {
+            "series": series.get("name", series["data"]),
+            "metric": series["data"],
+            "date": str(latest_dates[column])[:10],
+            "value": _summary_number(latest[column]),
+        }
+        for period, (change, percent) in stats.items():
+            summary[f"change_{period}d"] = _summary_number(change[column])
+            summary[f"pct_change_{period}d"] = _summary_number(percent[column])
+        summaries[filename] = summary
+    return summaries
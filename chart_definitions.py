@@ -28,12 +28,20 @@ REPORT_CSV_DIR = os.environ.get(
 )
 
 
+# Optional sharded copy of master_metrics_data.csv.gz, in this subdirectory of
+# REPORT_CSV_DIR: one compressed file per metric plus a manifest.json with each
+# file's row range and hash (written by chart_shards.py). When present, runs
+# fetch only the shards their charts plot.
+MASTER_SHARD_DIR = "master_metrics"
+
+
 def csv_path(filename):
     """Build the full path or URL for a CSV file.
 
     Handles both local file paths and HTTP(S) URLs so that callers
     can pass the result straight to ``pd.read_csv()`` without caring
-    which mode is active.
+    which mode is active. ``filename`` may name a file in a subdirectory,
+    such as a shard under ``MASTER_SHARD_DIR``.
     """
     if REPORT_CSV_DIR.startswith(("http://", "https://")):
         return f"{REPORT_CSV_DIR.rstrip('/')}/{filename}"
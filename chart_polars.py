@@ -0,0 +1,220 @@
+"""
+Optional Polars backend for Bitcoin Chart Library.
+
+With ``--polars`` the master CSV is never loaded into one pandas frame.
+``PolarsMaster`` stands in for it instead: every chart runs a lazy
+``scan_csv`` query that reads only the metrics it plots (projection pushdown)
+and only the rows inside its ``filter_start_date``/``filter_end_date`` window
+(predicate pushdown), and the MTD/YTD return charts compute their year-by-day
+matrices in Polars' multithreaded engine. Results reach the renderer as numpy
+arrays through the same code as the pandas path, so figures agree with it to
+the last bit of float parsing (Polars rounds decimal text correctly; pandas'
+default parser can differ by one unit in the last place).
+
+Polars is not a project dependency:
+
+    uv run --no-sync --with polars python main.py --polars
+"""
+
+import calendar
+import datetime
+import gzip
+import os
+import shutil
+import tempfile
+import threading
+
+import numpy as np
+import pandas as pd
+
+from chart_data import MASTER_CSV, master_schema, open_input, read_csv_header
+from chart_definitions import csv_path, csv_source_is_remote
+
+PRICE_COLUMN = "price_close"
+# Calendar slots in a YTD matrix: every month/day except February 29.
+YEAR_SLOTS = 365
+
+
+def _polars():
+    try:
+        import polars
+    except ImportError as error:
+        raise ImportError(
+            "The Polars backend requires polars: "
+            "uv run --no-sync --with polars python main.py --polars"
+        ) from error
+    return polars
+
+
+class PolarsMaster:
+    """
+    Lazily scanned master metrics.
+
+    ``select`` returns the same frame as projecting and date-slicing the master
+    frame, so chart functions accept a ``PolarsMaster`` wherever they accept a
+    frame or a ``MetricStore``.
+    """
+
+    def __init__(self, filename=MASTER_CSV):
+        self.pl = _polars()
+        self.filename = filename
+        self._header = None
+        self._spool = None
+        self._lock = threading.Lock()
+
+    @property
+    def header(self):
+        if self._header is None:
+            self._header = read_csv_header(self.filename)
+        return self._header
+
+    @property
+    def columns(self):
+        """Published metric names, in master column order."""
+        return self.header[1:]
+
+    def _source(self):
+        """
+        Return a local, uncompressed path that Polars can scan.
+
+        A local plain CSV is scanned in place. A gzip or remote source is
+        decompressed once into a temporary file shared by every later query,
+        instead of being inflated again for each chart.
+        """
+        if not csv_source_is_remote() and not self.filename.endswith(".gz"):
+            return csv_path(self.filename)
+        with self._lock:
+            if self._spool is None:
+                spool = tempfile.TemporaryDirectory(prefix="polars-master-")
+                path = os.path.join(spool.name, self.filename.removesuffix(".gz"))
+                with open_input(self.filename) as raw, open(path, "wb") as handle:
+                    stream = gzip.GzipFile(fileobj=raw) if self.filename.endswith(".gz") else raw
+                    shutil.copyfileobj(stream, handle, 1024 * 1024)
+                self._spool = spool, path
+        return self._spool[1]
+
+    def close(self):
+        """Remove the decompressed spool file, if one was written."""
+        if self._spool is not None:
+            self._spool[0].cleanup()
+            self._spool = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def scan(self, columns, start=None, end=None):
+        """
+        Return a lazy query of ``columns`` between two dates, inclusive.
+
+        Metrics the source does not publish are left out, as
+        ``load_master_metrics`` leaves them out. Template metrics are typed
+        by ``master_schema``.
+        """
+        pl = self.pl
+        time = self.header[0]
+        wanted = set(columns)
+        names = [name for name in self.columns if name in wanted]
+        schema = master_schema()
+        lazy = pl.scan_csv(
+            self._source(),
+            try_parse_dates=True,
+            schema_overrides={
+                name: pl.Float64 for name in names if schema.get(name) == "float64"
+            },
+        ).select(time, *names)
+        # Bounds are cast to the parsed index type (Date or Datetime) so the
+        # comparison is pushed into the scan instead of running after it.
+        dtype = lazy.collect_schema()[time]
+        if start is not None:
+            bound = pl.lit(pd.Timestamp(start).to_pydatetime()).cast(dtype)
+            lazy = lazy.filter(pl.col(time) >= bound)
+        if end is not None:
+            bound = pl.lit(pd.Timestamp(end).to_pydatetime()).cast(dtype)
+            lazy = lazy.filter(pl.col(time) <= bound)
+        return lazy.with_columns(pl.col(time).cast(pl.Datetime("us")))
+
+    def select(self, columns, start=None, end=None):
+        """Return the metrics in ``columns`` between two dates as a pandas frame."""
+        frame = self.scan(columns, start, end).collect()
+        time = self.header[0]
+        index = pd.DatetimeIndex(frame[time].to_numpy(), name=time)
+        names = frame.columns[1:]
+        return pd.DataFrame(
+            {name: frame[name].to_numpy() for name in names}, index=index, columns=names
+        )
+
+    def last_date(self):
+        time = self.header[0]
+        latest = self.scan([]).select(self.pl.col(time).max()).collect().item()
+        return None if latest is None else pd.Timestamp(latest)
+
+    def _daily_prices(self, since_year):
+        """One price per calendar day from ``since_year`` on, as ``_price_series`` gives."""
+        pl = self.pl
+        time = self.header[0]
+        if PRICE_COLUMN not in self.columns:
+            raise KeyError("selected_metrics must contain a 'price_close' column.")
+        return (
+            self.scan([PRICE_COLUMN], start=datetime.date(since_year, 1, 1))
+            .with_columns(pl.col(time).dt.date().alias("day"))
+            .sort(time, maintain_order=True)
+            .group_by("day", maintain_order=True)
+            .agg(pl.col(PRICE_COLUMN).fill_nan(None).drop_nulls().last())
+            .drop_nulls()
+        )
+
+    def return_matrix(self, period, year, month=None, since_year=2014):
+        """
+        Compute a return-comparison matrix; see ``chart_format._return_matrix``.
+
+        Both queries share one scan and run together, and the per-year ratios
+        are computed as window expressions over every year at once.
+        """
+        pl = self.pl
+        prices = self._daily_prices(since_year)
+        day = pl.col("day")
+        if period == "month":
+            slots = calendar.monthrange(year, month)[1]
+            rows = prices.filter(day.dt.month() == month).with_columns(
+                slot=day.dt.day().cast(pl.Int64) - 1
+            )
+        else:
+            slots = YEAR_SLOTS
+            rows = prices.filter(~((day.dt.month() == 2) & (day.dt.day() == 29))).with_columns(
+                # Position of the month/day in a non-leap year.
+                slot=pl.date(2001, day.dt.month(), day.dt.day()).dt.ordinal_day().cast(pl.Int64)
+                - 1
+            )
+        price = pl.col(PRICE_COLUMN)
+        rows = rows.with_columns(year=day.dt.year()).with_columns(
+            start=price.first().over("year"),
+            ratio=price / price.first().over("year"),
+        )
+        if period != "month":
+            # Historical years need every non-leap calendar day; the current
+            # year may still be in progress.
+            slot = pl.col("slot")
+            complete = (
+                (pl.len().over("year") == YEAR_SLOTS)
+                & (slot.first().over("year") == 0)
+                & (slot.last().over("year") == YEAR_SLOTS - 1)
+            )
+            rows = rows.filter(complete | (pl.col("year") == year))
+
+        first_year, frame = pl.collect_all(
+            [prices.select(day.dt.year().min()), rows.select("year", "slot", "start", "ratio")]
+        )
+
+        row_years = frame["year"].to_numpy()
+        years = np.unique(row_years)
+        column = np.searchsorted(years, row_years)
+        slot = frame["slot"].to_numpy()
+        keep = slot < slots
+        ratios = np.full((slots, len(years)), np.nan)
+        ratios[slot[keep], column[keep]] = frame["ratio"].to_numpy()[keep]
+        start_prices = np.full(len(years), np.nan)
+        start_prices[column] = frame["start"].to_numpy()
+        return first_year.item(), years, ratios, start_prices
@@ -0,0 +1,152 @@
+"""
+Static SVG sparkline previews for the chart catalog.
+
+Every chart document loads the multi-megabyte Plotly bundle before anything is
+drawn. A preview is a few kilobytes of SVG polylines traced from the same
+figure the HTML export is built from, downsampled to a small point budget, so
+catalog cards can show each chart's shape immediately and the viewer has
+something to paint while the interactive document loads.
+
+Only numpy is needed: no browser, kaleido, or Plotly rendering is involved.
+"""
+
+import os
+
+import numpy as np
+
+from chart_resample import lttb
+
+PREVIEW_DIRECTORY = os.path.join("Charts", "previews")
+PREVIEW_WIDTH = 240
+PREVIEW_HEIGHT = 72
+# Points drawn across all traces of one preview; each trace gets an equal share.
+PREVIEW_POINT_BUDGET = 480
+MIN_TRACE_POINTS = 16
+FALLBACK_COLOR = "#8a8a8a"
+
+
+def _numeric(values):
+    """Return axis values as float64, mapping dates to nanoseconds and labels to positions."""
+    array = np.asarray(values)
+    if array.dtype.kind == "M":
+        nanoseconds = array.astype("datetime64[ns]")
+        return np.where(np.isnat(nanoseconds), np.nan, nanoseconds.astype(np.int64))
+    if array.dtype.kind in "iuf":
+        return array.astype(np.float64)
+    try:
+        return _numeric(array.astype("datetime64[ns]"))
+    except (TypeError, ValueError):
+        pass
+    try:
+        return array.astype(np.float64)
+    except (TypeError, ValueError):
+        return np.arange(len(array), dtype=np.float64)
+
+
+def _trace_points(trace, log_scale, n_out):
+    if trace.y is None or len(trace.y) < 2:
+        return None
+    y = _numeric(trace.y)
+    x = np.arange(len(y), dtype=np.float64) if trace.x is None else _numeric(trace.x)
+    if log_scale:
+        with np.errstate(divide="ignore", invalid="ignore"):
+            y = np.where(y > 0, np.log10(y), np.nan)
+    finite = np.isfinite(x) & np.isfinite(y)
+    x, y = x[finite], y[finite]
+    if len(x) < 2:
+        return None
+    order = np.argsort(x, kind="stable")
+    return lttb(x[order], y[order], n_out)
+
+
+def _visible_traces(figure):
+    """Return ``(index, trace)`` for each drawn line trace, indexed in ``figure.data``."""
+    return [
+        (index, trace)
+        for index, trace in enumerate(figure.data)
+        if trace.type == "scatter" and trace.visible not in (False, "legendonly")
+    ]
+
+
+def _colorway(figure):
+    """Return the colours Plotly cycles through for traces without their own."""
+    layout = figure.layout
+    template = getattr(layout.template, "layout", None)
+    return layout.colorway or getattr(template, "colorway", None) or (FALLBACK_COLOR,)
+
+
+def figure_preview_svg(figure, width=PREVIEW_WIDTH, height=PREVIEW_HEIGHT):
+    """
+    Trace a Plotly figure's line series into a small SVG sparkline.
+
+    Traces on the secondary axis are scaled independently of the primary axis,
+    and log-scaled axes are drawn in log space, so the preview has the same
+    shape as the default view of the interactive chart.
+
+    Parameters:
+    figure (go.Figure): A figure produced by the chart renderers.
+    width, height (int): Size of the SVG viewport in pixels.
+
+    Returns:
+    str | None: The SVG document, or ``None`` when the figure has no line data.
+    """
+    traces = _visible_traces(figure)
+    if not traces:
+        return None
+    n_out = max(MIN_TRACE_POINTS, PREVIEW_POINT_BUDGET // len(traces))
+    # Secondary axes only exist on the layout once a chart defines them.
+    axis_types = {
+        axis: getattr(getattr(figure.layout, f"{axis}axis", None), "type", None)
+        for axis in ("y", "y2")
+    }
+
+    colorway = _colorway(figure)
+    series = []
+    for index, trace in traces:
+        axis = "y2" if trace.yaxis == "y2" else "y"
+        points = _trace_points(trace, axis_types[axis] == "log", n_out)
+        if points is not None:
+            # Traces without a colour of their own take the template colour by position.
+            color = trace.line.color or colorway[index % len(colorway)]
+            series.append((axis, trace, color, *points))
+    if not series:
+        return None
+
+    x_low = min(x[0] for *_, x, _ in series)
+    x_high = max(x[-1] for *_, x, _ in series)
+    y_bounds = {}
+    for axis, *_, y in series:
+        low, high = y_bounds.get(axis, (np.inf, -np.inf))
+        y_bounds[axis] = (min(low, y.min()), max(high, y.max()))
+
+    pad = 2.0
+    polylines = []
+    for axis, trace, color, x, y in series:
+        y_low, y_high = y_bounds[axis]
+        px = pad + (x - x_low) / ((x_high - x_low) or 1.0) * (width - 2 * pad)
+        py = height - pad - (y - y_low) / ((y_high - y_low) or 1.0) * (height - 2 * pad)
+        coordinates = " ".join(f"{a:.1f},{b:.1f}" for a, b in zip(px, py))
+        opacity = "" if trace.opacity in (None, 1) else f' stroke-opacity="{trace.opacity:g}"'
+        polylines.append(
+            f'<polyline points="{coordinates}" stroke="{color}"{opacity} '
+            'vector-effect="non-scaling-stroke"/>'
+        )
+
+    return (
+        f'<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 {width} {height}" '
+        f'width="{width}" height="{height}" preserveAspectRatio="none">'
+        '<g fill="none" stroke-width="1.5" stroke-linejoin="round" stroke-linecap="round">'
+        f'{"".join(polylines)}</g></svg>\n'
+    )
+
+
+def save_chart_preview(figure, filename, directory=PREVIEW_DIRECTORY):
+    """Write ``<directory>/<filename>.svg`` and return its path, or ``None`` if empty."""
+    svg = figure_preview_svg(figure)
+    if svg is None:
+        return None
+    os.makedirs(directory, exist_ok=True)
+    preview_path = os.path.join(directory, f"{filename}.svg")
+    with open(preview_path, "w", encoding="utf-8") as handle:
+        handle.write(svg)
+    return preview_path
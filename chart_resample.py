@@ -0,0 +1,99 @@
+"""
+Series downsampling for interactive chart serving.
+
+Long-history metrics carry one point per day since 2009, far more than a chart
+a few hundred pixels wide can show. These helpers reduce an ``(x, y)`` series
+to a fixed point budget while keeping its visual shape, so a coarse overview can
+be sent first and a window re-queried at full resolution when the reader zooms.
+"""
+
+import numpy as np
+
+
+def _as_numeric(x):
+    """Return x as float64 for area computations (datetimes become nanoseconds)."""
+    if np.issubdtype(x.dtype, np.datetime64):
+        return x.astype("datetime64[ns]").astype(np.int64).astype(np.float64)
+    return x.astype(np.float64)
+
+
+def lttb(x, y, n_out):
+    """
+    Downsample with Largest-Triangle-Three-Buckets.
+
+    Non-finite ``y`` values are dropped before bucketing. The first and last
+    points are always kept.
+
+    Parameters:
+    x (np.ndarray): Sorted x values (numeric or datetime64).
+    y (np.ndarray): Values aligned with ``x``.
+    n_out (int): Maximum number of points to return.
+
+    Returns:
+    tuple[np.ndarray, np.ndarray]: The selected ``x`` and ``y`` points.
+    """
+    finite = np.isfinite(y)
+    x, y = x[finite], y[finite]
+    if n_out < 3 or len(x) <= n_out:
+        return x, y
+
+    x_num = _as_numeric(x)
+    edges = np.linspace(1, len(x) - 1, n_out - 1).astype(np.int64)
+    selected = np.empty(n_out, dtype=np.int64)
+    selected[0] = 0
+    selected[-1] = len(x) - 1
+
+    previous = 0
+    for bucket in range(n_out - 2):
+        start, stop = edges[bucket], edges[bucket + 1]
+        next_stop = edges[bucket + 2] if bucket + 2 < len(edges) else len(x)
+        next_start = stop
+        average_x = x_num[next_start:next_stop].mean()
+        average_y = y[next_start:next_stop].mean()
+        areas = np.abs(
+            (x_num[previous] - average_x) * (y[start:stop] - y[previous])
+            - (x_num[previous] - x_num[start:stop]) * (average_y - y[previous])
+        )
+        previous = start + int(np.argmax(areas))
+        selected[bucket + 1] = previous
+
+    return x[selected], y[selected]
+
+
+def min_max(x, y, n_out):
+    """
+    Downsample by keeping each bucket's minimum and maximum point.
+
+    Spikes are always preserved, which suits volatile metrics. Buckets that
+    contain only missing values are skipped, leaving a gap in the line.
+
+    Returns:
+    tuple[np.ndarray, np.ndarray]: At most ``n_out`` points in x order.
+    """
+    if n_out < 2 or len(x) <= n_out:
+        return x, y
+
+    buckets = np.array_split(np.arange(len(x)), n_out // 2)
+    selected = []
+    for bucket in buckets:
+        values = y[bucket]
+        if not np.isfinite(values).any():
+            continue
+        low = bucket[np.nanargmin(values)]
+        high = bucket[np.nanargmax(values)]
+        selected.extend(sorted({low, high}))
+    selected = np.asarray(selected, dtype=np.int64)
+    return x[selected], y[selected]
+
+
+RESAMPLERS = {"lttb": lttb, "minmax": min_max}
+
+
+def window(x, start=None, end=None):
+    """Return the slice of sorted ``x`` covering ``[start, end]``, padded by one point.
+
+    The padding keeps the line continuous up to the plot edges.
+    """
+    lower = 0 if start is None else max(int(np.searchsorted(x, start, "left")) - 1, 0)
+    upper = len(x) if end is None else min(int(np.searchsorted(x, end, "right")) + 1, len(x))
+    return slice(lower, upper)
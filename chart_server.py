@@ -0,0 +1,269 @@
+"""
+Local preview server for the static chart catalog.
+
+``python -m http.server`` is single-threaded, never compresses, and ignores the
+cache headers in ``Charts/vercel.json``, so pages behave differently locally
+than on the deployed site. This server mirrors production closely enough for
+performance testing:
+
+    python chart_server.py            # http://127.0.0.1:8765/
+
+- ``Charts/`` is served at the site root, with a thread per request.
+- ``<file>.br`` or ``<file>.gz`` is sent instead of ``<file>`` when it exists
+  and the client accepts that encoding.
+- Headers declared in ``vercel.json`` are applied to matching paths; other
+  files get Vercel's default ``Cache-Control``.
+- ``ETag``/``Last-Modified`` conditional requests answer ``304`` and single
+  ``Range`` requests answer ``206``.
+- Every request is logged with its status, bytes sent, and latency.
+
+Only the standard library is used.
+"""
+
+import argparse
+import email.utils
+import json
+import os
+import re
+import time
+from functools import partial
+from http import HTTPStatus
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import unquote, urlsplit
+
+DEFAULT_DIRECTORY = "Charts"
+DEFAULT_PORT = 8765
+# Vercel's Cache-Control for static files without a configured header.
+DEFAULT_CACHE_CONTROL = "public, max-age=0, must-revalidate"
+# Preferred first when a client accepts several.
+PRECOMPRESSED = (("br", ".br"), ("gzip", ".gz"))
+RANGE_PATTERN = re.compile(r"bytes=(\d*)-(\d*)")
+
+
+def _source_pattern(source):
+    """Compile a vercel.json ``source`` (``/:name.html``, ``/assets/(.*)``) to a regex."""
+    pattern = []
+    for token in re.split(r"(:\w+\*?|\(\.\*\))", source):
+        if token == "(.*)" or (token.startswith(":") and token.endswith("*")):
+            pattern.append(".*")
+        elif token.startswith(":"):
+            pattern.append("[^/]+?")
+        else:
+            pattern.append(re.escape(token))
+    return re.compile("".join(pattern) + r"\Z")
+
+
+def load_header_rules(directory=DEFAULT_DIRECTORY):
+    """Return ``[(regex, [(key, value), ...]), ...]`` from ``<directory>/vercel.json``."""
+    config_path = os.path.join(directory, "vercel.json")
+    if not os.path.isfile(config_path):
+        return []
+    with open(config_path, encoding="utf-8") as handle:
+        config = json.load(handle)
+    return [
+        (
+            _source_pattern(rule["source"]),
+            [(header["key"], header["value"]) for header in rule.get("headers", [])],
+        )
+        for rule in config.get("headers", [])
+    ]
+
+
+def matching_headers(rules, path):
+    """Return the headers every matching rule sets for a URL path, later rules winning."""
+    headers = {}
+    for pattern, rule_headers in rules:
+        if pattern.match(path):
+            headers.update((key.lower(), (key, value)) for key, value in rule_headers)
+    return list(headers.values())
+
+
+def parse_range(header, size):
+    """
+    Resolve a single ``Range: bytes=...`` header against a body size.
+
+    Returns:
+    tuple[int, int] | None | bool: Inclusive ``(start, end)``; ``None`` when
+    the header is absent, malformed or multi-range (serve the whole body); or
+    ``False`` when the range cannot be satisfied.
+    """
+    match = RANGE_PATTERN.fullmatch((header or "").strip())
+    if not match or match.group(1) == match.group(2) == "":
+        return None
+    first, last = match.groups()
+    if first == "":
+        length = int(last)
+        if length == 0:
+            return False
+        return max(size - length, 0), size - 1
+    start = int(first)
+    end = min(int(last), size - 1) if last else size - 1
+    if start >= size or end < start:
+        return False
+    return start, end
+
+
+class ChartRequestHandler(SimpleHTTPRequestHandler):
+    """Static handler with precompressed variants, vercel.json headers and ranges."""
+
+    protocol_version = "HTTP/1.1"
+    header_rules = []
+
+    def do_GET(self):
+        self._serve(head=False)
+
+    def do_HEAD(self):
+        self._serve(head=True)
+
+    def log_request(self, code="-", size="-"):
+        # Logged by _serve with bytes and latency instead.
+        pass
+
+    def _serve(self, head):
+        started = time.perf_counter()
+        self._sent = 0
+        status = self._respond(head)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        self.log_message(
+            '"%s" %d %d bytes %.1f ms', self.requestline, status, self._sent, elapsed_ms
+        )
+
+    def _resolve(self):
+        """Return ``(url_path, file_path)`` for the request, mapping directories to index.html."""
+        url_path = unquote(urlsplit(self.path).path)
+        file_path = self.translate_path(self.path)
+        if os.path.isdir(file_path):
+            file_path = os.path.join(file_path, "index.html")
+        return url_path, file_path
+
+    def _variant(self, file_path):
+        accepted = {
+            token.split(";")[0].strip().lower()
+            for token in self.headers.get("Accept-Encoding", "").split(",")
+        }
+        for encoding, suffix in PRECOMPRESSED:
+            if encoding in accepted and os.path.isfile(file_path + suffix):
+                return file_path + suffix, encoding
+        return file_path, None
+
+    def _not_modified(self, etag, modified):
+        if_none_match = self.headers.get("If-None-Match")
+        if if_none_match is not None:
+            tags = {tag.strip() for tag in if_none_match.split(",")}
+            return "*" in tags or etag in tags or f"W/{etag}" in tags
+        if_modified_since = self.headers.get("If-Modified-Since")
+        if if_modified_since:
+            try:
+                since = email.utils.parsedate_to_datetime(if_modified_since).timestamp()
+            except (TypeError, ValueError):
+                return False
+            return int(modified) <= since
+        return False
+
+    def _respond(self, head):
+        url_path, file_path = self._resolve()
+        if not os.path.isfile(file_path):
+            self.send_error(HTTPStatus.NOT_FOUND, "File not found")
+            return HTTPStatus.NOT_FOUND
+
+        body_path, encoding = self._variant(file_path)
+        stat = os.stat(body_path)
+        size = stat.st_size
+        etag = f'"{stat.st_mtime_ns:x}-{size:x}{"-" + encoding if encoding else ""}"'
+        last_modified = email.utils.formatdate(stat.st_mtime, usegmt=True)
+
+        def send_common_headers():
+            self.send_header("ETag", etag)
+            self.send_header("Last-Modified", last_modified)
+            self.send_header("Accept-Ranges", "bytes")
+            self.send_header("Vary", "Accept-Encoding")
+            configured = matching_headers(self.header_rules, url_path)
+            if not any(key.lower() == "cache-control" for key, _ in configured):
+                self.send_header("Cache-Control", DEFAULT_CACHE_CONTROL)
+            for key, value in configured:
+                self.send_header(key, value)
+
+        if self._not_modified(etag, stat.st_mtime):
+            self.send_response(HTTPStatus.NOT_MODIFIED)
+            send_common_headers()
+            self.end_headers()
+            return HTTPStatus.NOT_MODIFIED
+
+        byte_range = None
+        if_range = self.headers.get("If-Range")
+        if if_range is None or if_range.strip() in (etag, last_modified):
+            byte_range = parse_range(self.headers.get("Range"), size)
+        if byte_range is False:
+            self.send_response(HTTPStatus.REQUESTED_RANGE_NOT_SATISFIABLE)
+            self.send_header("Content-Range", f"bytes */{size}")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return HTTPStatus.REQUESTED_RANGE_NOT_SATISFIABLE
+
+        start, end = byte_range or (0, size - 1)
+        length = max(end - start + 1, 0)
+        status = HTTPStatus.PARTIAL_CONTENT if byte_range else HTTPStatus.OK
+        self.send_response(status)
+        self.send_header("Content-Type", self.guess_type(file_path))
+        self.send_header("Content-Length", str(length))
+        if encoding:
+            self.send_header("Content-Encoding", encoding)
+        if byte_range:
+            self.send_header("Content-Range", f"bytes {start}-{end}/{size}")
+        send_common_headers()
+        self.end_headers()
+
+        if not head and length:
+            with open(body_path, "rb") as handle:
+                handle.seek(start)
+                self._copy(handle, length)
+        return status
+
+    def _copy(self, handle, length):
+        remaining = length
+        while remaining:
+            block = handle.read(min(remaining, 64 * 1024))
+            if not block:
+                break
+            self.wfile.write(block)
+            self._sent += len(block)
+            remaining -= len(block)
+
+
+def create_server(directory=DEFAULT_DIRECTORY, host="127.0.0.1", port=DEFAULT_PORT):
+    """Return a threaded HTTP server for ``directory`` with its vercel.json rules loaded."""
+    handler = type(
+        "ConfiguredChartRequestHandler",
+        (ChartRequestHandler,),
+        {"header_rules": load_header_rules(directory)},
+    )
+    server = ThreadingHTTPServer((host, port), partial(handler, directory=directory))
+    server.daemon_threads = True
+    return server
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Preview the static chart catalog with production-like caching."
+    )
+    parser.add_argument("--directory", default=DEFAULT_DIRECTORY)
+    parser.add_argument("--bind", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    server = create_server(args.directory, args.bind, args.port)
+    host, port = server.server_address[:2]
+    print(f"Serving {args.directory}/ at http://{host}:{port}/")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,206 @@
+"""
+Master format converter for Bitcoin Chart Library.
+
+Writes ``master_metrics_data.csv.gz`` in the formats ``load_master_frame``
+prefers over the CSV.
+
+By default it splits the CSV into a ``MASTER_SHARD_DIR`` directory holding one
+gzip-compressed ``.npy`` file per metric, an index shard with the dates, and a
+``manifest.json`` with each shard's row range and SHA-256 hash, and the size,
+modification time and fingerprint of the CSV they were written from. A run
+then fetches and decodes only the shards its charts plot, and skips any whose
+hash it has already cached. Once the CSV changes, runs read it instead until
+the shards are rewritten.
+
+``--format parquet`` or ``--format arrow`` instead writes a columnar sibling
+(``MASTER_COLUMNAR``), read with column projection and no text parsing. Its
+schema metadata records the same details of the CSV.
+These need the optional pyarrow package:
+
+    python chart_shards.py                      # next to a local master file
+    python chart_shards.py --output DIR         # anywhere, e.g. for publishing
+    uv run --no-sync --with pyarrow python chart_shards.py --format parquet
+
+Report Library can publish the same files beside its CSVs. Shards are
+written deterministically, so a metric whose values did not change keeps its
+hash and cached copies stay valid.
+"""
+
+import argparse
+import gzip
+import hashlib
+import io
+import json
+import os
+import re
+
+import numpy as np
+
+from chart_data import (
+    COLUMNAR_SOURCE_KEY,
+    MASTER_COLUMNAR,
+    MASTER_CSV,
+    SHARD_MANIFEST,
+    load_master_metrics,
+    source_record,
+)
+from chart_definitions import MASTER_SHARD_DIR, csv_path, csv_source_is_remote
+
+INDEX_SHARD = "index.npy.gz"
+MANIFEST_VERSION = 1
+FORMATS = ("shards", "parquet", "arrow")
+
+
+def _shard_name(metric, taken):
+    """Return a file name for ``metric`` that is safe on every filesystem and unique."""
+    base = re.sub(r"[^A-Za-z0-9_.-]", "_", metric) or "metric"
+    name, suffix = base, 1
+    while f"{name}.npy.gz".lower() in taken:
+        suffix += 1
+        name = f"{base}_{suffix}"
+    taken.add(f"{name}.npy.gz".lower())
+    return f"{name}.npy.gz"
+
+
+def _write_shard(directory, name, values):
+    """Write one compressed shard and return its SHA-256."""
+    buffer = io.BytesIO()
+    np.save(buffer, values, allow_pickle=False)
+    # A fixed mtime keeps the bytes, and so the hash, stable for unchanged values.
+    payload = gzip.compress(buffer.getvalue(), mtime=0)
+    with open(os.path.join(directory, name), "wb") as handle:
+        handle.write(payload)
+    return hashlib.sha256(payload).hexdigest()
+
+
+def write_master_shards(frame, directory, source=None):
+    """
+    Write ``frame`` as a sharded master directory.
+
+    Float metrics are stored without their leading and trailing NaN runs.
+    Columns that are not numeric are left out, as charts only plot numbers.
+    The manifest is written last, so readers never see it list a missing shard.
+
+    Parameters:
+    frame (pd.DataFrame): Master metrics indexed by date.
+    directory (str): Output directory, created if needed.
+    source (dict | None): ``source_record()`` of the CSV ``frame`` was read
+        from. Readers skip the shards once the CSV no longer matches it.
+
+    Returns:
+    dict: The manifest written to ``directory``.
+    """
+    os.makedirs(directory, exist_ok=True)
+    taken = {INDEX_SHARD, SHARD_MANIFEST}
+    index = {
+        "name": frame.index.name,
+        "file": INDEX_SHARD,
+        "sha256": _write_shard(directory, INDEX_SHARD, frame.index.to_numpy()),
+    }
+    shards = {}
+    for metric in frame.columns:
+        values = frame[metric].to_numpy()
+        if values.dtype.kind not in "biuf":
+            continue
+        start, stop = 0, len(values)
+        if values.dtype.kind == "f":
+            observed = np.flatnonzero(~np.isnan(values))
+            start, stop = (observed[0], observed[-1] + 1) if len(observed) else (0, 0)
+        name = _shard_name(metric, taken)
+        shards[metric] = {
+            "file": name,
+            "sha256": _write_shard(directory, name, values[start:stop]),
+            "rows": [int(start), int(stop)],
+        }
+
+    manifest = {
+        "version": MANIFEST_VERSION,
+        "source": source,
+        "rows": len(frame),
+        "columns": list(shards),
+        "index": index,
+        "shards": shards,
+    }
+    partial_path = os.path.join(directory, f"{SHARD_MANIFEST}.tmp")
+    with open(partial_path, "w") as handle:
+        json.dump(manifest, handle, indent=1)
+    os.replace(partial_path, os.path.join(directory, SHARD_MANIFEST))
+    return manifest
+
+
+def write_columnar_master(frame, path, source=None):
+    """
+    Write ``frame`` as a Parquet or Arrow IPC copy of the master CSV.
+
+    The date index becomes the first column, as in the CSV. Arrow files are
+    left uncompressed so readers can use them in place from a memory map.
+
+    Parameters:
+    frame (pd.DataFrame): Master metrics indexed by date.
+    path (str): Output path ending in ``.parquet`` or ``.arrow``.
+    source (dict | None): ``source_record()`` of the CSV ``frame`` was read
+        from, stored as JSON in the schema metadata under ``COLUMNAR_SOURCE_KEY``.
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as error:
+        raise ImportError(
+            "Columnar output requires pyarrow: "
+            "uv run --no-sync --with pyarrow python chart_shards.py --format parquet"
+        ) from error
+
+    table = pa.Table.from_pandas(frame, preserve_index=True)
+    metadata = None if source is None else {COLUMNAR_SOURCE_KEY: json.dumps(source).encode()}
+    table = table.select([frame.index.name, *frame.columns]).replace_schema_metadata(metadata)
+    partial_path = f"{path}.tmp"
+    if path.endswith(".parquet"):
+        pq.write_table(table, partial_path)
+    else:
+        with pa.ipc.new_file(partial_path, table.schema) as writer:
+            writer.write_table(table)
+    os.replace(partial_path, path)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        description=f"Write {MASTER_CSV} as per-metric shards or a columnar file."
+    )
+    parser.add_argument("--format", choices=FORMATS, default="shards")
+    parser.add_argument(
+        "--output",
+        help=(
+            f"Shard directory or columnar file to write. Defaults to {MASTER_SHARD_DIR}/ "
+            "or the columnar sibling beside a local master file; required when the "
+            "source is a URL."
+        ),
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    columnar = {filename.rpartition(".")[2]: filename for filename in MASTER_COLUMNAR}
+    output = args.output
+    if output is None:
+        if csv_source_is_remote():
+            raise SystemExit("--output is required when REPORT_CSV_DIR is a URL.")
+        output = csv_path(columnar.get(args.format, MASTER_SHARD_DIR))
+
+    # Taken first, so a CSV replaced while it is read makes the output stale, not wrong.
+    source = source_record()
+    frame = load_master_metrics()
+    if args.format != "shards":
+        write_columnar_master(frame, output, source)
+        print(f"Wrote {len(frame)} rows x {len(frame.columns)} metrics to {output}")
+        return
+    manifest = write_master_shards(frame, output, source)
+    skipped = len(frame.columns) - len(manifest["columns"])
+    print(
+        f"Wrote {len(manifest['columns'])} metric shards for {manifest['rows']} rows "
+        f"to {output}" + (f" ({skipped} non-numeric columns skipped)" if skipped else "")
+    )
+
+
+if __name__ == "__main__":
+    main()
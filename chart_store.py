@@ -0,0 +1,183 @@
+"""
+Optional SQLite metric store for Bitcoin Chart Library.
+
+By default ``main.py`` holds the whole master frame in memory while every
+chart renders. With ``--metric-store`` the master CSV is ingested once into a
+local SQLite database (standard library, no server) and each chart queries
+only the metrics and date range it plots, so memory stays flat as the number
+of published metrics grows.
+
+Layout: one narrow ``WITHOUT ROWID`` table per metric keyed by day, holding
+only observed values, plus a ``dates`` table with the master index so queries
+return the same rows as slicing the frame would. The day key is the primary
+key, so ``filter_start_date``/``filter_end_date`` ranges are index seeks.
+"""
+
+import json
+import os
+import sqlite3
+from contextlib import closing
+
+import numpy as np
+import pandas as pd
+
+STORE_PATH = os.path.join("build", "metrics.sqlite")
+_EPOCH_DAY = np.datetime64("1970-01-01", "D")
+
+
+def _days(index):
+    """Return a DatetimeIndex as integer days since the epoch."""
+    return (pd.DatetimeIndex(index).values.astype("datetime64[D]") - _EPOCH_DAY).astype(np.int64)
+
+
+def _day(value, default):
+    if value is None:
+        return default
+    return int(_days([pd.Timestamp(value)])[0])
+
+
+class MetricStore:
+    """
+    Date-indexed metric tables in a SQLite file.
+
+    ``select`` returns the same frame as projecting and date-slicing the master
+    frame, so chart functions accept a store wherever they accept a frame.
+    """
+
+    def __init__(self, path=STORE_PATH):
+        self.path = str(path)
+        self._columns = None
+        self._index = None
+
+    def _connect(self, path=None):
+        # A connection per call keeps the store usable from worker threads.
+        return closing(sqlite3.connect(path or self.path))
+
+    def exists(self):
+        return os.path.isfile(self.path)
+
+    def _meta(self, key):
+        if not self.exists():
+            return None
+        with self._connect() as db:
+            row = db.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return None if row is None else json.loads(row[0])
+
+    @property
+    def columns(self):
+        """Stored metric names, in master column order."""
+        if self._columns is None:
+            with self._connect() as db:
+                self._columns = [
+                    name for (name,) in db.execute("SELECT name FROM metrics ORDER BY position")
+                ]
+        return self._columns
+
+    def is_current(self, signature):
+        """Return whether the store was ingested from a source with this signature."""
+        return self._meta("signature") == json.loads(json.dumps(signature))
+
+    def last_date(self):
+        with self._connect() as db:
+            (day,) = db.execute("SELECT MAX(day) FROM dates").fetchone()
+        return None if day is None else pd.Timestamp(_EPOCH_DAY + np.timedelta64(day, "D"))
+
+    def ingest(self, frame, signature=None):
+        """
+        Replace the store's contents with a master frame.
+
+        The database is written to a temporary file and moved into place, so a
+        reader never sees a partial ingest. Object columns left by failed type
+        inference are parsed as numbers, with unparseable cells stored as missing.
+
+        Parameters:
+        frame (pd.DataFrame): Master metrics with a daily ``DatetimeIndex``.
+        signature: JSON-serializable fingerprint of the source (see
+            ``chart_data.source_signature``) checked by ``is_current``.
+        """
+        index = pd.DatetimeIndex(frame.index)
+        if not (index == index.normalize()).all():
+            raise ValueError("The metric store holds daily data; the index has intraday times.")
+        days = _days(index)
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        staging = f"{self.path}.tmp"
+        if os.path.exists(staging):
+            os.remove(staging)
+        with self._connect(staging) as db, db:
+            db.execute("CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT)")
+            db.execute(
+                "CREATE TABLE metrics (name TEXT PRIMARY KEY, position INTEGER, tbl TEXT)"
+            )
+            db.execute("CREATE TABLE dates (day INTEGER PRIMARY KEY) WITHOUT ROWID")
+            db.executemany("INSERT INTO dates VALUES (?)", ((int(day),) for day in days))
+            for position, name in enumerate(frame.columns):
+                table = f"metric_{position}"
+                db.execute(
+                    f"CREATE TABLE {table} (day INTEGER PRIMARY KEY, value REAL) WITHOUT ROWID"
+                )
+                values = frame[name]
+                if values.dtype == object:
+                    # Parsed as numbers, as compact_master_frame does for in-memory runs;
+                    # SQLite would otherwise keep unparseable cells as text.
+                    values = pd.to_numeric(values, errors="coerce")
+                observed = values.notna().to_numpy()
+                db.executemany(
+                    f"INSERT INTO {table} VALUES (?, ?)",
+                    zip(days[observed].tolist(), values[observed].tolist()),
+                )
+                db.execute("INSERT INTO metrics VALUES (?, ?, ?)", (name, position, table))
+            db.executemany(
+                "INSERT INTO meta VALUES (?, ?)",
+                [
+                    ("signature", json.dumps(signature)),
+                    ("index_name", json.dumps(frame.index.name)),
+                    ("index_dtype", json.dumps(str(index.dtype))),
+                ],
+            )
+        os.replace(staging, self.path)
+        self._columns = self._index = None
+
+    def select(self, columns, start=None, end=None):
+        """
+        Return the stored metrics in ``columns`` between two dates, inclusive.
+
+        Metrics the store does not hold are left out, as ``load_master_metrics``
+        leaves out unpublished ones. Only the requested tables and range are
+        read.
+        """
+        low = _day(start, np.iinfo(np.int64).min)
+        high = _day(end, np.iinfo(np.int64).max)
+        wanted = set(columns)
+        with self._connect() as db:
+            tables = [
+                (name, table)
+                for name, table in db.execute("SELECT name, tbl FROM metrics ORDER BY position")
+                if name in wanted
+            ]
+            days = np.fromiter(
+                (
+                    day
+                    for (day,) in db.execute(
+                        "SELECT day FROM dates WHERE day BETWEEN ? AND ? ORDER BY day", (low, high)
+                    )
+                ),
+                dtype=np.int64,
+            )
+            data = {}
+            for name, table in tables:
+                rows = db.execute(
+                    f"SELECT day, value FROM {table} WHERE day BETWEEN ? AND ? ORDER BY day",
+                    (low, high),
+                ).fetchall()
+                values = np.full(len(days), np.nan)
+                if rows:
+                    observed_days, observed = zip(*rows)
+                    values[np.searchsorted(days, observed_days)] = observed
+                data[name] = values
+        if self._index is None:
+            self._index = self._meta("index_dtype"), self._meta("index_name")
+        dtype, index_name = self._index
+        index = pd.DatetimeIndex(
+            (_EPOCH_DAY + days.astype("timedelta64[D]")).astype(dtype), name=index_name
+        )
+        return pd.DataFrame(data, index=index, columns=[name for name, _ in tables])
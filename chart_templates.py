@@ -0,0 +1,1684 @@
+"""
+Chart template registry for Bitcoin Chart Library.
+
+Templates are plain dictionaries describing what each chart plots. This module
+only uses the standard library, so the catalog step, tests, and tooling that
+need template metadata can import it without loading pandas or Plotly. Rendering
+lives in ``chart_format``.
+"""
+
+import datetime
+import functools
+
+# Bitcoin historical events for chart annotations
+BITCOIN_HISTORICAL_EVENTS = [
+    {
+        "name": "Halving",
+        "dates": ["2012-11-28", "2016-07-09", "2020-05-11", "2024-04-20"],
+        "orientation": "v",
+    },
+    {"name": "MtGox Launch", "dates": ["2010-07-01"], "orientation": "v"},
+    {"name": "MtGox Hack", "dates": ["2011-06-11"], "orientation": "v"},
+    {"name": "MtGox Bankrupt", "dates": ["2014-02-01"], "orientation": "v"},
+    {"name": "BitLicense", "dates": ["2015-08-08"], "orientation": "v"},
+    {"name": "CME Futures", "dates": ["2017-12-17"], "orientation": "v"},
+    {"name": "Bitcoin Winter", "dates": ["2018-12-15"], "orientation": "v"},
+    {"name": "Coinbase IPO", "dates": ["2021-04-14"], "orientation": "v"},
+    {"name": "FTX Bankrupt", "dates": ["2022-11-11"], "orientation": "v"},
+    {"name": "Spot ETF Launch", "dates": ["2024-01-11"], "orientation": "v"},
+    {
+        "name": "U.S. Strategic Bitcoin Reserve",
+        "dates": ["2025-03-06"],
+        "orientation": "v",
+    },
+    {
+        "name": "Strategy Sells Bitcoin",
+        "dates": ["2026-06-29"],
+        "orientation": "v",
+    },
+]
+
+# Events with only halvings (for supply-focused charts)
+HALVING_EVENTS = [
+    {
+        "name": "Halving",
+        "dates": ["2012-11-28", "2016-07-09", "2020-05-11", "2024-04-20"],
+        "orientation": "v",
+    },
+]
+
+# Supply Chart
+chart_supply = {
+    "x_data": "time",
+    "y_data": [
+        {"name": "Bitcoin Supply", "data": "supply", "yaxis": "y"},
+        {
+            "name": "New Coins Issued 30 Day MA",
+            "data": "30_day_ma_subsidy_sum_24h",
+            "yaxis": "y2",
+        },
+        {
+            "name": "New Coins Issued 365 Day MA",
+            "data": "365_day_ma_subsidy_sum_24h",
+            "yaxis": "y2",
+        },
+    ],
+    "title": "Bitcoin Supply & Daily Issuance",
+    "x_label": "Date",
+    "y1_label": "Bitcoin Supply",
+    "y2_label": "New Bitcoins Created Each Day",
+    "filename": "Bitcoin_Supply",
+    "chart_type": "line",
+    "data_source": "Data Source: Bitview",
+    "events": HALVING_EVENTS,
+}
+
+# Transaction Chart
+chart_transactions = {
+    "x_data": "time",
+    "y_data": [
+        {"name": "Transaction Count", "data": "tx_count_sum_24h", "yaxis": "y"},
+        {
+            "name": "Tx Count 30 Day MA",
+            "data": "30_day_ma_tx_count_sum_24h",
+            "yaxis": "y",
+        },
+        {
+            "name": "Tx Count 365 Day MA",
+            "data": "365_day_ma_tx_count_sum_24h",
+            "yaxis": "y",
+        },
+    ],
+    "title": "Bitcoin Transactions",
+    "x_label": "Date",
+    "y1_label": "Daily Transactions",
+    "y2_label": "",
+    "filename": "Bitcoin_Transactions",
+    "chart_type": "line",
+    "data_source": "Data Source: Bitview",
+    "events": BITCOIN_HISTORICAL_EVENTS,
+}
+
+# Hashrate Chart
+chart_hashrate = {
+    "x_data": "time",
+    "y_data": [
+        {"name": "Hash Rate", "data": "hash_rate", "yaxis": "y"},
+        {"name": "Hash Rate 30 Day MA", "data": "30_day_ma_hash_rate", "yaxis": "y"},
+        {"name": "Hash Rate 365 Day MA", "data": "365_day_ma_hash_rate", "yaxis": "y"},
+    ],
+    "title": "Bitcoin Hashrate",
+    "x_label": "Date",
+    "y1_label": "Network Hashrate",
+    "y2_label": "",
+    "filename": "Bitcoin_Hashrate",
+    "chart_type": "line",
+    "data_source": "Data Source: Bitview",
+    "events": BITCOIN_HISTORICAL_EVENTS,
+}
+
+# Bitcoin Price Chart
+chart_price = {
+    "x_data": "time",
+    "y_data": [
+        {"name": "Bitcoin Price USD", "data": "price_close", "yaxis": "y", "primary": True},
+        {"name": "Bitcoin Marketcap USD", "data": "market_cap", "yaxis": "y2"},
+    ],
+    "title": "Bitcoin Price",
+    "x_label": "Date",
+    "y1_label": "Bitcoin Price (USD)",
+    "y2_label": "Bitcoin Market Cap (USD)",
+    "filename": "Bitcoin_Price",
+    "chart_type": "line",
+    "data_source": "Data Source: Bitview",
+    "filter_start_date": "2010-07-01",
+    "events": BITCOIN_HISTORICAL_EVENTS,
+}
+
+# Transferred Value Chart
+chart_transferred_value = {
+    "x_data": "time",
+    "y1_type": "log",
+    "y2_type": "linear",
+    "y_data": [
+        {"name": "Bitcoin Price", "data": "price_close", "yaxis": "y"},
+        {
+            "name": "Transaction Volume",
+            "data": "transfer_volume_sum_24h_usd",
+            "yaxis": "y2",
+        },
+        {
+            "name": "Transaction Volume 30 Day MA",
+            "data": "30_day_ma_transfer_volume_sum_24h_usd",
+            "yaxis": "y2",
+        },
+        {
+            "name": "Transaction Volume 365 Day MA",
+            "data": "365_day_ma_transfer_volume_sum_24h_usd",
+            "yaxis": "y2",
+        },
+    ],
+    "title": "Bitcoin Transaction Volume",
+    "x_label": "Date",
+    "y1_label": "Bitcoin Price",
+    "y2_label": "Transaction Volume",
+    "filename": "Bitcoin_Transaction_Value",
+    "chart_type": "line",
+    "data_source": "Data Source: Bitview",
+    "filter_start_date": "2010-07-01",
+    "events": BITCOIN_HISTORICAL_EVENTS,
+}
+
+# Miner Revenue Chart
+chart_miner_revenue = {
+    "x_data": "time",
+    "y1_type": "log",
+    "y2_type": "linear",
+    "y_data": [
+        {"name": "Bitcoin Price", "data": "price_close", "yaxis": "y"},
+        {"name": "Miner Revenue", "data": "coinbase_sum_24h_usd", "yaxis": "y2"},
+        {
+            "name": "Miner Revenue 30 Day MA",
+            "data": "30_day_ma_coinbase_sum_24h_usd",
+            "yaxis": "y2",
+        },
+        {
+            "name": "Miner Revenue 365 Day MA",
+            "data": "365_day_ma_coinbase_sum_24h_usd",
+            "yaxis": "y2",
+        },
+    ],
+    "title": "Bitcoin Miner Revenue",
+    "x_label": "Date",
+    "y1_label": "Bitcoin Price",
+    "y2_label": "Miner Revenue",
+    "filename": "Bitcoin_Miner_Revenue",
+    "chart_type": "line",
+    "data_source": "Data Source: Bitview",
+    "filter_start_date": "2010-07-01",
+    "events": BITCOIN_HISTORICAL_EVENTS,
+}
+
+# Active Addresses Chart
+chart_active_addresses = {
+    "x_data": "time",
+    "y_data": [
+        {"name": "Bitcoin Price", "data": "price_close", "yaxis": "y"},
+        {"name": "Active Addresses", "data": "daily_active_addresses_sending", "yaxis": "y2"},
+        {
+            "name": "Active Addresses 30 Day MA",
+            "data": "30_day_ma_daily_active_addresses_sending",
+            "yaxis": "y2",
+        },
+        {
+            "name": "Active Addresses 365 Day MA",
+            "data": "365_day_ma_daily_active_addresses_sending",
+            "yaxis": "y2",
+        },
+    ],
+    "title": "Bitcoin Active Addresses",
+    "x_label": "Date",
+    "y1_label": "Bitcoin Price",
+    "y2_label": "Active Addresses",
+    "filename": "Bitcoin_Active_Addresses",
+    "chart_type": "line",
+    "data_source": "Data Source: Bitview",
+    "filter_start_date": "2010-07-01",
+    "events": BITCOIN_HISTORICAL_EVENTS,
+}
+
+# Transaction Fee USD Chart
+chart_transaction_fee_USD = {
+    "x_data": "time",
+    "y_data": [
+        {"name": "Bitcoin Price", "data": "price_close", "yaxis": "y"},
+        {"name": "Fees Paid (USD)", "data": "fees_sum_24h_usd", "yaxis": "y2"},
+    ],
+    "title": "Bitcoin Fees In USD",
+    "x_label": "Date",
+    "y1_label": "Bitcoin Price",
+    "y2_label": "Fees In US Dollars",
+    "filename": "Bitcoin_Transaction_Fee",
+    "chart_type": "line",
+    "data_source": "Data Source: Bitview",
+    "filter_start_date": "2010-07-01",
+    "events": BITCOIN_HISTORICAL_EVENTS,
+}
+
+# Address Balance Count USD Chart
+chart_address_balance = {
+    "x_data": "time",
+    "y_data": [
+        {"name": "Bitcoin Price", "data": "price_close", "yaxis": "y"},
+        {"name": ">1 sat", "data": "addrs_over_1sat_addr_count", "yaxis": "y2"},
+        {"name": ">10 sats", "data": "addrs_over_10sats_addr_count", "yaxis": "y2"},
+        {"name": ">100 sats", "data": "addrs_over_100sats_addr_count", "yaxis": "y2"},
+        {"name": ">1k sats", "data": "addrs_over_1k_sats_addr_count", "yaxis": "y2"},
+        {"name": ">10k sats", "data": "addrs_over_10k_sats_addr_count", "yaxis": "y2"},
+        {"name": ">100k sats", "data": "addrs_over_100k_sats_addr_count", "yaxis": "y2"},
+        {"name": ">1M sats", "data": "addrs_over_1m_sats_addr_count", "yaxis": "y2"},
+        {"name": ">10M sats", "data": "addrs_over_10m_sats_addr_count", "yaxis": "y2"},
+        {"name": ">1 BTC", "data": "addrs_over_1btc_addr_count", "yaxis": "y2"},
+        {"name": ">10 BTC", "data": "addrs_over_10btc_addr_count", "yaxis": "y2"},
+        {"name": ">100 BTC", "data": "addrs_over_100btc_addr_count", "yaxis": "y2"},
+        {"name": ">1k BTC", "data": "addrs_over_1k_btc_addr_count", "yaxis": "y2"},
+        {"name": ">10k BTC", "data": "addrs_over_10k_btc_addr_count", "yaxis": "y2"},
+    ],
+    "title": "Address Counts Above BTC Balance Thresholds",
+    "x_label": "Date",
+    "y1_label": "Bitcoin Price",
+    "y2_label": "Address Count",
+    "filename": "Bitcoin_Address_Balance",
+    "chart_type": "line",
+    "data_source": "Data Source: BRK",
+    "filter_start_date": "2010-07-01",
+    "events": BITCOIN_HISTORICAL_EVENTS,
+}
+
+# 1+ Year Active Supply Chart
+chart_1_year_supply = {
+    "x_data": "time",
+    "y_data": [
+        {"name": "Bitcoin Price", "data": "price_close", "yaxis": "y"},
+        {
+            "name": "1+ Year Active Supply",
+            "data": "supply_pct_1_year_plus",
+            "yaxis": "y2",
+        },
+    ],
+    "title": "Bitcoin 1+ Year Supply",
+    "x_label": "Date",
+    "y1_label": "Bitcoin Price",
+    "y2_label": "1+ Year Supply Percentage",
+    "filename": "Bitcoin_1_Year_Supply",
+    "chart_type": "line",
+    "data_source": "Data Source: Bitview",
+    "events": BITCOIN_HISTORICAL_EVENTS,
+}
+
+# Macro Supply
+macro_supply = {
+    "x_data": "time",
+    "y_data": [
+        {"name": "Bitcoin Price", "data": "price_close", "yaxis": "y"},
+        {"name": "Liquid Supply", "data": "liquid_supply", "yaxis": "y2"},
+        {"name": "Illiquid Supply", "data": "illiquid_supply", "yaxis": "y2"},
+        {"name": "STH Supply", "data": "sth_supply", "yaxis": "y2"},
+        {"name": "LTH Supply", "data": "lth_supply", "yaxis": "y2"},
+       #{"name": "Miner Supply", "data": "SplyMiner0HopAllNtv", "yaxis": "y2"},
+        #{"name": "1 Hop Miner Supply", "data": "SplyMiner1HopAllNtv", "yaxis": "y2"},
+        {"name": "Daily Tx Amount", "data": "tx_count_sum_24h", "yaxis": "y2"},
+        {"name": "Current Supply", "data": "supply", "yaxis": "y2"},
+    ],
+    "title": "Bitcoin Macro Supply",
+    "x_label": "Date",
+    "y1_label": "Bitcoin Price",
+    "y2_label": "Bitcoins Supply",
+    "filename": "Bitcoin_Macro_Supply",
+    "chart_type": "line",
+    "data_source": "Data Source: Bitview",
+    "events": BITCOIN_HISTORICAL_EVENTS,
+}
+
+# Thermocap Price Multiple Chart
+chart_thermocap_multiple = {
+    "x_data": "time",
+    "y_data": [
+        {"name": "Bitcoin Price", "data": "price_close", "yaxis": "y"},
+        {"name": "Thermocap Price", "data": "thermocap_price", "yaxis": "y"},
+        {
+            "name": "4x Thermocap Price Multiple",
+            "data": "thermocap_price_multiple_4",
+            "yaxis": "y",
+        },
+        {
+            "name": "8x Thermocap Price Multiple",
+            "data": "thermocap_price_multiple_8",
+            "yaxis": "y",
+        },
+        {
+            "name": "16x Thermocap Price Multiple",
+            "data": "thermocap_price_multiple_16",
+            "yaxis": "y",
+        },
+        {
+            "name": "32x Thermocap Price Multiple",
+            "data": "thermocap_price_multiple_32",
+            "yaxis": "y",
+        },
+    ],
+    "title": "Bitcoin Thermocap Multiple",
+    "x_label": "Date",
+    "y1_label": "Bitcoin Price",
+    "y2_label": "",
+    "filename": "Bitcoin_Thermocap_Multiples",
+    "chart_type": "line",
+    "filter_metric": "thermocap_multiple",
+    "data_source": "Data Source: Bitview",
+    "filter_start_date": "2010-07-01",
+    "events": BITCOIN_HISTORICAL_EVENTS,
+}
+
+# Realized Price Multiple Chart
+chart_realizedcap_multiple = {
+    "x_data": "time",
+    "y1_type": "log",
+    "y2_type": "log",
+    "y_data": [
+        {"name": "Bitcoin Price", "data": "price_close", "yaxis": "y"},
+        {"name": "Realized Price", "data": "realized_price", "yaxis": "y"},
+        {"name": "STH Realized Price", "data": "sth_realized_price", "yaxis": "y"},
+        {"name": "LTH Realized Price", "data": "lth_realized_price", "yaxis": "y"},
+        {"name": "2x Realized Price", "data": "realizedcap_multiple_2", "yaxis": "y"},
+        {"name": "3x Realized Price", "data": "realizedcap_multiple_3", "yaxis": "y"},
+        {"name": "5x Realized Price", "data": "realizedcap_multiple_5", "yaxis": "y"},
+        {"name": "Realized Price Multiple ", "data": "CapMVRVCur", "yaxis": "y2"},
+    ],
+    "title": "Bitcoin Realized Price",
+    "x_label": "Date",
+    "y1_label": "Bitcoin Price",
+    "y2_label": "MVRV Ratio",
+    "filename": "Bitcoin_Realized_Price",
+    "chart_type": "line",
+    #"filter_metric": "CapMVRVCur",
+    "data_source": "Data Source: Bitview",
+    "filter_start_date": "2011-01-01",
+    "events": BITCOIN_HISTORICAL_EVENTS,
+}
+
+# NVT Price  Chart
+chart_nvt_price = {
+    "x_data": "time",
+    "y_data": [
+        {"name": "Bitcoin Price", "data": "price_close", "yaxis": "y"},
+        {"name": "NVT Price 30 Day MA", "data": "30_day_ma_nvt_price", "yaxis": "y"},
+        {"name": "NVT Price 365 Day MA", "data": "365_day_ma_nvt_price", "yaxis": "y"},
+        # {
+        #  "name": "NVT Ratio 2 Year Median",
+        # "data": "nvt_price_multiple_ma",
+        # "yaxis": "y2",
+        # },
+    ],
+    "title": "Bitcoin NVT Price",
+    "x_label": "Date",
+    "y1_label": "Bitcoin Price",
+    "y2_label": "",
+    "filename": "Bitcoin_NVT_Price",
+    "chart_type": "line",
+    "data_source": "Data Source: Bitview",
+    "filter_start_date": "2010-07-01",
+    "events": BITCOIN_HISTORICAL_EVENTS,
+}
+
+# Electricity Price Chart
+electricity_price = {
+    "x_data": "time",
+    "y2_type": "linear",
+    "y_data": [
+        {"name": "Bitcoin Price", "data": "price_close", "yaxis": "y"},
+        {
+            "name": "Power Expense ($0.05/kWh)",
+            "data": "Electricity_Cost",
+            "yaxis": "y",
+        },
+        {
+            "name": "Hayes Network Price Per BTC",
+            "data": "Hayes_Network_Price_Per_BTC",
+            "yaxis": "y",
+        },
+        {
+            "name": "Hayes Price Multiple",
+            "data": "Hayes_Network_Price_Multiple",
+            "yaxis": "y2",
+        },
+    ],
+    "title": "Bitcoin Production Price",
+    "x_label": "Date",
+    "y1_label": "Bitcoin Price",
+    "y2_label": "Hayes Price Multiple",
+    "filename": "Bitcoin_Production_Price",
+    "chart_type": "line",
+    "filter_start_date": "2010-07-01",
+    "data_source": "Data Source: Bitview",
+    "events": BITCOIN_HISTORICAL_EVENTS,
+}
+
+# Electricity Tariff Scenarios Chart
+chart_electricity_cost = {
+    "x_data": "time",
+    "y1_type": "log",
+    "y_data": [
+        {"name": "Bitcoin Price", "data": "price_close", "yaxis": "y"},
+        {
+            "name": "Power Expense ($0.03/kWh)",
+            "data": "Electricity_Cost_3c",
+            "yaxis": "y",
+        },
+        {
+            "name": "Power Expense ($0.04/kWh)",
+            "data": "Electricity_Cost_4c",
+            "yaxis": "y",
+        },
+        {
+            "name": "Power Expense ($0.05/kWh)",
+            "data": "Electricity_Cost_5c",
+            "yaxis": "y",
+        },
+        {
+            "name": "Power Expense ($0.06/kWh)",
+            "data": "Electricity_Cost_6c",
+            "yaxis": "y",
+        },
+        {
+            "name": "Power Expense ($0.07/kWh)",
+            "data": "Electricity_Cost_7c",
+            "yaxis": "y",
+        },
+    ],
+    "title": "Bitcoin Electricity Cost by Power Tariff",
+    "x_label": "Date",
+    "y1_label": "Bitcoin Price and Power Expense per BTC (USD)",
+    "y2_label": "",
+    "filename": "Bitcoin_Electricity_Cost",
+    "chart_type": "line",
+    "filter_start_date": "2011-03-01",
+    "data_source": "Data Source: Bitview",
+    "events": BITCOIN_HISTORICAL_EVENTS,
+}
+
+# Power Law Model Chart
+chart_power_law_model = {
+    "x_data": "time",
+    "y1_type": "log",
+    "y2_type": "linear",
+    "y_data": [
+        {"name": "Bitcoin Price", "data": "price_close", "yaxis": "y"},
+        {
+            "name": "Power Law Price",
+            "data": "power_law_price",
+            "yaxis": "y",
+        },
+        {
+            "name": "BTC Price / Power Law Price",
+            "data": "power_law_price_multiple",
+            "yaxis": "y2",
+        },
+    ],
+    "title": "Bitcoin Power Law Model",
+    "x_label": "Date",
+    "y1_label": "Bitcoin Price (USD)",
+    "y2_label": "BTC Price / Power Law Price",
+    "filename": "Bitcoin_Power_Law_Model",
+    "chart_type": "line",
+    "filter_start_date": "2010-07-01",
+    "data_source": "Data Source: Bitview",
+    "events": BITCOIN_HISTORICAL_EVENTS,
+}
+
+# Metcalfe Model Chart
+chart_metcalfe_model = {
+    "x_data": "time",
+    "y1_type": "log",
+    "y2_type": "linear",
+    "y_data": [
+        {"name": "Bitcoin Price", "data": "price_close", "yaxis": "y"},
+        {
+            "name": "Metcalfe Value (Any Balance)",
+            "data": "metcalfe_value_any_balance",
+            "yaxis": "y",
+        },
+        {
+            "name": "Metcalfe Value (0.001+ BTC)",
+            "data": "metcalfe_value_0p001_btc",
+            "yaxis": "y",
+        },
+        {
+            "name": "Metcalfe Value (0.01+ BTC)",
+            "data": "metcalfe_value_0p01_btc",
+            "yaxis": "y",
+        },
+        {
+            "name": "Metcalfe Value (0.1+ BTC)",
+            "data": "metcalfe_value_0p1_btc",
+            "yaxis": "y",
+        },
+        {
+            "name": "BTC Price / Metcalfe Value",
+            "data": "metcalfe_price_multiple",
+            "yaxis": "y2",
+        },
+    ],
+    "title": "Bitcoin Metcalfe Model",
+    "x_label": "Date",
+    "y1_label": "Bitcoin Price (USD)",
+    "y2_label": "BTC Price / Metcalfe Value",
+    "filename": "Bitcoin_Metcalfe_Model",
+    "chart_type": "line",
+    "filter_start_date": "2010-07-01",
+    "data_source": "Data Source: Bitview",
+    "events": BITCOIN_HISTORICAL_EVENTS,
+}
+
+# Hash Ribbons Chart
+chart_hash_ribbons = {
+    "x_data": "time",
+    "y1_type": "log",
+    "y2_type": "log",
+    "y_data": [
+        {"name": "Bitcoin Price", "data": "price_close", "yaxis": "y"},
+        {
+            "name": "Hash Rate 30-Day MA",
+            "data": "30_day_ma_hash_rate",
+            "yaxis": "y2",
+        },
+        {
+            "name": "Hash Rate 60-Day MA",
+            "data": "60_day_ma_hash_rate",
+            "yaxis": "y2",
+        },
+    ],
+    "title": "Bitcoin Hash Ribbons",
+    "x_label": "Date",
+    "y1_label": "Bitcoin Price (USD)",
+    "y2_label": "Hash Rate (H/s)",
+    "filename": "Bitcoin_Hash_Ribbons",
+    "chart_type": "line",
+    "filter_start_date": "2010-07-01",
+    "data_source": "Data Source: Bitview",
+    "events": BITCOIN_HISTORICAL_EVENTS,
+}
+
+# Stock To Flow Chart
+s2f_price = {
+    "x_data": "time",
+    "y2_type": "linear",
+    "y_data": [
+        {"name": "Bitcoin Price", "data": "price_close", "yaxis": "y"},
+        {"name": "Stock-To-Flow Price", "data": "SF_Predicted_Price", "yaxis": "y"},
+        {"name": "Stock-To-Flow Multiple", "data": "SF_Multiple", "yaxis": "y2"},
+        
+    ],
+    "title": "Bitcoin Stock To Flow Price",
+    "x_label": "Date",
+    "y1_label": "Bitcoin Price",
+    "y2_label": "Stock To Flow Multiple",
+    "filename": "Bitcoin_S2F_Price",
+    "chart_type": "line",
+    "filter_start_date": "2010-07-01",
+    "data_source": "Data Source: Bitview",
+    "events": BITCOIN_HISTORICAL_EVENTS,
+}
+
+# NUPL Chart
+chart_NUPL = {
+    "x_data": "time",
+    "y_data": [
+        {"name": "Bitcoin Price", "data": "price_close", "yaxis": "y"},
+        {"name": "Net Unrealized Profit Loss", "data": "nupl", "yaxis": "y2"},
+    ],
+    "title": "Bitcoin Net Unrealized Profit Loss Ratio",
+    "x_label": "Date",
+    "y1_label": "Bitcoin Price",
+    "y2_label": "NUPL Ratio",
+    "filename": "Bitcoin_NUPL",
+    "chart_type": "line",
+    "data_source": "Data Source: Bitview",
+    "filter_start_date": "2010-07-01",
+    "events": BITCOIN_HISTORICAL_EVENTS,
+}
+
+# Bitcoin Price Chart
+chart_price_ma = {
+    "x_data": "time",
+    "y_data": [
+        {"name": "Bitcoin Price", "data": "price_close", "yaxis": "y"},
+        {"name": "7 Day MA", "data": "7_day_ma_price_close", "yaxis": "y"},
+        {"name": "50 Day MA", "data": "50_day_ma_price_close", "yaxis": "y"},
+        {"name": "200 Day MA", "data": "200_day_ma_price_close", "yaxis": "y"},
+        {"name": "200 Week MA", "data": "200_week_ma_price_close", "yaxis": "y"},
+        {"name": "200 Day MA Multiple", "data": "200_day_multiple", "yaxis": "y2"},
+    ],
+    "title": "Bitcoin Price Moving Averages",
+    "filter_metric": "price_close",
+    "x_label": "Date",
+    "y1_label": "Bitcoin Price (USD)",
+    "y2_label": "200 Day Moving Average Multiple",
+    "filename": "Bitcoin_Price_Chart_MA",
+    "chart_type": "line",
+    "data_source": "Data Source: Bitview",
+    "filter_start_date": "2011-01-01",
+    "events": BITCOIN_HISTORICAL_EVENTS,
+}
+
+# Bitcoin YOY Retrun Comparison
+yoy_return = {
+    "x_data": "time",
+    "y_data": [
+        {"name": "Bitcoin YOY Return", "data": "price_close_YOY_change", "yaxis": "y2"},
+        {"name": "Bitcoin Price", "data": "price_close", "yaxis": "y"},
+    ],
+    "title": "Year Over Year Return",
+    "x_label": "Date",
+    "y1_label": "Bitcoin Price (USD)",
+    "y2_label": "Year Over Year Return (Percentage)",
+    "filter_start_date": "2015-01-01",
+    "filter_metric": "price_close_YOY_change",
+    "filename": "Bitcoin_YOY_Return_Comparison",
+    "chart_type": "line",
+    "data_source": "Data Source: Bitview",
+}
+
+# Bitcoin CAGR Comparison
+cagr_overview = {
+    "x_data": "time",
+    "y_data": [
+        {"name": "Bitcoin Price", "data": "price_close", "yaxis": "y"},
+        {"name": "Bitcoin 4 Year CAGR", "data": "price_close_4_Year_CAGR", "yaxis": "y2"},
+    ],
+    "title": "4 Year Compound Annual Growth Rate",
+    "x_label": "Date",
+    "y1_label": "Bitcoin Price",
+    "y2_label": "4 Year CAGR (Percentage)",
+    "filter_start_date": "2015-01-01",
+    "filter_metric": "price_close_4_Year_CAGR",
+    "filename": "Bitcoin_CAGR",
+    "chart_type": "line",
+    "data_source": "Data Source: Bitview",
+}
+
+# Hashrate Chart
+chart_sats_per_dollar = {
+    "x_data": "time",
+    "y_data": [
+        {"name": "Satoshis Per Dollar", "data": "sat_per_dollar", "yaxis": "y1"},
+        {"name": "Bitcoin Price", "data": "price_close", "yaxis": "y2"},
+    ],
+    "title": "Satoshis Per Dollar",
+    "x_label": "Date",
+    "y1_label": "Satoshis Per Dollar | Amount Of Bitcoin You Can Purchase Per $1",
+    "y2_label": "1 Full Bitcoin Price",
+    "filename": "Bitcoin_Sats_Per_Dollar",
+    "chart_type": "line",
+    "data_source": "Data Source: Bitview",
+    "filter_start_date": "2010-07-01",
+    "events": BITCOIN_HISTORICAL_EVENTS,
+}
+
+# Bitcoin m0
+chart_m0 = {
+    "x_data": "time",
+    "y_data": [
+        {"name": "Bitcoin Price", "data": "price_close", "yaxis": "y"},
+        {"name": "United States", "data": "United_States_btc_price", "yaxis": "y"},
+        {"name": "China", "data": "China_btc_price", "yaxis": "y"},
+        {"name": "Eurozone", "data": "Eurozone_btc_price", "yaxis": "y"},
+        {"name": "Japan", "data": "Japan_btc_price", "yaxis": "y"},
+        {"name": "United Kingdom", "data": "United_Kingdom_btc_price", "yaxis": "y"},
+        {"name": "Switzerland", "data": "Switzerland_btc_price", "yaxis": "y"},
+        {"name": "India", "data": "India_btc_price", "yaxis": "y"},
+        {"name": "Australia", "data": "Australia_btc_price", "yaxis": "y"},
+        {"name": "Russia", "data": "Russia_btc_price", "yaxis": "y"},
+    ],
+    "title": "Bitcoin Price VS M0 Money Supply",
+    "x_label": "Date",
+    "y1_label": "Bitcoin Price (USD)",
+    "y2_label": "",
+    "filename": "Bitcoin_M0",
+    "chart_type": "line",
+    "data_source": "Data Source: Bitview",
+    "filter_start_date": "2010-07-01",
+    "events": BITCOIN_HISTORICAL_EVENTS,
+}
+
+# Equity market-cap fields published by the local Report Library. Keep the broad
+# equities chart tied to this single ordered catalog so newly grouped RV charts
+# cannot drift onto different labels or column names.
+EQUITY_RELATIVE_VALUE_SERIES = {
+    "AAPL": ("Apple", "AAPL_mc_btc_price"),
+    "MSFT": ("Microsoft", "MSFT_mc_btc_price"),
+    "GOOGL": ("Alphabet", "GOOGL_mc_btc_price"),
+    "AMZN": ("Amazon", "AMZN_mc_btc_price"),
+    "NVDA": ("NVIDIA", "NVDA_mc_btc_price"),
+    "AVGO": ("Broadcom", "AVGO_mc_btc_price"),
+    "TSLA": ("Tesla", "TSLA_mc_btc_price"),
+    "LLY": ("Eli Lilly", "LLY_mc_btc_price"),
+    "MU": ("Micron", "MU_mc_btc_price"),
+    "META": ("Meta", "META_mc_btc_price"),
+    "BRK-A": ("Berkshire Hathaway A", "BRK-A_mc_btc_price"),
+    "BRK-B": ("Berkshire Hathaway B", "BRK-B_mc_btc_price"),
+    "TSM": ("TSMC", "TSM_mc_btc_price"),
+    "SPCX": ("SpaceX", "SPCX_mc_btc_price"),
+    "2222.SR": ("Saudi Aramco", "2222.SR_mc_btc_price"),
+    "005930.KS": ("Samsung Electronics", "005930.KS_mc_btc_price"),
+    "V": ("Visa", "V_mc_btc_price"),
+    "JPM": ("JPMorgan", "JPM_mc_btc_price"),
+    "PYPL": ("PayPal", "PYPL_mc_btc_price"),
+    "GS": ("Goldman Sachs", "GS_mc_btc_price"),
+    "COIN": ("Coinbase", "COIN_mc_btc_price"),
+    "XYZ": ("Block", "XYZ_mc_btc_price"),
+    "MSTR": ("Strategy", "MSTR_mc_btc_price"),
+    "MARA": ("MARA", "MARA_mc_btc_price"),
+    "RIOT": ("Riot", "RIOT_mc_btc_price"),
+}
+
+
+def _equity_relative_value_traces(*tickers):
+    """Build primary-axis traces for selected equity market-cap BTC prices."""
+    return [
+        {
+            "name": EQUITY_RELATIVE_VALUE_SERIES[ticker][0],
+            "data": EQUITY_RELATIVE_VALUE_SERIES[ticker][1],
+            "yaxis": "y",
+        }
+        for ticker in tickers
+    ]
+
+
+# Equities Market Cap Chart
+chart_equities = {
+    "x_data": "time",
+    "y_data": [
+        {"name": "Bitcoin Price", "data": "price_close", "yaxis": "y"},
+        *_equity_relative_value_traces(*EQUITY_RELATIVE_VALUE_SERIES),
+    ],
+    "title": "Bitcoin Price vs Mega Equity Market Caps",
+    "x_label": "Date",
+    "y1_label": "Bitcoin Price (USD)",
+    "y2_label": "",
+    "filename": "Bitcoin_Equities",
+    "chart_type": "line",
+    "data_source": "Data Source: Bitview",
+    "filter_start_date": "2010-07-01",
+    "events": BITCOIN_HISTORICAL_EVENTS,
+    "height": 900,
+    "bottom_margin": 380,
+    "legend_y": -0.12,
+    "legend_yanchor": "top",
+    "legend_font_size": 12,
+    "controls_y": -0.72,
+    "source_y": -0.84,
+}
+
+# Gold Market Cap Chart
+chart_gold = {
+    "x_data": "time",
+    "y_data": [
+        {"name": "Bitcoin Price", "data": "price_close", "yaxis": "y"},
+        {"name": "Gold Marketcap", "data": "gold_marketcap_btc_price", "yaxis": "y"},
+        {
+            "name": "Silver Marketcap",
+            "data": "silver_marketcap_btc_price",
+            "yaxis": "y",
+        },
+        {
+            "name": "Gold Jewellery",
+            "data": "gold_jewellery_marketcap_btc_price",
+            "yaxis": "y",
+        },
+        {
+            "name": "Gold Private Investment",
+            "data": "gold_private_investment_marketcap_btc_price",
+            "yaxis": "y",
+        },
+        {
+            "name": "Gold Country Holdings",
+            "data": "gold_official_country_holdings_marketcap_btc_price",
+            "yaxis": "y",
+        },
+        {
+            "name": "Gold Other / Industrial",
+            "data": "gold_other_marketcap_btc_price",
+            "yaxis": "y",
+        },
+    ],
+    "title": "Bitcoin Price VS Gold Market Cap",
+    "x_label": "Date",
+    "y1_label": "Bitcoin Price (USD)",
+    "y2_label": "",
+    "filename": "Bitcoin_Gold",
+    "chart_type": "line",
+    "data_source": "Data Source: Bitview",
+    "filter_start_date": "2010-07-01",
+    "events": BITCOIN_HISTORICAL_EVENTS,
+}
+
+# Bitcoin Promo Chart
+chart_promo = {
+    "x_data": "time",
+    "y_data": [
+        {"name": "Bitcoin Price", "data": "price_close", "yaxis": "y"},
+        {"name": "Realized Price", "data": "realized_price", "yaxis": "y"},
+        {
+            "name": "Thermocap Multiple 32x",
+            "data": "thermocap_price_multiple_32",
+            "yaxis": "y",
+        },
+        {"name": "200 Week MA", "data": "200_week_ma_price_close", "yaxis": "y"},
+        {"name": "Hash Rate 30 Day MA", "data": "30_day_ma_hash_rate", "yaxis": "y2"},
+        {"name": "Hash Rate 365 Day MA", "data": "365_day_ma_hash_rate", "yaxis": "y2"},
+    ],
+    "title": "Bitcoin 101",
+    "x_label": "Date",
+    "y1_label": "Bitcoin Price (USD)",
+    "y2_label": "hash_rate",
+    "filename": "Bitcoin_Promo",
+    "chart_type": "line",
+    "data_source": "Data Source: Bitview",
+    "filter_start_date": "2010-07-01",
+    "events": BITCOIN_HISTORICAL_EVENTS,
+}
+
+# Bitcoin Relative Valuation
+chart_rv_metals = {
+    "x_data": "time",
+    "y_data": [
+        {"name": "Bitcoin Price", "data": "price_close", "yaxis": "y"},
+        {"name": "Silver", "data": "silver_marketcap_btc_price", "yaxis": "y"},
+        {
+            "name": "Gold Country Holdings",
+            "data": "gold_official_country_holdings_marketcap_btc_price",
+            "yaxis": "y",
+        },
+        {
+            "name": "Gold Private Investment",
+            "data": "gold_private_investment_marketcap_btc_price",
+            "yaxis": "y",
+        },
+        {"name": "Total Gold Market", "data": "gold_marketcap_btc_price", "yaxis": "y"},
+    ],
+    "title": "Bitcoin Price Relative Valuation - Metals",
+    "x_label": "Date",
+    "y1_label": "Bitcoin Price (USD)",
+    "y2_label": "",
+    "filename": "Bitcoin_RV_metals",
+    "chart_type": "line",
+    "data_source": "Data Source: Bitview",
+    "filter_start_date": "2010-07-01",
+    "events": BITCOIN_HISTORICAL_EVENTS,
+}
+
+# Bitcoin Relative Valuation
+chart_rv_stocks = {
+    "x_data": "time",
+    "y_data": [
+        {"name": "Bitcoin Price", "data": "price_close", "yaxis": "y"},
+        *_equity_relative_value_traces("META", "AMZN", "GOOGL", "MSFT", "AAPL"),
+    ],
+    "title": "Bitcoin Price Relative Valuation - Stocks",
+    "x_label": "Date",
+    "y1_label": "Bitcoin Price (USD)",
+    "y2_label": "",
+    "filename": "Bitcoin_RV_stocks",
+    "chart_type": "line",
+    "data_source": "Data Source: Bitview",
+    "filter_start_date": "2010-07-01",
+    "events": BITCOIN_HISTORICAL_EVENTS,
+}
+
+# Bitcoin Relative Valuation - Semiconductors
+chart_rv_semiconductors = {
+    "x_data": "time",
+    "y_data": [
+        {"name": "Bitcoin Price", "data": "price_close", "yaxis": "y"},
+        *_equity_relative_value_traces("NVDA", "AVGO", "TSM", "005930.KS", "MU"),
+    ],
+    "title": "Bitcoin Price Relative Valuation - Semiconductors",
+    "x_label": "Date",
+    "y1_label": "Bitcoin Price (USD)",
+    "y2_label": "",
+    "filename": "Bitcoin_RV_Semiconductors",
+    "chart_type": "line",
+    "data_source": "Data Source: Bitview",
+    "filter_start_date": "2015-01-01",
+    "events": BITCOIN_HISTORICAL_EVENTS,
+}
+
+# Bitcoin Relative Valuation - Financials and Payments
+chart_rv_financials = {
+    "x_data": "time",
+    "y_data": [
+        {"name": "Bitcoin Price", "data": "price_close", "yaxis": "y"},
+        *_equity_relative_value_traces("BRK-B", "JPM", "GS", "V", "PYPL", "XYZ"),
+    ],
+    "title": "Bitcoin Price Relative Valuation - Financials and Payments",
+    "x_label": "Date",
+    "y1_label": "Bitcoin Price (USD)",
+    "y2_label": "",
+    "filename": "Bitcoin_RV_Financials",
+    "chart_type": "line",
+    "data_source": "Data Source: Bitview",
+    "filter_start_date": "2015-01-01",
+    "events": BITCOIN_HISTORICAL_EVENTS,
+}
+
+# Bitcoin Relative Valuation - Cross-Sector Leaders
+chart_rv_sector_leaders = {
+    "x_data": "time",
+    "y_data": [
+        {"name": "Bitcoin Price", "data": "price_close", "yaxis": "y"},
+        *_equity_relative_value_traces("TSLA", "LLY", "2222.SR", "SPCX"),
+    ],
+    "title": "Bitcoin Price Relative Valuation - Cross-Sector Leaders",
+    "x_label": "Date",
+    "y1_label": "Bitcoin Price (USD)",
+    "y2_label": "",
+    "filename": "Bitcoin_RV_Sector_Leaders",
+    "chart_type": "line",
+    "data_source": "Data Source: Bitview",
+    "filter_start_date": "2015-01-01",
+    "events": BITCOIN_HISTORICAL_EVENTS,
+}
+
+# Bitcoin Relative Valuation
+chart_rv_m0 = {
+    "x_data": "time",
+    "y_data": [
+        {"name": "Bitcoin Price", "data": "price_close", "yaxis": "y"},
+        {"name": "United Kingdom", "data": "United_Kingdom_btc_price", "yaxis": "y"},
+        {"name": "Japan", "data": "Japan_btc_price", "yaxis": "y"},
+        {"name": "China", "data": "China_btc_price", "yaxis": "y"},
+        {"name": "United States", "data": "United_States_btc_price", "yaxis": "y"},
+        {"name": "EU", "data": "Eurozone_btc_price", "yaxis": "y"},
+    ],
+    "title": "Bitcoin Price Relative Valuation - M0",
+    "x_label": "Date",
+    "y1_label": "Bitcoin Price (USD)",
+    "y2_label": "",
+    "filename": "Bitcoin_RV_M0",
+    "chart_type": "line",
+    "data_source": "Data Source: Bitview",
+    "filter_start_date": "2010-07-01",
+    "events": BITCOIN_HISTORICAL_EVENTS,
+}
+
+# Bitcoin On-Chain
+chart_on_chain = {
+    "x_data": "time",
+    "y_data": [
+        {"name": "Bitcoin Price", "data": "price_close", "yaxis": "y"},
+        {"name": "200 Week MA", "data": "200_week_ma_price_close", "yaxis": "y"},
+
+        {
+            "name": "Hayes Network Price Per BTC",
+            "data": "Hayes_Network_Price_Per_BTC",
+            "yaxis": "y",
+        },
+        {"name": "STH Realized Price", "data": "sth_realized_price", "yaxis": "y"},
+        {"name": "LTH Realized Price", "data": "lth_realized_price", "yaxis": "y"},
+        {"name": "Realized Price", "data": "realized_price", "yaxis": "y"},
+        {"name": "3x Realized Price", "data": "realizedcap_multiple_3", "yaxis": "y"},
+    ],
+    "title": "Bitcoin Price On-Chain Value",
+    "x_label": "Date",
+    "y1_label": "Bitcoin Price (USD)",
+    "y2_label": "",
+    "filename": "Bitcoin_On_Chain",
+    "chart_type": "line",
+    "data_source": "Data Source: Bitview",
+    "filter_start_date": "2010-07-01",
+    "events": BITCOIN_HISTORICAL_EVENTS,
+}
+
+# Bitcoin Promo Chart
+chart_hashrate_price = {
+    "x_data": "time",
+    "y_data": [
+        {"name": "Bitcoin Price", "data": "price_close", "yaxis": "y"},
+        {"name": "Hash Rate", "data": "hash_rate", "yaxis": "y2"},
+        {"name": "Hash Rate 30 Day MA", "data": "30_day_ma_hash_rate", "yaxis": "y2"},
+        {"name": "Hash Rate 365 Day MA", "data": "365_day_ma_hash_rate", "yaxis": "y2"},
+    ],
+    "title": "Bitcoin Price & Hashrate",
+    "x_label": "Date",
+    "y1_label": "Bitcoin Price (USD)",
+    "y2_label": "hash_rate",
+    "filename": "Bitcoin_Hashrate_Price",
+    "chart_type": "line",
+    "data_source": "Data Source: Bitview",
+    "events": BITCOIN_HISTORICAL_EVENTS,
+}
+
+# Supply Age by UTXO Age Chart
+chart_supply_age = {
+    "x_data": "time",
+    "y_data": [
+        {"name": "Bitcoin Price", "data": "price_close", "yaxis": "y"},
+        {"name": "Supply < 1 Month", "data": "utxos_under_1m_old_supply", "yaxis": "y2"},
+        {"name": "Supply < 3 Months", "data": "utxos_under_3m_old_supply", "yaxis": "y2"},
+        {"name": "Supply < 6 Months", "data": "utxos_under_6m_old_supply", "yaxis": "y2"},
+        {"name": "Supply < 1 Year", "data": "utxos_under_1y_old_supply", "yaxis": "y2"},
+        {"name": "Supply < 2 Years", "data": "utxos_under_2y_old_supply", "yaxis": "y2"},
+        {"name": "Supply < 3 Years", "data": "utxos_under_3y_old_supply", "yaxis": "y2"},
+        {"name": "Supply < 4 Years", "data": "utxos_under_4y_old_supply", "yaxis": "y2"},
+        {"name": "Supply < 5 Years", "data": "utxos_under_5y_old_supply", "yaxis": "y2"},
+        {"name": "Supply < 10 Years", "data": "utxos_under_10y_old_supply", "yaxis": "y2"},
+        {"name": "Current Supply", "data": "supply", "yaxis": "y2"},
+    ],
+    "title": "Supply Age Distribution",
+    "x_label": "Date",
+    "y1_label": "Bitcoin Price",
+    "y2_label": "Supply (BTC)",
+    "filename": "Bitcoin_Supply_Age",
+    "chart_type": "line",
+    "data_source": "Data Source: BRK",
+    "events": BITCOIN_HISTORICAL_EVENTS,
+}
+
+# Bitcoin CAGR Comparison
+cagr_comparison = {
+    "x_data": "time",
+    "y1_type": "linear",
+    "y_data": [
+        {"name": "Bitcoin", "data": "price_close_4_Year_CAGR", "yaxis": "y"},
+        {
+            "name": "S&P 500 Index ETF",
+            "data": "SPY_close_4_Year_CAGR",
+            "yaxis": "y",
+        },
+        {
+            "name": "Nasdaq-100 ETF",
+            "data": "QQQ_close_4_Year_CAGR",
+            "yaxis": "y",
+        },
+        {
+            "name": "Technology Sector ETF",
+            "data": "XLK_close_4_Year_CAGR",
+            "yaxis": "y",
+        },
+        {
+            "name": "Financials Sector ETF",
+            "data": "XLF_close_4_Year_CAGR",
+            "yaxis": "y",
+        },
+        {"name": "Gold ETF", "data": "GLD_close_4_Year_CAGR", "yaxis": "y"},
+        {
+            "name": "Aggregate Bond ETF",
+            "data": "AGG_close_4_Year_CAGR",
+            "yaxis": "y",
+        },
+        {
+            "name": "US Dollar Index",
+            "data": "DX-Y.NYB_close_4_Year_CAGR",
+            "yaxis": "y",
+        },
+        {
+            "name": "Bitcoin Miners ETF",
+            "data": "WGMI_close_4_Year_CAGR",
+            "yaxis": "y",
+        },
+    ],
+    "title": "4 Year Compound Annual Growth Rate Comparison",
+    "x_label": "Date",
+    "y1_label": "4 Year CAGR (Percentage)",
+    "y2_label": "",
+    "filename": "Bitcoin_CAGR_Comparison",
+    "chart_type": "line",
+    "data_source": "Data Source: Bitview",
+    "filter_start_date": "2015-05-01",
+}
+
+
+# Bitcoin MTD Return Comparison
+def _mtd_return(today):
+    """Build the month-to-date comparison for the month containing ``today``."""
+    return {
+        "x_data": "time",
+        "y1_type": "linear",
+        "y_data": [
+            {"name": "Bitcoin", "data": "price_close_MTD_change", "yaxis": "y"},
+            {
+                "name": "S&P 500 Index ETF",
+                "data": "SPY_close_MTD_change",
+                "yaxis": "y",
+            },
+            {
+                "name": "Nasdaq-100 ETF",
+                "data": "QQQ_close_MTD_change",
+                "yaxis": "y",
+            },
+            {
+                "name": "Technology Sector ETF",
+                "data": "XLK_close_MTD_change",
+                "yaxis": "y",
+            },
+            {
+                "name": "Financials Sector ETF",
+                "data": "XLF_close_MTD_change",
+                "yaxis": "y",
+            },
+            {"name": "Gold ETF", "data": "GLD_close_MTD_change", "yaxis": "y"},
+            {
+                "name": "Aggregate Bond ETF",
+                "data": "AGG_close_MTD_change",
+                "yaxis": "y",
+            },
+            {
+                "name": "US Dollar Index",
+                "data": "DX-Y.NYB_close_MTD_change",
+                "yaxis": "y",
+            },
+            {
+                "name": "Bitcoin Miners ETF",
+                "data": "WGMI_close_MTD_change",
+                "yaxis": "y",
+            },
+        ],
+        "title": f"Month To Date Return Comparison - {today:%B %Y}",
+        "x_label": "Date",
+        "y1_label": "Month To Date Return (Percentage)",
+        "y2_label": "",
+        "filename": "Bitcoin_MTD_Return_Comparison",
+        "chart_type": "line",
+        "data_source": "Data Source: Bitview",
+        "filter_start_date": today.replace(day=1).isoformat(),  # Start of the current month
+    }
+
+
+# Shortened Year To Date Return Comparison
+def _ytd_return(today):
+    """Build the shortened year-to-date comparison for ``today``'s year."""
+    return {
+        "x_data": "time",
+        "y1_type": "linear",
+        "y_data": [
+            {"name": "Bitcoin", "data": "price_close_YTD_change", "yaxis": "y"},
+            {
+                "name": "S&P 500 Index ETF",
+                "data": "SPY_close_YTD_change",
+                "yaxis": "y",
+            },
+            {
+                "name": "Nasdaq-100 ETF",
+                "data": "QQQ_close_YTD_change",
+                "yaxis": "y",
+            },
+            {
+                "name": "Technology Sector ETF",
+                "data": "XLK_close_YTD_change",
+                "yaxis": "y",
+            },
+            {
+                "name": "Financials Sector ETF",
+                "data": "XLF_close_YTD_change",
+                "yaxis": "y",
+            },
+            {"name": "Gold ETF", "data": "GLD_close_YTD_change", "yaxis": "y"},
+            {
+                "name": "Aggregate Bond ETF",
+                "data": "AGG_close_YTD_change",
+                "yaxis": "y",
+            },
+            {
+                "name": "US Dollar Index",
+                "data": "DX-Y.NYB_close_YTD_change",
+                "yaxis": "y",
+            },
+            {
+                "name": "Bitcoin Miners ETF",
+                "data": "WGMI_close_YTD_change",
+                "yaxis": "y",
+            },
+        ],
+        "title": f"Year To Date Return ({today.year})",
+        "x_label": "Date",
+        "y1_label": "Year To Date Return (Percentage)",
+        "y2_label": "",
+        "filename": "Bitcoin_YTD_Return_Comparison",
+        "chart_type": "line",
+        "data_source": "Data Source: Bitview",
+        "filter_start_date": f"{today.year}-01-01",
+        "filter_metric": "time",
+    }
+
+
+# Full list Year To Date Return Comparison
+def _ytd_return_full(today):
+    """Build the full year-to-date comparison for ``today``'s year."""
+    return {
+        "x_data": "time",
+        "y1_type": "linear",
+        "y_data": [
+            {"name": "BTC", "data": "price_close_YTD_change", "yaxis": "y"},
+            {"name": "SPY", "data": "SPY_close_YTD_change", "yaxis": "y"},
+            {"name": "QQQ", "data": "QQQ_close_YTD_change", "yaxis": "y"},
+            {"name": "VTI", "data": "VTI_close_YTD_change", "yaxis": "y"},
+            {"name": "VXUS", "data": "VXUS_close_YTD_change", "yaxis": "y"},
+            {"name": "XLK", "data": "XLK_close_YTD_change", "yaxis": "y"},
+            {"name": "XLF", "data": "XLF_close_YTD_change", "yaxis": "y"},
+            {"name": "XLE", "data": "XLE_close_YTD_change", "yaxis": "y"},
+            {"name": "XLRE", "data": "XLRE_close_YTD_change", "yaxis": "y"},
+            {"name": "DXY", "data": "DX-Y.NYB_close_YTD_change", "yaxis": "y"},
+            {"name": "GLD", "data": "GLD_close_YTD_change", "yaxis": "y"},
+            {"name": "AGG", "data": "AGG_close_YTD_change", "yaxis": "y"},
+            {"name": "SPGSCI", "data": "^SPGSCI_close_YTD_change", "yaxis": "y"},
+            {"name": "MSTR", "data": "MSTR_close_YTD_change", "yaxis": "y"},
+            {"name": "XYZ", "data": "XYZ_close_YTD_change", "yaxis": "y"},
+            {"name": "COIN", "data": "COIN_close_YTD_change", "yaxis": "y"},
+            {"name": "WGMI", "data": "WGMI_close_YTD_change", "yaxis": "y"},
+        ],
+        "title": f"Year To Date Return ({today.year})",
+        "x_label": "Date",
+        "y1_label": "Year To Date Return (Percentage)",
+        "y2_label": "",
+        "filename": "Bitcoin_YTD_Return_Comparison_full",
+        "chart_type": "line",
+        "data_source": "Data Source: Bitview",
+        "filter_start_date": f"{today.year}-01-01",
+        "filter_metric": "time",
+    }
+
+
+# ATH Drawdown Chart
+chart_drawdowns = {
+    "x_data": "days_since_ath",
+    "value_col": "drawdown_pct",
+    "group_col": "Cycle",
+    "y1_type": "linear",
+    "y_data": [
+        {"name": "Drawdown Cycle 1", "group": "Drawdown Cycle 1"},
+        {"name": "Drawdown Cycle 2", "group": "Drawdown Cycle 2"},
+        {"name": "Drawdown Cycle 3", "group": "Drawdown Cycle 3"},
+        {"name": "Drawdown Cycle 4", "group": "Drawdown Cycle 4"},
+        {"name": "Drawdown Cycle 5", "group": "Drawdown Cycle 5"},
+    ],
+    "title": "Bitcoin Drawdowns From ATH",
+    "x_label": "Days Since ATH",
+    "y1_label": "Drawdown (%)",
+    "filename": "Bitcoin_ATH_Drawdown",
+    "chart_type": "line",
+    "data_source": "Data Source: Bitview",
+    "hovertemplate": "Drawdown %{y:,.2f}%<extra>%{fullData.name}</extra>",
+    "y_tickformat": ",.2f",
+}
+
+# Cycle Low Chart
+chart_cycle_lows = {
+    "x_data": "days_since_cycle_low",
+    "value_col": "index_value",
+    "group_col": "Cycle",
+    "y1_type": "log",
+    "price_scale": {
+        "anchor_date": "2026-02-06",
+        "price_col": "price_close",
+    },
+    "y_data": [
+        {"name": "Market Cycle 1", "group": "Market Cycle 1"},
+        {"name": "Market Cycle 2", "group": "Market Cycle 2"},
+        {"name": "Market Cycle 3", "group": "Market Cycle 3"},
+        {"name": "Market Cycle 4", "group": "Market Cycle 4"},
+        {"name": "Market Cycle 5", "group": "Market Cycle 5"},
+        {"name": "Market Cycle 6", "group": "Market Cycle 6"},
+    ],
+    "title": "Bitcoin Price Performance Since Cycle Low",
+    "x_label": "Days Since Cycle Low",
+    "y1_label": "Bitcoin Price Indexed to Current Cycle Low ($)",
+    "filename": "Bitcoin_Cycle_Low",
+    "data_source": "Data Source: Bitview",
+    "hovertemplate": "$%{y:,.0f}<extra>%{fullData.name}</extra>",
+    "y_tickformat": "$,.0f",
+}
+
+# Halving Performane Chart
+chart_halvings = {
+    "x_data": "days_since_halving",
+    "value_col": "index_value",
+    "group_col": "Era",
+    "y1_type": "log",
+    "y_data": [
+        {"name": "2012–16",      "group": "2nd Era"},
+        {"name": "2016–20",      "group": "3rd Era"},
+        {"name": "2020–24",      "group": "4th Era"},
+        {"name": "2024+",        "group": "5th Era"},
+    ],
+    "title": "Bitcoin Index Performance Since Halving",
+    "x_label": "Days Since Halving",
+    "y1_label": "Cycle Index Value (1.0 = halving price)",
+    "filename": "Bitcoin_Halving_Cycle",
+    "chart_type": "line",
+    "data_source": "Data Source: Bitview",
+    "hovertemplate": "Index %{y:,.2f}×<extra>%{fullData.name}</extra>",
+    "y_tickformat": "~g",
+}
+
+# Bitcoin Relative Valuation - Composite
+chart_rv = {
+    "x_data": "time",
+    "y_data": [
+        {"name": "Bitcoin", "data": "price_close", "yaxis": "y"},
+        {"name": "Total Silver Market", "data": "silver_marketcap_btc_price", "yaxis": "y"},
+        {"name": "UK M0", "data": "United_Kingdom_btc_price", "yaxis": "y"},
+        {"name": "Meta", "data": "META_mc_btc_price", "yaxis": "y"},
+        {"name": "Amazon", "data": "AMZN_mc_btc_price", "yaxis": "y"},
+        {
+            "name": "Gold Country Holdings",
+            "data": "gold_official_country_holdings_marketcap_btc_price",
+            "yaxis": "y",
+        },
+        {"name": "NVIDIA", "data": "NVDA_mc_btc_price", "yaxis": "y"},
+        {
+            "name": "Gold Private Investment",
+            "data": "gold_private_investment_marketcap_btc_price",
+            "yaxis": "y",
+        },
+        {"name": "Apple", "data": "AAPL_mc_btc_price", "yaxis": "y"},
+        {"name": "US M0", "data": "United_States_btc_price", "yaxis": "y"},
+        {"name": "Total Gold Market", "data": "gold_marketcap_btc_price", "yaxis": "y"},
+    ],
+    "title": "Bitcoin Price Relative Valuation",
+    "x_label": "Date",
+    "y1_label": "Bitcoin Price (USD)",
+    "y2_label": "",
+    "filename": "Bitcoin_RV",
+    "chart_type": "line",
+    "data_source": "Data Source: Bitview",
+    "filter_start_date": "2010-07-01",
+    "events": BITCOIN_HISTORICAL_EVENTS,
+}
+
+# Adjusted Bitcoin Days Destroyed Chart 
+chart_adjusted_bdd = {
+    "x_data": "time",
+    "y1_type": "log",
+    "y2_type": "linear",
+    "y_data": [
+        {"name": "Bitcoin Price", "data": "price_close", "yaxis": "y"},
+        {"name": "Adjusted BDD", "data": "adjusted_bdd", "yaxis": "y2"},
+        {"name": "Adjusted BDD Mean", "data": "adjusted_bdd_mean", "yaxis": "y2"},
+    ],
+    "title": "Adjusted Bitcoin Days Destroyed (BDD / Circulating Supply)",
+    "x_label": "Date",
+    "y1_label": "Bitcoin Price",
+    "y2_label": "Adjusted BDD",
+    "filename": "Bitcoin_Adjusted_BDD",
+    "chart_type": "line",
+    "data_source": "Data Source: BRK (Calculated)",
+    "filter_start_date": "2010-07-01",
+    "events": BITCOIN_HISTORICAL_EVENTS,
+}
+
+# Puell Multiple Chart
+chart_puell_multiple = {
+    "x_data": "time",
+    "y1_type": "log",
+    "y2_type": "linear",
+    "y_data": [
+        {"name": "Bitcoin Price", "data": "price_close", "yaxis": "y"},
+        {"name": "Puell Multiple", "data": "puell_multiple", "yaxis": "y2"},
+    ],
+    "title": "Bitcoin Puell Multiple",
+    "x_label": "Date",
+    "y1_label": "Bitcoin Price",
+    "y2_label": "Puell Multiple",
+    "filename": "Bitcoin_Puell_Multiple",
+    "chart_type": "line",
+    "data_source": "Data Source: BRK",
+    "filter_start_date": "2011-01-01",
+    "events": BITCOIN_HISTORICAL_EVENTS,
+}
+
+# HODL Bank & Reserve Risk Chart
+chart_hodl_bank = {
+    "x_data": "time",
+    "y1_type": "log",
+    "y2_type": "log",
+    "y_data": [
+        {"name": "Bitcoin Price", "data": "price_close", "yaxis": "y"},
+        {"name": "VOCD", "data": "vocd", "yaxis": "y"},
+        {"name": "MVOCD", "data": "mvocd", "yaxis": "y"},
+        {"name": "HODL Bank", "data": "hodl_bank_calc", "yaxis": "y"},
+        {"name": "Reserve Risk", "data": "reserve_risk_calc", "yaxis": "y2"},
+    ],
+    "title": "Bitcoin HODL Bank & Reserve Risk",
+    "x_label": "Date",
+    "y1_label": "USD Value",
+    "y2_label": "Reserve Risk",
+    "filename": "Bitcoin_HODL_Bank",
+    "chart_type": "line",
+    "data_source": "Data Source: BRK",
+    "filter_start_date": "2010-07-01",
+    "events": BITCOIN_HISTORICAL_EVENTS,
+}
+
+# Delta Cap Chart (Price Format)
+chart_delta_cap = {
+    "x_data": "time",
+    "y1_type": "log",
+    "y2_type": "log",
+    "y_data": [
+        {"name": "Bitcoin Price", "data": "price_close", "yaxis": "y"},
+        {"name": "Realized Price", "data": "realized_price", "yaxis": "y"},
+        {"name": "Average Cap Price", "data": "average_cap_price", "yaxis": "y"},
+        {"name": "Delta Cap Price", "data": "delta_cap_price", "yaxis": "y"},
+    ],
+    "title": "Bitcoin Delta Cap",
+    "x_label": "Date",
+    "y1_label": "Price (USD)",
+    "y2_label": "",
+    "filename": "Bitcoin_Delta_Cap",
+    "chart_type": "line",
+    "data_source": "Data Source: BRK",
+    "filter_start_date": "2010-07-01",
+    "events": BITCOIN_HISTORICAL_EVENTS,
+}
+
+# Bitcoin Volatility Chart
+chart_volatility = {
+    "x_data": "time",
+    "y1_type": "log",
+    "y2_type": "linear",
+    "y_data": [
+        {"name": "Bitcoin Price", "data": "price_close", "yaxis": "y"},
+        {"name": "30-Day Volatility", "data": "VtyDayRet30d", "yaxis": "y2"},
+        {"name": "180-Day Volatility", "data": "VtyDayRet180d", "yaxis": "y2"},
+    ],
+    "title": "Bitcoin Volatility",
+    "x_label": "Date",
+    "y1_label": "Bitcoin Price",
+    "y2_label": "Annualized Volatility",
+    "filename": "Bitcoin_Volatility",
+    "chart_type": "line",
+    "data_source": "Data Source: BRK",
+    "filter_start_date": "2010-07-01",
+    "events": BITCOIN_HISTORICAL_EVENTS,
+}
+
+# SOPR (Spent Output Profit Ratio) Chart
+chart_sopr = {
+    "x_data": "time",
+    "y1_type": "log",
+    "y2_type": "linear",
+    "y_data": [
+        {"name": "Bitcoin Price", "data": "price_close", "yaxis": "y"},
+        {"name": "SOPR", "data": "sopr_24h", "yaxis": "y2"},
+    ],
+    "title": "Bitcoin SOPR (Spent Output Profit Ratio)",
+    "x_label": "Date",
+    "y1_label": "Bitcoin Price",
+    "y2_label": "SOPR",
+    "filename": "Bitcoin_SOPR",
+    "chart_type": "line",
+    "data_source": "Data Source: BRK",
+    "filter_start_date": "2012-01-01",
+    "events": BITCOIN_HISTORICAL_EVENTS,
+}
+
+# Supply in Profit/Loss Chart (Percentage)
+chart_supply_profit_loss = {
+    "x_data": "time",
+    "y1_type": "log",
+    "y2_type": "linear",
+    "y_data": [
+        {"name": "Bitcoin Price", "data": "price_close", "yaxis": "y"},
+        {"name": "Supply in Profit %", "data": "supply_in_profit_pct", "yaxis": "y2"},
+        {"name": "Supply in Loss %", "data": "supply_in_loss_pct", "yaxis": "y2"},
+    ],
+    "title": "Bitcoin Supply in Profit vs Loss",
+    "x_label": "Date",
+    "y1_label": "Bitcoin Price",
+    "y2_label": "% of Supply",
+    "filename": "Bitcoin_Supply_Profit_Loss",
+    "chart_type": "line",
+    "data_source": "Data Source: BRK",
+    "filter_start_date": "2010-07-01",
+    "events": BITCOIN_HISTORICAL_EVENTS,
+}
+
+# Hash Price Chart
+chart_hash_price = {
+    "x_data": "time",
+    "y1_type": "log",
+    "y2_type": "log",
+    "y_data": [
+        {"name": "Bitcoin Price", "data": "price_close", "yaxis": "y"},
+        {"name": "Hash Price ($/TH/s)", "data": "hash_price_ths", "yaxis": "y2"},
+    ],
+    "title": "Bitcoin Hash Price",
+    "x_label": "Date",
+    "y1_label": "Bitcoin Price",
+    "y2_label": "Hash Price ($/TH/s/day)",
+    "filename": "Bitcoin_Hash_Price",
+    "chart_type": "line",
+    "data_source": "Data Source: BRK",
+    "filter_start_date": "2010-07-01",
+    "events": BITCOIN_HISTORICAL_EVENTS,
+}
+
+# Difficulty Chart
+chart_difficulty = {
+    "x_data": "time",
+    "y1_type": "log",
+    "y2_type": "log",
+    "y_data": [
+        {"name": "Bitcoin Price", "data": "price_close", "yaxis": "y"},
+        {"name": "Difficulty", "data": "difficulty", "yaxis": "y2"},
+    ],
+    "title": "Bitcoin Network Difficulty",
+    "x_label": "Date",
+    "y1_label": "Bitcoin Price",
+    "y2_label": "Difficulty",
+    "filename": "Bitcoin_Difficulty",
+    "chart_type": "line",
+    "data_source": "Data Source: BRK",
+    "filter_start_date": "2010-07-01",
+    "events": BITCOIN_HISTORICAL_EVENTS,
+}
+
+_DATED_TEMPLATE_BUILDERS = {
+    "mtd_return": _mtd_return,
+    "ytd_return": _ytd_return,
+    "ytd_return_full": _ytd_return_full,
+}
+
+
+@functools.lru_cache(maxsize=1)
+def _dated_templates(today):
+    """Build the month- and year-dependent templates once per calendar day."""
+    return {name: build(today) for name, build in _DATED_TEMPLATE_BUILDERS.items()}
+
+
+# List Of All Chart Templates
+@functools.lru_cache(maxsize=1)
+def _chart_templates(today):
+    dated = _dated_templates(today)
+    return [
+        # === PRICE FUNDAMENTALS ===
+        chart_price,
+        chart_price_ma,
+        chart_sats_per_dollar,
+        chart_volatility,
+        # === SUPPLY METRICS ===
+        chart_supply,
+        macro_supply,
+        chart_1_year_supply,
+        chart_supply_age,
+        # === NETWORK ACTIVITY ===
+        chart_transactions,
+        chart_transaction_fee_USD,
+        chart_transferred_value,
+        chart_active_addresses,
+        chart_address_balance,
+        # === MINING & SECURITY ===
+        chart_hashrate,
+        chart_hashrate_price,
+        chart_hash_ribbons,
+        chart_difficulty,
+        chart_hash_price,
+        chart_miner_revenue,
+        chart_puell_multiple,
+        # === ON-CHAIN VALUATION ===
+        chart_thermocap_multiple,
+        chart_realizedcap_multiple,
+        chart_delta_cap,
+        chart_nvt_price,
+        chart_NUPL,
+        # === HOLDER BEHAVIOR ===
+        chart_adjusted_bdd,
+        chart_hodl_bank,
+        chart_sopr,
+        chart_supply_profit_loss,
+        # === PRICE MODELS ===
+        electricity_price,
+        chart_electricity_cost,
+        chart_power_law_model,
+        chart_metcalfe_model,
+        s2f_price,
+        # === ASSET COMPARISONS ===
+        chart_gold,
+        chart_rv_metals,
+        chart_equities,
+        chart_rv_stocks,
+        chart_rv_semiconductors,
+        chart_rv_financials,
+        chart_rv_sector_leaders,
+        chart_m0,
+        chart_rv_m0,
+        chart_on_chain,
+        chart_rv,
+        # === RETURNS & PERFORMANCE ===
+        yoy_return,
+        cagr_overview,
+        cagr_comparison,
+        dated["mtd_return"],
+        dated["ytd_return"],
+        dated["ytd_return_full"],
+        chart_promo,
+    ]
+
+
+def primary_series(template):
+    """
+    Return the ``y_data`` entry that best summarizes a chart.
+
+    An entry marked ``"primary": True`` wins. Otherwise a chart that overlays a
+    metric on the Bitcoin price is summarized by its first secondary-axis
+    series (the NUPL chart by NUPL, not price), and any other chart by its
+    first series.
+    """
+    y_data = template.get("y_data", [])
+    if not y_data:
+        return None
+    for series in y_data:
+        if series.get("primary"):
+            return series
+    if y_data[0]["data"] == "price_close":
+        for series in y_data[1:]:
+            if series.get("yaxis") == "y2":
+                return series
+    return y_data[0]
+
+
+def __getattr__(name):
+    """
+    Resolve date-dependent templates lazily (PEP 562).
+
+    ``mtd_return``, ``ytd_return``, ``ytd_return_full`` and ``chart_templates``
+    carry the current month or year in their titles and date filters. They used
+    to be frozen at import time; resolving them on access keeps long-running
+    processes such as the Dash server correct across a month or year boundary
+    and keeps the clock out of module import.
+    """
+    if name == "chart_templates":
+        return _chart_templates(datetime.date.today())
+    if name in _DATED_TEMPLATE_BUILDERS:
+        return _dated_templates(datetime.date.today())[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
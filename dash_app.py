@@ -1,34 +1,635 @@
 """
 Dash App Module - Bitcoin Chart Library Web Interface
 
-This module provides a simple Dash web application to display all generated
-Bitcoin analytics charts in a scrollable webpage.
+This module provides a Dash web application to browse the generated Bitcoin
+analytics charts one catalog category at a time. Pages are routed by URL
+(``/<category>`` or ``/chart/<filename>``) and each graph requests its figure
+through a callback once it is on the page, so the initial response carries no
+figure data and time-to-first-chart does not grow with the chart pack.
+
+Figures are serialized and gzip-compressed once, when they are registered in
+``figures``, and served from ``/figures/<filename>.json`` with a content-hash
+ETag. Reloading a page therefore costs conditional requests answered with 304
+rather than re-encoding every figure on every request.
+
+Long series are served coarse. Each trace longer than ``DASH_MAX_POINTS`` is
+kept at full resolution server-side as numpy arrays, and the served figure
+carries a downsampled copy. When the reader zooms or picks a range-selector
+button, the graph's ``relayoutData`` is answered with a ``Patch`` holding the
+visible window re-reduced to the same point budget.
+
+With ``DASH_LIVE_FEED`` set, the price trace additionally advances between
+builds: points from the live feed (see ``dash_live``) are appended to open
+graphs through ``extendData``.
 """
 
-from dash import Dash, html, dcc
+import base64
+import gzip
+import hashlib
+import os
+import re
+import threading
+import zlib
+from pathlib import Path
+from collections import OrderedDict
+from collections.abc import MutableMapping
+from dataclasses import dataclass
+
+import numpy as np
+import plotly.graph_objects as go
+import plotly.io as pio
+from dash import ALL, MATCH, Dash, Input, Output, Patch, State, dcc, html, no_update
+from flask import Response, abort, request
+
+from chart_catalog import CATEGORY_FILES
+from chart_format import read_figure_source
+from chart_resample import RESAMPLERS, window
+from dash_live import LIVE_SECONDS, live_trace_name
+
+try:  # Brotli is optional; gzip is always available.
+    import brotli
+except ImportError:
+    brotli = None
+
+# Upper bound on the compressed figure bytes kept in memory. Override with
+# DASH_FIGURE_CACHE_MB; evicted figures are re-serialized on their next request.
+FIGURE_CACHE_BYTES = int(float(os.environ.get("DASH_FIGURE_CACHE_MB", "256")) * 1024 * 1024)
+
+# Points per trace sent to the browser for any view, and the reduction used.
+# DASH_RESAMPLER is "lttb" (shape-preserving) or "minmax" (spike-preserving).
+MAX_POINTS = int(os.environ.get("DASH_MAX_POINTS", "2000"))
+RESAMPLER = os.environ.get("DASH_RESAMPLER", "lttb")
+
+# How often open pages ask whether their figures were rebuilt by the data
+# refresher (see dash_refresh). 0 disables polling.
+REFRESH_SECONDS = int(os.environ.get("DASH_REFRESH_SECONDS", "300"))
+
+
+@dataclass(frozen=True)
+class FigurePayload:
+    """A figure serialized to JSON and gzip-compressed, with its content hash."""
+
+    etag: str
+    body: bytes
+
+
+def _trace_array(values):
+    """
+    Return trace data as a numpy array.
+
+    Figures loaded from JSON carry numeric arrays as Plotly typed-array dicts
+    and dates as ISO strings; both are decoded so they resample like figures
+    built in-process.
+    """
+    if isinstance(values, dict) and "bdata" in values:
+        array = np.frombuffer(base64.b64decode(values["bdata"]), dtype=values["dtype"])
+        return array.reshape(values["shape"]) if "shape" in values else array
+    array = np.asarray(values)
+    if array.dtype.kind == "U":
+        try:
+            return array.astype("datetime64[ns]")
+        except ValueError:
+            return array
+    return array
+
+
+def _full_series(figure, max_points):
+    """Return ``(trace_index, x, y)`` arrays for traces too long to send whole."""
+    series = []
+    for index, trace in enumerate(figure.data):
+        if getattr(trace, "x", None) is None or getattr(trace, "y", None) is None:
+            continue
+        x = _trace_array(trace.x)
+        if len(x) <= max_points or x.dtype.kind in "OU":
+            continue
+        try:
+            y = _trace_array(trace.y).astype(np.float64)
+        except (TypeError, ValueError):
+            continue
+        if len(y) == len(x) and np.all(x[1:] >= x[:-1]):
+            series.append((index, x, y))
+    return series
+
+
+def _window_bound(value, dtype):
+    """Convert a Plotly axis range value to the dtype of a stored x array."""
+    if np.issubdtype(dtype, np.datetime64):
+        return np.datetime64(str(value).strip().replace(" ", "T")).astype(dtype)
+    return float(value)
+
+
+def serialize_figure(figure):
+    """Encode a figure once as gzip-compressed JSON keyed by its content hash."""
+    document = figure.to_json().encode("utf-8")
+    etag = hashlib.sha256(document).hexdigest()[:32]
+    return FigurePayload(etag=etag, body=gzip.compress(document, compresslevel=6))
+
+
+class FigureStore(MutableMapping):
+    """
+    Mapping of chart filename to figure that keeps a bounded payload cache.
+
+    Assigning a figure keeps its long traces at full resolution as numpy
+    arrays, replaces them with a downsampled copy, and serializes that coarse
+    figure immediately. Compressed payloads are held in least-recently-used
+    order and evicted once their total size exceeds ``max_bytes``; the coarse
+    figures are kept so an evicted payload can be rebuilt on demand.
+
+    Each figure's revision is the content hash of its first serialization.
+    ``replace`` swaps a batch of rebuilt figures in under one lock, so request
+    threads never observe a half-updated chart.
+    """
+
+    def __init__(self, max_bytes=FIGURE_CACHE_BYTES, max_points=MAX_POINTS, resampler=RESAMPLER):
+        self.max_bytes = max_bytes
+        self.max_points = max_points
+        self.resampler = RESAMPLERS[resampler]
+        self._lock = threading.RLock()
+        self._figures = {}
+        self._series = {}
+        self._revisions = {}
+        self._payloads = OrderedDict()
+        self._cached_bytes = 0
+        # Fingerprint of the master file the figures were built from, and the
+        # exported-figure directory they were loaded from, when known.
+        self.source = None
+        self.directory = None
+
+    def __getitem__(self, filename):
+        return self._figures[filename]
 
-# Global list populated by main.py with Plotly figure objects
-figures = []
+    def __setitem__(self, filename, figure):
+        self.replace({filename: figure})
+
+    def __delitem__(self, filename):
+        with self._lock:
+            del self._figures[filename]
+            del self._series[filename]
+            del self._revisions[filename]
+            self._evict(filename)
+
+    def __iter__(self):
+        return iter(list(self._figures))
+
+    def __len__(self):
+        return len(self._figures)
+
+    def _prepare(self, filename, figure):
+        series = _full_series(figure, self.max_points)
+        if series:
+            figure = go.Figure(figure)
+            for index, x, y in series:
+                figure.data[index].x, figure.data[index].y = self.resampler(x, y, self.max_points)
+        # Keep the reader's zoom when resampled data is patched in.
+        figure.layout.uirevision = filename
+        return figure, series, serialize_figure(figure)
+
+    def replace(self, updated):
+        """
+        Register several figures at once and swap them in atomically.
+
+        Serialization and downsampling happen before the lock is taken, so
+        readers keep receiving the previous figures until the swap.
+        """
+        prepared = {
+            filename: self._prepare(filename, figure) for filename, figure in updated.items()
+        }
+        with self._lock:
+            for filename, (figure, series, payload) in prepared.items():
+                self._figures[filename] = figure
+                self._series[filename] = series
+                self._revisions[filename] = payload.etag
+                self._cache(filename, payload)
+
+    def revision(self, filename):
+        """Return the content hash of the figure currently registered under a name."""
+        return self._revisions.get(filename)
+
+    def payload(self, filename):
+        """Return the cached payload for a figure, re-serializing it if evicted."""
+        with self._lock:
+            if filename in self._payloads:
+                self._payloads.move_to_end(filename)
+                return self._payloads[filename]
+            payload = serialize_figure(self._figures[filename])
+            self._cache(filename, payload)
+            return payload
+
+    def resample(self, filename, start=None, end=None):
+        """
+        Reduce a figure's long traces to the visible x window.
+
+        Parameters:
+        filename (str): Registered chart filename.
+        start, end: Axis range bounds as sent by Plotly, or ``None`` for the full range.
+
+        Returns:
+        list[tuple[int, np.ndarray, np.ndarray]]: ``(trace_index, x, y)`` per long trace.
+        """
+        reduced = []
+        for index, x, y in self._series.get(filename, []):
+            lower = None if start is None else _window_bound(start, x.dtype)
+            upper = None if end is None else _window_bound(end, x.dtype)
+            visible = window(x, lower, upper)
+            reduced.append((index, *self.resampler(x[visible], y[visible], self.max_points)))
+        return reduced
+
+    def _cache(self, filename, payload):
+        self._evict(filename)
+        self._payloads[filename] = payload
+        self._cached_bytes += len(payload.body)
+        while self._cached_bytes > self.max_bytes and len(self._payloads) > 1:
+            self._evict(next(iter(self._payloads)))
+
+    def _evict(self, filename):
+        payload = self._payloads.pop(filename, None)
+        if payload is not None:
+            self._cached_bytes -= len(payload.body)
+
+
+# Global store populated by main.py: chart filename -> Plotly figure object
+figures = FigureStore()
+
+# Live tail set by the entry point when DASH_LIVE_FEED is configured (see dash_live).
+live = None
+
+
+def load_figures(directory, store=None):
+    """
+    Register figures exported by ``main.py --export-figures``.
+
+    The source fingerprint recorded with them (see ``export_figure_source``)
+    and the directory are kept on the store, so the data refresher can tell
+    whether the figures are already current.
+
+    Parameters:
+    directory (str | Path): Directory of ``<filename>.json.gz`` figure artifacts.
+    store (FigureStore | None): Store to register into; ``figures`` by default.
+
+    Returns:
+    int: Number of figures registered.
+    """
+    store = figures if store is None else store
+    paths = sorted(Path(directory).glob("*.json.gz"))
+    loaded = {}
+    for path in paths:
+        with gzip.open(path, "rt", encoding="utf-8") as handle:
+            loaded[path.name.removesuffix(".json.gz")] = pio.from_json(handle.read())
+    store.replace(loaded)
+    store.source = read_figure_source(directory)
+    store.directory = str(directory)
+    return len(paths)
+
+
+# Response types worth compressing; images and fonts are already compressed.
+COMPRESSIBLE_MIMETYPES = {
+    "application/javascript",
+    "application/json",
+    "text/css",
+    "text/html",
+    "text/javascript",
+    "text/plain",
+}
+
+
+def enable_compression(server, minimum_size=1024, cache_entries=64):
+    """
+    Compress eligible responses with brotli (when installed) or gzip.
+
+    Responses that already carry a ``Content-Encoding``, such as the
+    precompressed figure payloads, pass through untouched. Compressed bodies
+    are cached by path and content checksum, so Dash's large static bundles
+    are compressed once per process rather than once per request.
+    """
+    compressed_bodies = OrderedDict()
+
+    @server.after_request
+    def compress(response):
+        if (
+            response.status_code != 200
+            or response.direct_passthrough
+            or "Content-Encoding" in response.headers
+            or response.mimetype not in COMPRESSIBLE_MIMETYPES
+        ):
+            return response
+        accepted = request.accept_encodings
+        encoding = "br" if brotli is not None and "br" in accepted else None
+        encoding = encoding or ("gzip" if "gzip" in accepted else None)
+        body = response.get_data()
+        if encoding is None or len(body) < minimum_size:
+            return response
+
+        key = (request.path, encoding, len(body), zlib.crc32(body))
+        if key in compressed_bodies:
+            compressed_bodies.move_to_end(key)
+        else:
+            compressed_bodies[key] = (
+                brotli.compress(body, quality=5)
+                if encoding == "br"
+                else gzip.compress(body, compresslevel=6)
+            )
+            if len(compressed_bodies) > cache_entries:
+                compressed_bodies.popitem(last=False)
+        response.set_data(compressed_bodies[key])
+        response.headers["Content-Encoding"] = encoding
+        response.vary.add("Accept-Encoding")
+        etag, weak = response.get_etag()
+        if etag and not weak:
+            # The entity tag described the uncompressed bytes.
+            response.set_etag(etag, weak=True)
+        return response
+
+    return server
+
+
+def _slug(category):
+    """Return the URL path segment for a catalog category."""
+    return re.sub(r"[^a-z0-9]+", "-", category.casefold()).strip("-")
+
+
+def _categories():
+    """Return catalog categories with the registered figures they contain."""
+    return {
+        category: [filename for filename in filenames if filename in figures]
+        for category, filenames in CATEGORY_FILES.items()
+        if any(filename in figures for filename in filenames)
+    }
+
+
+def _graph(filename):
+    """Return an empty graph placeholder whose figure is loaded on demand."""
+    return html.Div(
+        [
+            dcc.Store(
+                id={"type": "chart-revision", "index": filename},
+                data=figures.revision(filename),
+            ),
+            # Last live point sequence the graph holds; set once its figure loads.
+            dcc.Store(id={"type": "live-sequence", "index": filename}),
+            dcc.Loading(
+                dcc.Graph(
+                    id={"type": "chart-graph", "index": filename},
+                    config={"displaylogo": False},
+                )
+            ),
+        ]
+    )
+
+
+def _live_trace(filename):
+    """Return the index of a figure's live-tailed trace, or ``None``."""
+    name = live_trace_name(filename) if live is not None else None
+    if name is None or filename not in figures:
+        return None
+    for index, trace in enumerate(figures[filename].data):
+        if trace.name == name:
+            return index
+    return None
+
+
+def _live_points(filename, sequence, until=None):
+    """
+    Return live points past a figure's history for its live trace.
+
+    Returns:
+    tuple: ``(trace_index, x, y, latest_sequence)``, or ``None`` when the
+    figure has no live trace.
+    """
+    index = _live_trace(filename)
+    if index is None:
+        return None
+    history = _trace_array(figures[filename].data[index].x)
+    after = history[-1] if len(history) else None
+    return index, *live.since(sequence, after=after, until=until)
+
+
+def _extend_live(patched, filename, sequence):
+    """Re-append the live points a graph already had after its trace is replaced."""
+    if not sequence:
+        return patched
+    points = _live_points(filename, 0, until=sequence)
+    if points is not None and points[1]:
+        index, x, y, _ = points
+        patched["data"][index]["x"].extend(x)
+        patched["data"][index]["y"].extend(y)
+    return patched
+
+
+def _live_extension(filename, sequence):
+    """
+    Return the ``extendData`` update and new sequence for one open graph.
+
+    The trace is capped at the served point budget plus the live window, so a
+    page left open all day stays bounded.
+    """
+    points = None if sequence is None else _live_points(filename, sequence)
+    if points is None:
+        return no_update, no_update
+    index, x, y, latest = points
+    if not x:
+        return no_update, latest
+    return ({"x": [x], "y": [y]}, [index], figures.max_points + live.window), latest
+
+
+def _figure_patch(filename, relayout=None, sequence=None):
+    """
+    Return a Patch that moves an open graph onto the registered figure's data.
+
+    Only trace data and the title are sent. Long traces are re-reduced to the
+    reader's current x window when they have zoomed, and live points the graph
+    already showed are kept.
+    """
+    figure = figures[filename]
+    patched = Patch()
+    for index, trace in enumerate(figure.data):
+        patched["data"][index]["x"] = trace.x
+        patched["data"][index]["y"] = trace.y
+    x_range = _relayout_x_range(relayout)
+    if x_range is not None:
+        for index, x, y in figures.resample(filename, *x_range):
+            patched["data"][index]["x"] = x
+            patched["data"][index]["y"] = y
+    patched["layout"]["title"]["text"] = figure.layout.title.text
+    return _extend_live(patched, filename, sequence)
+
+
+def _page(pathname):
+    """Build the page content for a URL path without any figure data."""
+    categories = _categories()
+    if not categories:
+        return html.P("No charts have been registered.")
+
+    pathname = (pathname or "/").rstrip("/")
+    if pathname.startswith("/chart/"):
+        filename = pathname.removeprefix("/chart/")
+        if filename in figures:
+            return [html.H2(filename.replace("_", " ")), _graph(filename)]
+        return html.P(f"Chart “{filename}” was not found.")
+
+    by_slug = {_slug(category): category for category in categories}
+    category = by_slug.get(pathname.lstrip("/"), next(iter(categories)))
+    return [
+        html.H2(category),
+        *[
+            html.Div(
+                [
+                    dcc.Link("Open chart", href=f"/chart/{filename}"),
+                    _graph(filename),
+                ]
+            )
+            for filename in categories[category]
+        ],
+    ]
+
+
+def _relayout_x_range(relayout):
+    """
+    Extract the requested x window from a graph's ``relayoutData``.
+
+    Returns ``(start, end)``, ``(None, None)`` when the axis was reset to its
+    full range, or ``None`` when the event did not change the x axis.
+    """
+    relayout = relayout or {}
+    if relayout.get("xaxis.autorange"):
+        return None, None
+    if "xaxis.range" in relayout:
+        start, end = relayout["xaxis.range"]
+        return start, end
+    if "xaxis.range[0]" in relayout and "xaxis.range[1]" in relayout:
+        return relayout["xaxis.range[0]"], relayout["xaxis.range[1]"]
+    return None
 
 
 def generate_dash_app():
     """
-    Create and configure the Dash application with all charts.
+    Create and configure the Dash application with category routing.
 
     Returns:
-    Dash: Configured Dash app with layout containing all figures.
+    Dash: Configured Dash app whose pages load figures through callbacks.
     """
     app = Dash(__name__, suppress_callback_exceptions=True)
     app.layout = html.Div(
         [
+            dcc.Location(id="url"),
             html.H1("Bitcoin Chart Pack"),
-            html.Div(
-                id="content-area",
-                children=[
-                    dcc.Graph(id="graph-{}".format(i), figure=fig)
-                    for i, fig in enumerate(figures)
-                ],
+            html.Nav(
+                [
+                    dcc.Link(
+                        category,
+                        href=f"/{_slug(category)}",
+                        style={"marginRight": "1em"},
+                    )
+                    for category in _categories()
+                ]
+            ),
+            html.Div(id="content-area"),
+            dcc.Interval(
+                id="refresh-interval",
+                interval=max(REFRESH_SECONDS, 1) * 1000,
+                disabled=REFRESH_SECONDS <= 0,
+            ),
+            dcc.Interval(
+                id="live-interval",
+                interval=max(LIVE_SECONDS, 1) * 1000,
+                disabled=live is None,
             ),
         ]
     )
+
+    @app.callback(Output("content-area", "children"), Input("url", "pathname"))
+    def render_page(pathname):
+        return _page(pathname)
+
+    # Browsers revalidate with If-None-Match and reuse their cached body on 304.
+    # A loaded figure holds no live points yet, so its live sequence starts at 0.
+    figure_url = f"{app.config.requests_pathname_prefix}figures/"
+    app.clientside_callback(
+        f"""
+        function(graphId) {{
+            const url = '{figure_url}' + encodeURIComponent(graphId.index) + '.json';
+            const noUpdate = window.dash_clientside.no_update;
+            return fetch(url, {{cache: 'no-cache'}}).then(response => {{
+                if (!response.ok) return [noUpdate, noUpdate];
+                return response.json().then(figure => [figure, 0]);
+            }});
+        }}
+        """,
+        Output({"type": "chart-graph", "index": MATCH}, "figure"),
+        Output({"type": "live-sequence", "index": MATCH}, "data"),
+        Input({"type": "chart-graph", "index": MATCH}, "id"),
+    )
+
+    @app.callback(
+        Output({"type": "chart-graph", "index": MATCH}, "figure", allow_duplicate=True),
+        Input({"type": "chart-graph", "index": MATCH}, "relayoutData"),
+        State({"type": "live-sequence", "index": MATCH}, "data"),
+        State({"type": "chart-graph", "index": MATCH}, "id"),
+        prevent_initial_call=True,
+    )
+    def resample_view(relayout, sequence, graph_id):
+        x_range = _relayout_x_range(relayout)
+        if x_range is None:
+            return no_update
+        reduced = figures.resample(graph_id["index"], *x_range)
+        if not reduced:
+            return no_update
+        patched = Patch()
+        for index, x, y in reduced:
+            patched["data"][index]["x"] = x
+            patched["data"][index]["y"] = y
+        return _extend_live(patched, graph_id["index"], sequence)
+
+    @app.callback(
+        Output({"type": "chart-graph", "index": MATCH}, "figure", allow_duplicate=True),
+        Output({"type": "chart-revision", "index": MATCH}, "data"),
+        Input("refresh-interval", "n_intervals"),
+        State({"type": "chart-revision", "index": MATCH}, "data"),
+        State({"type": "chart-graph", "index": MATCH}, "relayoutData"),
+        State({"type": "live-sequence", "index": MATCH}, "data"),
+        State({"type": "chart-revision", "index": MATCH}, "id"),
+        prevent_initial_call=True,
+    )
+    def refresh_figure(_, revision, relayout, sequence, store_id):
+        filename = store_id["index"]
+        current = figures.revision(filename)
+        if current is None or current == revision:
+            return no_update, no_update
+        return _figure_patch(filename, relayout, sequence), current
+
+    @app.callback(
+        Output({"type": "chart-graph", "index": ALL}, "extendData"),
+        Output({"type": "live-sequence", "index": ALL}, "data", allow_duplicate=True),
+        Input("live-interval", "n_intervals"),
+        State({"type": "live-sequence", "index": ALL}, "data"),
+        State({"type": "live-sequence", "index": ALL}, "id"),
+        prevent_initial_call=True,
+    )
+    def extend_live(_, sequences, store_ids):
+        updates = [
+            _live_extension(store_id["index"], sequence)
+            for sequence, store_id in zip(sequences, store_ids)
+        ]
+        return [update for update, _ in updates], [sequence for _, sequence in updates]
+
+    @app.server.route(f"{app.config.routes_pathname_prefix}figures/<filename>.json")
+    def figure_json(filename):
+        if filename not in figures:
+            abort(404)
+        payload = figures.payload(filename)
+        compressed = "gzip" in request.accept_encodings
+        # Each encoding is a distinct representation and gets its own entity tag.
+        etag = f"{payload.etag}-gz" if compressed else payload.etag
+        response = Response(status=304, mimetype="application/json")
+        if not request.if_none_match.contains(etag):
+            if compressed:
+                response.set_data(payload.body)
+                response.headers["Content-Encoding"] = "gzip"
+            else:
+                response.set_data(gzip.decompress(payload.body))
+            response.status_code = 200
+        response.set_etag(etag)
+        response.headers["Cache-Control"] = "no-cache"
+        response.headers["Vary"] = "Accept-Encoding"
+        return response
+
     return app
@@ -0,0 +1,252 @@
+"""
+Live tail mode for the Bitcoin Chart Library dashboard.
+
+Daily builds give the dashboard its history. Between builds, live tail mode
+advances the Bitcoin price trace (``price_close``) from a local feed: new
+points are appended to the open graphs with ``extendData``, so the history is
+never sent again.
+
+A feed is anything with a ``read()`` method returning the ``(timestamp, value)``
+points received since the previous call. ``DASH_LIVE_FEED`` selects one:
+
+    DASH_LIVE_FEED=ticks.csv              # tail a local file
+    DASH_LIVE_FEED=tcp://127.0.0.1:9000   # read lines from a socket
+
+Both carry one ``timestamp,value`` line per point; the timestamp is ISO 8601 or
+Unix seconds, and lines that do not parse (such as a header) are skipped.
+
+Received points are kept in a bounded buffer of ``DASH_LIVE_WINDOW`` points.
+Each point's sequence number is its own timestamp (microseconds since the
+epoch), so every gunicorn worker tailing the same feed numbers it the same way.
+Each open graph remembers the last sequence it was sent and asks only for newer
+points every ``DASH_LIVE_SECONDS``, whichever worker answers.
+"""
+
+import collections
+import datetime
+import os
+import socket
+import threading
+import time
+
+import numpy as np
+
+import chart_templates
+
+LIVE_METRIC = "price_close"
+LIVE_FEED = os.environ.get("DASH_LIVE_FEED", "")
+LIVE_WINDOW = int(os.environ.get("DASH_LIVE_WINDOW", "1440"))
+LIVE_SECONDS = float(os.environ.get("DASH_LIVE_SECONDS", "5"))
+
+
+def parse_point(line):
+    """Parse a ``timestamp,value`` line, returning ``None`` when it is not a point."""
+    if isinstance(line, bytes):
+        line = line.decode("utf-8", "replace")
+    fields = line.strip().split(",")
+    if len(fields) != 2:
+        return None
+    stamp, value = (field.strip() for field in fields)
+    try:
+        try:
+            moment = datetime.datetime.fromtimestamp(float(stamp), datetime.UTC)
+        except ValueError:
+            moment = datetime.datetime.fromisoformat(stamp)
+        if moment.tzinfo is not None:
+            moment = moment.astimezone(datetime.UTC).replace(tzinfo=None)
+        return np.datetime64(moment, "us"), float(value)
+    except (OverflowError, ValueError):
+        return None
+
+
+class FileTailFeed:
+    """
+    Read points appended to a local file, restarting if it is truncated.
+
+    The first read starts at the last ``backlog`` complete lines rather than
+    replaying the whole file, since a ``LiveTail`` keeps no more points than that.
+    """
+
+    def __init__(self, path, backlog=LIVE_WINDOW):
+        self.path = path
+        self.backlog = backlog
+        self._offset = None
+        self._partial = b""
+
+    def _backlog_offset(self, handle, size, block=64 * 1024):
+        """Return the offset where the file's last ``backlog`` complete lines start."""
+        newlines, position = 0, size
+        while position > 0:
+            start = max(position - block, 0)
+            handle.seek(start)
+            chunk = handle.read(position - start)
+            end = len(chunk)
+            while (index := chunk.rfind(b"\n", 0, end)) >= 0:
+                # The newline ending the line before the backlog marks its start.
+                newlines += 1
+                if newlines > self.backlog:
+                    return start + index + 1
+                end = index
+            position = start
+        return 0
+
+    def read(self):
+        try:
+            size = os.path.getsize(self.path)
+        except FileNotFoundError:
+            return []
+        if self._offset is not None and size < self._offset:
+            self._offset, self._partial = 0, b""
+        with open(self.path, "rb") as handle:
+            if self._offset is None:
+                self._offset = self._backlog_offset(handle, size)
+            handle.seek(self._offset)
+            data = handle.read()
+        self._offset += len(data)
+        lines = (self._partial + data).split(b"\n")
+        self._partial = lines.pop()
+        return [point for point in map(parse_point, lines) if point is not None]
+
+
+class SocketFeed:
+    """Read newline-delimited points from a TCP publisher, reconnecting on errors."""
+
+    def __init__(self, host, port, retry_seconds=5.0):
+        self.address = (host, port)
+        self.retry_seconds = retry_seconds
+        self._received = collections.deque()
+        self._thread = None
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._receive, name="chart-live-socket", daemon=True
+            )
+            self._thread.start()
+
+    def _receive(self):
+        while True:
+            try:
+                with socket.create_connection(self.address) as connection:
+                    for line in connection.makefile("rb"):
+                        point = parse_point(line)
+                        if point is not None:
+                            self._received.append(point)
+            except OSError:
+                pass
+            time.sleep(self.retry_seconds)
+
+    def read(self):
+        points = []
+        while self._received:
+            points.append(self._received.popleft())
+        return points
+
+
+def open_feed(spec):
+    """Return the feed described by ``DASH_LIVE_FEED``-style text, or ``None``."""
+    if not spec:
+        return None
+    if spec.startswith("tcp://"):
+        host, _, port = spec.removeprefix("tcp://").rpartition(":")
+        return SocketFeed(host or "127.0.0.1", int(port))
+    return FileTailFeed(spec.removeprefix("file:"))
+
+
+class LiveTail:
+    """
+    Bounded buffer of live points, filled from a feed by a daemon thread.
+
+    A point's sequence number is its timestamp in microseconds since the epoch,
+    so clients can ask any process tailing the same feed for what they have not
+    seen yet. Points not later than the previous one are dropped. Only the
+    latest ``window`` points are kept.
+    """
+
+    def __init__(self, feed, window=LIVE_WINDOW, poll_seconds=LIVE_SECONDS):
+        self.feed = feed
+        self.window = window
+        self.poll_seconds = poll_seconds
+        self._points = collections.deque(maxlen=window)
+        self._sequence = 0
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+
+    @property
+    def sequence(self):
+        return self._sequence
+
+    def poll(self):
+        """Move newly received points into the buffer and return how many arrived."""
+        arrived = 0
+        with self._lock:
+            for x, y in self.feed.read():
+                number = int(x.astype("datetime64[us]").astype(np.int64))
+                if number <= self._sequence:
+                    continue
+                self._sequence = number
+                self._points.append((number, x, y))
+                arrived += 1
+        return arrived
+
+    def since(self, sequence, after=None, until=None):
+        """
+        Return buffered points newer than a client's sequence number.
+
+        Parameters:
+        sequence (int): Last sequence the client received, possibly from
+            another worker; 0 for none.
+        after (np.datetime64 | None): Only return points later than this,
+            typically the end of the figure's history.
+        until (int | None): Only return points up to this sequence.
+
+        Returns:
+        tuple[list[str], list[float], int]: ISO timestamps, values, and the
+        latest sequence number. A client ahead of this process keeps its own.
+        """
+        with self._lock:
+            latest = max(self._sequence, sequence)
+            points = list(self._points)
+        until = latest if until is None else until
+        selected = [
+            (x, y)
+            for number, x, y in points
+            if sequence < number <= until and (after is None or x > after)
+        ]
+        return (
+            [str(np.datetime_as_string(x, unit="s")) for x, _ in selected],
+            [y for _, y in selected],
+            latest,
+        )
+
+    def start(self):
+        """Start reading the feed in the background and return the tail."""
+        if hasattr(self.feed, "start"):
+            self.feed.start()
+        threading.Thread(target=self._run, name="chart-live-tail", daemon=True).start()
+        return self
+
+    def _run(self):
+        while not self._stopped.is_set():
+            self.poll()
+            self._stopped.wait(self.poll_seconds)
+
+    def stop(self):
+        self._stopped.set()
+
+
+def open_live_tail(spec=LIVE_FEED):
+    """Return an unstarted ``LiveTail`` for ``DASH_LIVE_FEED``, or ``None`` when unset."""
+    feed = open_feed(spec)
+    return None if feed is None else LiveTail(feed)
+
+
+def live_trace_name(filename):
+    """Return the name of the live-tailed trace in a chart, or ``None``."""
+    for template in chart_templates.chart_templates:
+        if template["filename"] != filename:
+            continue
+        for series in template["y_data"]:
+            if series["data"] == LIVE_METRIC:
+                return series.get("name", series["data"])
+    return None
@@ -0,0 +1,247 @@
+"""
+Background data refresh for the Bitcoin Chart Library dashboard.
+
+A running dashboard keeps serving the figures it was started with. The
+refresher polls the master CSV under ``REPORT_CSV_DIR`` and, when the file
+changes, rebuilds only the registered figures whose inputs changed and swaps
+them into ``dash_app.figures`` in one step. Open pages notice the new revision
+on their next poll and receive the new trace data as a ``Patch``.
+
+Change detection is layered so the common "nothing changed" poll is cheap:
+
+1. Source signature: ``(mtime, size)`` for a local file, or the ``ETag`` /
+   ``Last-Modified`` headers of a ``HEAD`` request for a URL.
+2. Local files whose signature moved are hashed, so a touch without new
+   content does not trigger a reload.
+3. After a reload, each template is fingerprinted from the columns it plots
+   and its date-dependent settings; only templates whose fingerprint changed
+   are re-rendered.
+
+The first check rebuilds every registered figure unless the store records the
+``source_fingerprint`` of the master file they were built from and it still
+matches. ``main.py`` records it for the figures it just built, and
+``--export-figures`` writes it beside the exported ones. The recorded state only
+advances once a rebuild has succeeded, so a failed or partial read is retried
+on the next poll.
+
+Under ``dash_serve`` every worker has its own copy of the figures. Only the
+worker holding the figure directory's lock reads the master file; it writes
+rebuilt figures back to the directory, and the other workers reload them from
+there (``FigureReloader``) instead of parsing the file themselves.
+"""
+
+import hashlib
+import os
+import threading
+import warnings
+
+import pandas as pd
+
+import chart_templates
+import dash_app
+from chart_data import MASTER_CSV, load_master_metrics, source_fingerprint, source_signature
+from chart_definitions import csv_path, csv_source_is_remote
+from chart_format import (
+    create_line_chart,
+    export_figure_json,
+    export_figure_source,
+    read_figure_source,
+)
+
+# Held by the one dash_serve worker that refreshes an exported-figure directory.
+REFRESH_LOCK = ".refresh.lock"
+# Lock files stay open for the life of the process that took them.
+_held_locks = []
+
+
+def file_digest(filename=MASTER_CSV):
+    """Return the SHA-256 of a local Report Library file."""
+    digest = hashlib.sha256()
+    with open(csv_path(filename), "rb") as handle:
+        for block in iter(lambda: handle.read(1024 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def column_digests(frame, columns):
+    """Hash each column (with its index) so changed metrics can be identified."""
+    digests = {}
+    for column in columns:
+        if column not in frame.columns:
+            digests[column] = None
+            continue
+        hashed = pd.util.hash_pandas_object(frame[column], index=True).to_numpy()
+        digests[column] = hashlib.sha1(hashed.tobytes()).hexdigest()
+    return digests
+
+
+def template_digest(template, digests):
+    """Fingerprint a template from its plotted columns and dated settings."""
+    parts = [template["title"], str(template.get("filter_start_date"))]
+    parts.extend(f"{series['data']}={digests.get(series['data'])}" for series in template["y_data"])
+    return hashlib.sha1("\n".join(parts).encode("utf-8")).hexdigest()
+
+
+class _Poller(threading.Thread):
+    """Daemon thread that calls ``check`` every ``interval`` seconds until stopped."""
+
+    def __init__(self, name, store, interval):
+        super().__init__(name=name, daemon=True)
+        self.store = dash_app.figures if store is None else store
+        self.interval = dash_app.REFRESH_SECONDS if interval is None else interval
+        self._stopped = threading.Event()
+
+    def run(self):
+        while True:
+            try:
+                self.check()
+            except Exception as error:  # keep serving the previous figures
+                warnings.warn(f"Chart data refresh failed: {error}", RuntimeWarning)
+            if self._stopped.wait(self.interval):
+                return
+
+    def stop(self):
+        self._stopped.set()
+
+
+class DataRefresher(_Poller):
+    """
+    Daemon thread that rebuilds changed dashboard figures in the background.
+
+    With ``figure_dir`` set, rebuilt figures and their source fingerprint are
+    also exported there for ``FigureReloader`` threads in other processes.
+    """
+
+    def __init__(self, store=None, interval=None, figure_dir=None):
+        super().__init__("chart-data-refresher", store, interval)
+        self.figure_dir = figure_dir
+        self._signature = None
+        self._file_digest = None
+        self._template_digests = None
+
+    def _templates(self):
+        return {
+            template["filename"]: template
+            for template in chart_templates.chart_templates
+            if template["filename"] in self.store
+        }
+
+    def check(self):
+        """
+        Reload the master CSV if it changed and rebuild affected figures.
+
+        Returns:
+        list[str]: Filenames of the figures that were rebuilt.
+        """
+        signature = source_signature()
+        if signature == self._signature:
+            return []
+        digest = None
+        if not csv_source_is_remote():
+            digest = file_digest()
+            if digest == self._file_digest:
+                self._signature = signature
+                return []
+        # Taken before the read: if the file changes mid-read, the next poll
+        # sees a new signature and reads it again.
+        source = source_fingerprint()
+
+        templates = self._templates()
+        columns = {series["data"] for template in templates.values() for series in template["y_data"]}
+        frame = load_master_metrics(columns)
+        digests = column_digests(frame, columns)
+        fingerprints = {
+            filename: template_digest(template, digests)
+            for filename, template in templates.items()
+        }
+        previous = self._template_digests
+        if previous is None and self.store.source == source:
+            # The registered figures were built from this very file.
+            previous = fingerprints
+
+        rebuilt = {}
+        for filename, fingerprint in fingerprints.items():
+            if previous is not None and previous.get(filename) == fingerprint:
+                continue
+            try:
+                rebuilt[filename] = create_line_chart(templates[filename], frame)
+            except (KeyError, ValueError) as error:
+                warnings.warn(f"Keeping the previous {filename} figure: {error}", RuntimeWarning)
+        self.store.replace(rebuilt)
+        if self.figure_dir is not None and (rebuilt or self.store.source != source):
+            for filename, figure in rebuilt.items():
+                export_figure_json(figure, filename, self.figure_dir)
+            # Written last: other workers reload once the fingerprint moves.
+            export_figure_source(source, self.figure_dir)
+        self.store.source = source
+        self._signature, self._file_digest = signature, digest
+        self._template_digests = fingerprints
+        return sorted(rebuilt)
+
+
+class FigureReloader(_Poller):
+    """
+    Daemon thread that reloads figures another process exported.
+
+    Used by the ``dash_serve`` workers that do not hold the refresh lock: when
+    the directory's recorded source fingerprint moves, every artifact is
+    reloaded. Figures whose content did not change keep their revision, so open
+    pages are only patched for charts that were rebuilt.
+    """
+
+    def __init__(self, store=None, interval=None, figure_dir=None):
+        super().__init__("chart-figure-reloader", store, interval)
+        self.figure_dir = self.store.directory if figure_dir is None else figure_dir
+
+    def check(self):
+        """
+        Reload the exported figures if their recorded source changed.
+
+        Returns:
+        list[str]: Filenames whose revision changed.
+        """
+        source = read_figure_source(self.figure_dir)
+        if source is None or source == self.store.source:
+            return []
+        before = {filename: self.store.revision(filename) for filename in self.store}
+        dash_app.load_figures(self.figure_dir, self.store)
+        return sorted(
+            filename for filename in self.store if self.store.revision(filename) != before.get(filename)
+        )
+
+
+def _take_refresh_lock(directory):
+    """Return True if this process now holds ``directory``'s refresh lock."""
+    import fcntl  # dash_serve runs under gunicorn, which is POSIX-only
+
+    handle = open(os.path.join(directory, REFRESH_LOCK), "a")
+    try:
+        fcntl.flock(handle, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except BlockingIOError:
+        handle.close()
+        return False
+    _held_locks.append(handle)
+    return True
+
+
+def start_data_refresher(store=None, interval=None):
+    """
+    Start a refresher for the dashboard, or return ``None`` when disabled.
+
+    A store loaded from exported figures gets a ``DataRefresher`` that exports
+    its rebuilds if this process takes the directory's refresh lock, and a
+    ``FigureReloader`` otherwise.
+    """
+    store = dash_app.figures if store is None else store
+    interval = dash_app.REFRESH_SECONDS if interval is None else interval
+    if interval <= 0:
+        return None
+    directory = store.directory
+    if directory is None:
+        refresher = DataRefresher(store, interval)
+    elif _take_refresh_lock(directory):
+        refresher = DataRefresher(store, interval, figure_dir=directory)
+    else:
+        refresher = FigureReloader(store, interval, figure_dir=directory)
+    refresher.start()
+    return refresher
@@ -0,0 +1,126 @@
+"""
+Production serving for the Bitcoin Chart Library dashboard.
+
+``SERVE_DASH=1 python main.py`` runs Dash's single-threaded development server
+and rebuilds every chart first. This entry point instead serves figures that a
+previous build exported, under gunicorn with several worker processes and
+compressed responses:
+
+    python main.py --export-figures
+    uv run --no-sync --with gunicorn python dash_serve.py --workers 4
+
+Figures are loaded once in the gunicorn master before workers fork
+(``preload_app``), so every worker shares the same pre-built figure data rather
+than loading or recomputing it per process.
+
+Worker count: ``--workers`` wins, then the ``WEB_CONCURRENCY`` environment
+variable, then ``2 × CPU cores + 1`` capped at 8, gunicorn's usual starting
+point: two workers per core keep each core busy while one worker writes a
+response, and the cap bounds memory on large hosts, since every worker holds
+its own figure store once it refreshes. Raise ``--threads`` rather than
+workers when readers mostly wait on the network.
+
+Threads do not survive ``fork``, so refresh threads start in each worker after
+forking (see ``dash_refresh.py``). One worker takes the figure directory's lock,
+re-reads the master file when it changes and exports the rebuilt figures; the
+others reload those artifacts rather than parsing the master file themselves.
+Exported figures older than the source are rebuilt on the first check. Set
+``DASH_REFRESH_SECONDS=0`` to serve the exported figures unchanged. Likewise
+each worker tails the live feed (see ``dash_live.py``) itself. Points are
+numbered by their own timestamps, so a page polling different workers neither
+repeats nor skips points; a socket publisher must send each connection the same
+lines.
+"""
+
+import argparse
+import os
+import sys
+
+DEFAULT_FIGURE_DIR = "build/figures"
+
+
+def default_workers():
+    """Return the worker count from WEB_CONCURRENCY, else 2 x CPU cores + 1 up to 8."""
+    if os.environ.get("WEB_CONCURRENCY"):
+        return int(os.environ["WEB_CONCURRENCY"])
+    return min(2 * (os.cpu_count() or 1) + 1, 8)
+
+
+def create_server(figure_dir=DEFAULT_FIGURE_DIR):
+    """Build the compressed Flask server with figures loaded from build artifacts."""
+    import dash_app
+    from dash_app import enable_compression, generate_dash_app, load_figures
+    from dash_live import open_live_tail
+
+    if not load_figures(figure_dir):
+        raise SystemExit(
+            f"No figure artifacts found in {figure_dir}. "
+            "Run `python main.py --export-figures` first."
+        )
+    # Opened here so pages include the live interval; started per worker after fork.
+    dash_app.live = open_live_tail()
+    app = generate_dash_app()
+    return enable_compression(app.server)
+
+
+def start_worker_threads(server, worker):
+    """Gunicorn ``post_fork`` hook: start the refresh thread and live tail in each worker."""
+    import dash_app
+    from dash_refresh import start_data_refresher
+
+    start_data_refresher()
+    if dash_app.live is not None:
+        dash_app.live.start()
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Serve the chart dashboard under gunicorn with compression."
+    )
+    parser.add_argument("--figure-dir", default=DEFAULT_FIGURE_DIR)
+    parser.add_argument("--bind", default="127.0.0.1:8080")
+    parser.add_argument("--workers", type=int, default=default_workers())
+    parser.add_argument("--threads", type=int, default=1)
+    parser.add_argument("--timeout", type=int, default=60)
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    try:
+        from gunicorn.app.base import BaseApplication
+    except ImportError:
+        sys.exit(
+            "dash_serve.py requires gunicorn (Linux/macOS): "
+            "uv run --no-sync --with gunicorn python dash_serve.py"
+        )
+
+    class DashServer(BaseApplication):
+        def __init__(self, application, options):
+            self.application = application
+            self.options = options
+            super().__init__()
+
+        def load_config(self):
+            for key, value in self.options.items():
+                self.cfg.set(key, value)
+
+        def load(self):
+            return self.application
+
+    server = create_server(args.figure_dir)
+    DashServer(
+        server,
+        {
+            "bind": args.bind,
+            "workers": args.workers,
+            "threads": args.threads,
+            "timeout": args.timeout,
+            "preload_app": True,
+            "post_fork": start_worker_threads,
+        },
+    ).run()
+
+
+if __name__ == "__main__":
+    main()
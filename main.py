@@ -7,30 +7,62 @@ and generates interactive HTML charts and optional Dash dashboards.
 Data source:
   Default — GitHub Pages: https://secretsatoshis.github.io/Bitcoin-Report-Library/csv/
   Local   — set REPORT_CSV_DIR=../Bitcoin-Report-Library/csv
+
+Selective builds render only the named charts or categories and refresh their
+catalog.json entries in place:
+
+    python main.py --only Bitcoin_Price,Bitcoin_RV
+    python main.py --category "Mining and Security"
 """
 
+import argparse
 import os
 import sys
+import time
+import tracemalloc
 import warnings
 
-import pandas as pd
-
 sys.dont_write_bytecode = True
 
+import pandas as pd
+
 from chart_format import (
     create_charts,
-    chart_templates,
-    chart_drawdowns,
-    chart_halvings,
-    chart_cycle_lows,
+    export_figure_json,
+    export_figure_source,
     create_days_since_chart,
     create_monthly_returns,
     create_indexed_monthly_returns,
     create_yearly_returns,
     create_indexed_yearly_returns,
 )
+from chart_templates import (
+    chart_templates,
+    chart_drawdowns,
+    chart_halvings,
+    chart_cycle_lows,
+)
+from chart_data import (
+    CYCLE_LOW_CSV,
+    DRAWDOWN_CSV,
+    HALVING_CSV,
+    INGEST_CACHE_DIR,
+    MASTER_CSV,
+    MASTER_ENGINES,
+    InputLoadError,
+    compact_master_frame,
+    latest_metric_summaries,
+    load_inputs,
+    read_csv_header,
+    resolve_master_format,
+    source_fingerprint,
+    source_signature,
+    template_metric_gaps,
+)
 from chart_definitions import csv_path, csv_source_is_remote
-from chart_catalog import build_chart_catalog
+from chart_catalog import CATEGORY_FILES, build_chart_catalog, update_chart_catalog
+from chart_polars import PolarsMaster
+from chart_store import STORE_PATH, MetricStore
 
 # Dash is only needed for the optional local preview server, so it is imported lazily
 # inside the serve branch rather than at module load — CI installs and imports it on
@@ -39,76 +71,489 @@ from chart_catalog import build_chart_catalog
 # Ignore any FutureWarnings
 warnings.simplefilter(action="ignore", category=FutureWarning)
 
-# --- Load Pre-Computed Data from Report Library --- #
+# Cycle charts, in render order, with the Report Library CSV each one plots.
+CYCLE_CHARTS = [
+    (chart_drawdowns, DRAWDOWN_CSV),
+    (chart_cycle_lows, CYCLE_LOW_CSV),
+    (chart_halvings, HALVING_CSV),
+]
+
+# Return-comparison charts built directly from the Bitcoin price history.
+RETURN_CHARTS = {
+    "MTD_Return_By_Year_Percentage": create_monthly_returns,
+    "Bitcoin_MTD_Return_By_Month_Indexed": create_indexed_monthly_returns,
+    "Bitcoin_YTD_Return_By_Year_Percentage": create_yearly_returns,
+    "Bitcoin_YTD_Return_By_Year_Indexed": create_indexed_yearly_returns,
+}
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Render the Bitcoin chart pack from Report Library CSVs."
+    )
+    parser.add_argument(
+        "--only",
+        action="append",
+        default=[],
+        metavar="FILENAME[,FILENAME...]",
+        help="Render only these charts (catalog filenames without .html).",
+    )
+    parser.add_argument(
+        "--category",
+        action="append",
+        default=[],
+        metavar="CATEGORY",
+        help="Render every chart in this catalog category. May be repeated.",
+    )
+    parser.add_argument(
+        "--export-figures",
+        nargs="?",
+        const="build/figures",
+        metavar="DIR",
+        help=(
+            "Also write each template figure as gzip JSON for dash_serve.py "
+            "(default directory: build/figures)."
+        ),
+    )
+    parser.add_argument(
+        "--incremental",
+        nargs="?",
+        const=INGEST_CACHE_DIR,
+        metavar="DIR",
+        help=(
+            "Keep the parsed master frame in DIR and parse only rows added since "
+            f"the last run (default directory: {INGEST_CACHE_DIR})."
+        ),
+    )
+    parser.add_argument(
+        "--engine",
+        choices=MASTER_ENGINES,
+        default="c",
+        help=(
+            "CSV parser for the master file: pandas' C parser, or pyarrow's "
+            "multithreaded parser with a schema derived from the chart templates."
+        ),
+    )
+    parser.add_argument(
+        "--metric-store",
+        nargs="?",
+        const=STORE_PATH,
+        metavar="PATH",
+        help=(
+            "Ingest the master CSV into a SQLite store when it changed and render "
+            f"charts from indexed queries (default path: {STORE_PATH})."
+        ),
+    )
+    parser.add_argument(
+        "--polars",
+        action="store_true",
+        help=(
+            "Scan the master CSV lazily with Polars instead of loading it: each chart "
+            "reads only its metrics and date window (needs the optional polars package)."
+        ),
+    )
+    parser.add_argument(
+        "--trace-memory",
+        action="store_true",
+        help=(
+            "Also report Python allocations traced by tracemalloc after each stage "
+            "(slows the build)."
+        ),
+    )
+    parser.add_argument(
+        "--verify-outputs",
+        action="store_true",
+        help="Re-read every chart document and check it against the render manifest.",
+    )
+    args = parser.parse_args(argv)
+
+    registered = {name for names in CATEGORY_FILES.values() for name in names}
+    selected = set()
+    for value in args.only:
+        selected.update(name.strip() for name in value.split(",") if name.strip())
+    unknown = sorted(selected - registered)
+    if unknown:
+        parser.error(f"unknown chart filename(s): {', '.join(unknown)}")
+    for category in args.category:
+        if category not in CATEGORY_FILES:
+            parser.error(
+                f"unknown category {category!r}; choose from: {', '.join(CATEGORY_FILES)}"
+            )
+        selected.update(CATEGORY_FILES[category])
+
+    if args.polars and (args.incremental or args.metric_store):
+        parser.error("--polars scans the source directly; drop --incremental/--metric-store")
+
+    args.selected = selected or None
+    return args
+
+
+def required_inputs(selected, templates=None):
+    """
+    Resolve the inputs needed to render a set of charts.
+
+    Parameters:
+    selected (set[str] | None): Chart filenames to render, or ``None`` for all.
+    templates (list[dict] | None): Line chart templates; defaults to ``chart_templates``.
+
+    Returns:
+    tuple: ``(master_columns, cycle_csvs)`` where ``master_columns`` is the set
+    of master metrics the charts read (metrics no chart plots are never
+    loaded) and ``cycle_csvs`` lists the cycle CSVs to load.
+    """
+    templates = chart_templates if templates is None else templates
+
+    def wanted(filename):
+        return selected is None or filename in selected
+
+    columns = set(non_template_metrics(selected))
+    for template in templates:
+        if wanted(template["filename"]):
+            columns.update(series["data"] for series in template["y_data"])
+
+    cycle_csvs = [
+        filename for template, filename in CYCLE_CHARTS if wanted(template["filename"])
+    ]
+    return columns, cycle_csvs
+
+
+def non_template_metrics(selected):
+    """
+    Return the master metrics read by selected charts that have no line template.
+
+    Parameters:
+    selected (set[str] | None): Chart filenames to render, or ``None`` for all.
 
-master_csv = csv_path("master_metrics_data.csv.gz")
+    Returns:
+    dict: ``metric -> [chart filename, ...]`` for the cycle charts scaled to the
+    Bitcoin price and the return-comparison charts.
+    """
+    metrics = {}
+    for template, _ in CYCLE_CHARTS:
+        price_scale = template.get("price_scale")
+        if price_scale and (selected is None or template["filename"] in selected):
+            price_col = price_scale.get("price_col", "price_close")
+            metrics.setdefault(price_col, []).append(template["filename"])
+    for filename in RETURN_CHARTS:
+        if selected is None or filename in selected:
+            metrics.setdefault("price_close", []).append(filename)
+    return metrics
 
-try:
-    report_data = pd.read_csv(master_csv, index_col=0, parse_dates=True, low_memory=False)
-except Exception as e:
-    if csv_source_is_remote():
+
+def _exit_on_input_error(filename, error):
+    """Print guidance for an input that could not be read, then exit."""
+    path = csv_path(filename)
+    if isinstance(error, ImportError):
+        print(f"Error: {error}")
+    elif csv_source_is_remote():
         print(
-            f"Error: Could not fetch {master_csv}\n"
-            f"  {e}\n"
+            f"Error: Could not fetch {path}\n"
+            f"  {error}\n"
             "Ensure the Bitcoin-Report-Library GitHub Pages site is deployed."
         )
     else:
         print(
-            f"Error: {master_csv} not found.\n"
+            f"Error: {path} not found.\n"
             "Run Bitcoin-Report-Library/main.py first to generate data."
         )
     sys.exit(1)
 
-drawdown_data = pd.read_csv(csv_path("drawdown_data.csv"))
-cycle_low_data = pd.read_csv(csv_path("cycle_low_data.csv"))
-halving_data = pd.read_csv(csv_path("halving_data.csv"))
 
-# --- Chart Creation --- #
+def preflight_master_header(selected, templates=None, master_format=None):
+    """
+    Check the master header against every selected chart before loading data.
 
-create_days_since_chart(drawdown_data, chart_drawdowns)
-create_days_since_chart(cycle_low_data, chart_cycle_lows, report_data)
-create_days_since_chart(halving_data, chart_halvings)
-create_monthly_returns(report_data)
-create_indexed_monthly_returns(report_data)
-create_yearly_returns(report_data)
-create_indexed_yearly_returns(report_data)
+    Only the header is read, so a renamed or unpublished metric stops the run
+    within seconds instead of after the full parse and the charts rendered
+    before it. The header checked is that of the format the run will load:
+    ``master_format`` is a ``resolve_master_format()`` result, whose shard
+    manifest or columnar schema already lists the columns; for the CSV, or
+    when it is ``None``, the CSV's first line is read (see ``read_csv_header``).
+    Every missing required metric is listed at once before exiting; missing
+    optional metrics are reported and their series are skipped when the
+    charts render.
 
-generated_figures = create_charts(report_data, chart_templates)
+    Returns:
+    list[str]: The master header.
+    """
+    templates = chart_templates if templates is None else templates
+    selected_templates = [
+        template
+        for template in templates
+        if selected is None or template["filename"] in selected
+    ]
+    filename, header, _ = master_format or (MASTER_CSV, None, None)
+    started = time.perf_counter()
+    if header is None:
+        try:
+            header = read_csv_header(MASTER_CSV)
+        except OSError as e:
+            _exit_on_input_error(MASTER_CSV, e)
+    missing_required, missing_optional = template_metric_gaps(
+        header, selected_templates, non_template_metrics(selected)
+    )
+    elapsed = time.perf_counter() - started
+
+    for metric, filenames in missing_optional.items():
+        print(
+            f"Warning: optional metric {metric!r} is not published; "
+            f"skipped in {', '.join(filenames)}"
+        )
+    if missing_required:
+        print(
+            f"Error: {filename} is missing {len(missing_required)} metric(s) "
+            "required by the selected charts:"
+        )
+        for metric, filenames in missing_required.items():
+            print(f"  {metric} (used by {', '.join(filenames)})")
+        print(f"Checked its header in {elapsed:.2f}s; no data was loaded.")
+        sys.exit(1)
+    print(f"Checked {filename} header in {elapsed:.2f}s")
+    return header
+
+
+def load_report_data(
+    columns=None, cycle_csvs=(), ingest_dir=None, engine="c", master_format=None
+):
+    """
+    Load the master metrics frame and cycle CSVs concurrently.
+
+    ``columns`` is the master projection from ``required_inputs``; an empty set
+    skips the master file, ``ingest_dir`` loads it incrementally, ``engine``
+    selects its parser, and ``master_format`` is the format the header check
+    resolved. Exits with guidance when an input is unavailable.
+
+    Returns:
+    tuple: ``(report_data, cycle_data)``.
+    """
+    load_master = columns is None or bool(columns)
+    try:
+        report_data, cycle_data, timings = load_inputs(
+            columns,
+            cycle_csvs,
+            load_master,
+            ingest_dir,
+            engine,
+            cycle_templates={filename: template for template, filename in CYCLE_CHARTS},
+            master_format=master_format,
+        )
+    except InputLoadError as e:
+        _exit_on_input_error(e.filename, e.__cause__)
+    for filename, seconds in timings.items():
+        print(f"Loaded {filename} in {seconds:.2f}s")
+    return report_data, cycle_data
+
+
+def _frame_mb(frame):
+    return frame.memory_usage(deep=True).sum() / 1e6
+
+
+def _peak_rss_mb():
+    """Return this process's peak resident set size in MB, or ``None`` without ``resource``."""
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Kilobytes on Linux, bytes on macOS.
+    return peak / 1e6 if sys.platform == "darwin" else peak / 1e3
+
+
+def report_memory(stage, report_data=None):
+    """
+    Print the memory held after a build stage.
+
+    Reports the master frame's footprint (when charts render from an
+    in-memory frame), the process's peak RSS so far and, when tracemalloc is
+    tracing, the current and stage-peak traced allocations. The traced peak is
+    reset so each stage reports its own.
+    """
+    parts = []
+    if isinstance(report_data, pd.DataFrame):
+        parts.append(f"master frame {_frame_mb(report_data):.1f} MB")
+    if tracemalloc.is_tracing():
+        current, peak = tracemalloc.get_traced_memory()
+        parts.append(f"traced {current / 1e6:.1f} MB (stage peak {peak / 1e6:.1f} MB)")
+        tracemalloc.reset_peak()
+    peak_rss = _peak_rss_mb()
+    if peak_rss is not None:
+        parts.append(f"peak RSS {peak_rss:.0f} MB")
+    print(f"Memory after {stage}: {', '.join(parts)}")
 
-catalog = build_chart_catalog(
-    report_date=report_data.index.max(),
-    chart_templates=chart_templates,
-    cycle_templates=[chart_drawdowns, chart_cycle_lows, chart_halvings],
-)
-print(
-    f"Built chart catalog with {catalog['chart_count']} charts "
-    f"through {catalog['latest_data_date']}."
-)
 
-# --- Optional local preview server --- #
-#
-# Opt in with an environment variable instead of editing this file:
-#
-#     SERVE_DASH=1 python main.py
-#
-# This used to be a commented-out pair of lines, which meant the only way to preview
-# locally was to uncomment them — and committing that state hangs CI. `app.run()` never
-# returns, so the workflow's "run the script" step never finishes and the separate
-# commit step never executes: charts are generated on the runner and then discarded,
-# and the job burns until GitHub's 6-hour timeout. That is exactly what caused the
-# 11-day outage between 2026-03-21 and 2026-04-02, ended by commit 78ada9b.
-#
-# Binding is 127.0.0.1, not 0.0.0.0: with debug=True Dash serves the Werkzeug
-# interactive debugger, and exposing that to the local network is a needless risk on a
-# developer machine.
-if os.environ.get("SERVE_DASH") == "1":
-    from dash_app import generate_dash_app, figures
-
-    figures.extend(generated_figures)
-    app_with_charts = generate_dash_app()
-    app_with_charts.run(
-        debug=os.environ.get("DASH_DEBUG") == "1",
-        use_reloader=False,
-        host="127.0.0.1",
-        port=8080,
+def _latest_date(report_data):
+    if isinstance(report_data, (MetricStore, PolarsMaster)):
+        return report_data.last_date()
+    return report_data.index.max()
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    selected = args.selected
+    if args.trace_memory:
+        tracemalloc.start()
+
+    def wanted(filename):
+        return selected is None or filename in selected
+
+    # --- Load Pre-Computed Data from Report Library --- #
+
+    master_columns, cycle_csvs = required_inputs(selected)
+    master_format = None
+    if master_columns != set():
+        # --incremental and --polars always read the CSV.
+        if not (args.incremental or args.polars):
+            try:
+                master_format = resolve_master_format()
+            except OSError as e:
+                _exit_on_input_error(MASTER_CSV, e)
+        preflight_master_header(selected, master_format=master_format)
+    # Recorded with exported or served figures so the dashboard's data refresher
+    # can tell whether they are current; taken before the data is read.
+    build_source = None
+    if master_columns != set() and (args.export_figures or os.environ.get("SERVE_DASH") == "1"):
+        try:
+            build_source = source_fingerprint()
+        except OSError:
+            pass
+    store = None
+    if args.metric_store and master_columns != set():
+        store = MetricStore(args.metric_store)
+        try:
+            signature = source_signature()
+        except OSError:
+            signature = None
+        # The store holds every chart's metrics, so a stale one is refreshed with
+        # all of them whichever charts this run renders.
+        fresh = signature is not None and store.is_current(signature)
+        master_columns = set() if fresh else required_inputs(None)[0]
+    polars_master = None
+    if args.polars and master_columns != set():
+        try:
+            polars_master = PolarsMaster()
+        except ImportError as e:
+            print(f"Error: {e}")
+            sys.exit(1)
+        # Charts scan the file for their own columns and date windows.
+        master_columns = set()
+    report_data, cycle_data = load_report_data(
+        master_columns, cycle_csvs, args.incremental, args.engine, master_format
+    )
+    if polars_master is not None:
+        report_data = polars_master
+    if store is not None:
+        if report_data is not None:
+            store.ingest(report_data, signature)
+            print(f"Ingested {len(report_data.columns)} metrics into {store.path}")
+        # Charts query the store for their own columns and date windows.
+        report_data = store
+    if isinstance(report_data, pd.DataFrame):
+        loaded_mb = _frame_mb(report_data)
+        report_data = compact_master_frame(report_data, master_columns)
+        print(f"Compacted master frame from {loaded_mb:.1f} MB to {_frame_mb(report_data):.1f} MB")
+    report_memory("loading inputs", report_data)
+
+    # --- Chart Creation --- #
+
+    # Every saved chart is described here, so the catalog never re-reads its HTML.
+    render_manifest = {}
+    for template, filename in CYCLE_CHARTS:
+        if wanted(template["filename"]):
+            create_days_since_chart(
+                cycle_data[filename], template, report_data, manifest=render_manifest
+            )
+    for filename, create_chart in RETURN_CHARTS.items():
+        if wanted(filename):
+            create_chart(report_data, manifest=render_manifest)
+    report_memory("cycle and return charts", report_data)
+
+    selected_templates = [
+        template for template in chart_templates if wanted(template["filename"])
+    ]
+    generated_figures = create_charts(
+        report_data, selected_templates, manifest=render_manifest
+    )
+    if args.export_figures:
+        for template, figure in zip(selected_templates, generated_figures):
+            export_figure_json(figure, template["filename"], args.export_figures)
+        # A partial export leaves older figures beside the new ones, so only a
+        # full one may claim the directory matches the source.
+        if build_source is not None and selected is None:
+            export_figure_source(build_source, args.export_figures)
+    report_memory("template charts", report_data)
+
+    # Latest value and 30/365-day change of each chart, shown on catalog cards.
+    summaries = (
+        latest_metric_summaries(report_data, selected_templates)
+        if report_data is not None
+        else {}
     )
+    cycle_templates = [template for template, _ in CYCLE_CHARTS]
+    if selected is None:
+        catalog = build_chart_catalog(
+            report_date=_latest_date(report_data),
+            chart_templates=chart_templates,
+            cycle_templates=cycle_templates,
+            manifest=render_manifest,
+            verify=args.verify_outputs,
+            summaries=summaries,
+        )
+    else:
+        catalog = update_chart_catalog(
+            sorted(selected),
+            report_date=_latest_date(report_data) if report_data is not None else None,
+            chart_templates=chart_templates,
+            cycle_templates=cycle_templates,
+            manifest=render_manifest,
+            summaries=summaries,
+        )
+    print(
+        f"Built chart catalog with {catalog['chart_count']} charts "
+        f"through {catalog['latest_data_date']}."
+    )
+    report_memory("catalog", report_data)
+
+    # --- Optional local preview server --- #
+    #
+    # Opt in with an environment variable instead of editing this file:
+    #
+    #     SERVE_DASH=1 python main.py
+    #
+    # This used to be a commented-out pair of lines, which meant the only way to preview
+    # locally was to uncomment them — and committing that state hangs CI. `app.run()` never
+    # returns, so the workflow's "run the script" step never finishes and the separate
+    # commit step never executes: charts are generated on the runner and then discarded,
+    # and the job burns until GitHub's 6-hour timeout. That is exactly what caused the
+    # 11-day outage between 2026-03-21 and 2026-04-02, ended by commit 78ada9b.
+    #
+    # Binding is 127.0.0.1, not 0.0.0.0: with debug=True Dash serves the Werkzeug
+    # interactive debugger, and exposing that to the local network is a needless risk on a
+    # developer machine.
+    if os.environ.get("SERVE_DASH") == "1":
+        import dash_app
+        from dash_app import generate_dash_app, figures
+        from dash_live import open_live_tail
+        from dash_refresh import start_data_refresher
+
+        figures.replace(
+            {
+                template["filename"]: figure
+                for template, figure in zip(selected_templates, generated_figures)
+            }
+        )
+        figures.source = build_source
+        start_data_refresher()
+        dash_app.live = open_live_tail()
+        if dash_app.live is not None:
+            dash_app.live.start()
+        app_with_charts = generate_dash_app()
+        app_with_charts.run(
+            debug=os.environ.get("DASH_DEBUG") == "1",
+            use_reloader=False,
+            host="127.0.0.1",
+            port=8080,
+        )
+
+
+if __name__ == "__main__":
+    main()
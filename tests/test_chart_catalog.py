@@ -4,9 +4,20 @@ import re
 from pathlib import Path
 
 import plotly.graph_objects as go
+import pytest
 
 import chart_format as charts
-from chart_catalog import CATEGORY_FILES, EXPECTED_CHART_COUNT, SPECIAL_CHARTS
+from chart_catalog import (
+    CATEGORY_FILES,
+    build_chart_catalog,
+    EXPECTED_CHART_COUNT,
+    SPECIAL_CHARTS,
+    VIEWER_FRAME_POOL,
+    _search_tokens,
+    update_chart_catalog,
+    verify_chart_outputs,
+    write_service_worker,
+)
 
 
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
@@ -100,6 +111,7 @@ def test_catalog_page_contains_only_one_unloaded_iframe():
         < document.index('id="chartGroups"')
     )
     assert 'id="chartFrameWrap" tabindex="0"' in document
+    assert 'class="chart-frame"' in iframe_tags[0]
     assert "Swipe or scroll horizontally" in document
     assert 'fetch(\'catalog.json\'' in (CHARTS_DIR / "assets/catalog.js").read_text(
         encoding="utf-8"
@@ -132,3 +144,146 @@ def test_chart_export_adds_a_meaningful_document_title(tmp_path, monkeypatch):
     )
     assert "<title>Bitcoin Test Metric | Secret Satoshis</title>" in document
     assert 'src="plotly.min.js"' in document
+
+
+def test_selective_catalog_update_only_rewrites_the_named_entries(tmp_path):
+    catalog = _catalog()
+    (tmp_path / "catalog.json").write_text(json.dumps(catalog), encoding="utf-8")
+    (tmp_path / "Bitcoin_Price.html").write_text(
+        '<html><head></head><body><div class="plotly-graph-div" '
+        'style="height:900px; width:100%;"></div></body></html>',
+        encoding="utf-8",
+    )
+
+    (tmp_path / "previews").mkdir()
+    (tmp_path / "previews/Bitcoin_Price.svg").write_text("<svg/>", encoding="utf-8")
+
+    updated = update_chart_catalog(
+        ["Bitcoin_Price"],
+        report_date=None,
+        chart_templates=charts.chart_templates,
+        cycle_templates=[charts.chart_drawdowns, charts.chart_cycle_lows, charts.chart_halvings],
+        output_dir=tmp_path,
+    )
+
+    entries = {entry["filename"]: entry for entry in updated["charts"]}
+    original = {entry["filename"]: entry for entry in catalog["charts"]}
+    assert updated["chart_count"] == catalog["chart_count"]
+    assert updated["latest_data_date"] == catalog["latest_data_date"]
+    assert entries["Bitcoin_Price"]["height"] == 900
+    assert entries["Bitcoin_Price"]["preview"] == "previews/Bitcoin_Price.svg"
+    # Series names are searchable even though only some of them become tags.
+    assert {"market", "cap", "usd", "price"} <= set(entries["Bitcoin_Price"]["search_tokens"])
+    assert entries["Bitcoin_RV"] == original["Bitcoin_RV"]
+    assert "<title>Bitcoin Price | Secret Satoshis</title>" in (
+        tmp_path / "Bitcoin_Price.html"
+    ).read_text(encoding="utf-8")
+
+
+def test_search_tokens_are_normalized_and_deduplicated():
+    assert _search_tokens("Bitcoin Price", "Réalisé 200-Day MA", "Bitcoin_RV") == [
+        "200",
+        "bitcoin",
+        "day",
+        "ma",
+        "price",
+        "realise",
+        "rv",
+    ]
+
+
+def test_service_worker_manifest_hashes_the_shell_and_each_chart(tmp_path):
+    for name, content in {
+        "index.html": "<html></html>",
+        "catalog.json": "{}",
+        "assets/catalog.js": "loadCatalog();",
+        "plotly.min.js": "plotly",
+        "Bitcoin_Price.html": "price",
+        "Bitcoin_RV.html": "rv",
+        "previews/Bitcoin_Price.svg": "<svg/>",
+        "notes.txt": "not served",
+    }.items():
+        (tmp_path / name).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / name).write_text(content, encoding="utf-8")
+
+    first = write_service_worker(tmp_path, {"Bitcoin_Price.html": "rendered-hash"})
+    (tmp_path / "Bitcoin_RV.html").write_text("rv, restated", encoding="utf-8")
+    second = write_service_worker(tmp_path, {"Bitcoin_Price.html": "rendered-hash"})
+
+    # Chart documents are hashed but listed apart, so they are cached when opened.
+    assert sorted(first["files"]) == [
+        "assets/catalog.js",
+        "catalog.json",
+        "index.html",
+        "plotly.min.js",
+        "previews/Bitcoin_Price.svg",
+    ]
+    assert sorted(first["pages"]) == ["Bitcoin_Price.html", "Bitcoin_RV.html"]
+    assert first["pages"]["Bitcoin_Price.html"] == "rendered-hash"
+    assert second["files"] == first["files"]
+    assert second["pages"]["Bitcoin_Price.html"] == first["pages"]["Bitcoin_Price.html"]
+    assert second["pages"]["Bitcoin_RV.html"] != first["pages"]["Bitcoin_RV.html"]
+    assert first["version"] != second["version"]
+    assert json.loads((tmp_path / "precache-manifest.json").read_text(encoding="utf-8")) == second
+    assert f"MANIFEST_VERSION = '{second['version']}'" in (tmp_path / "sw.js").read_text(
+        encoding="utf-8"
+    )
+
+
+def _render_manifest():
+    cycle_templates = [charts.chart_drawdowns, charts.chart_cycle_lows, charts.chart_halvings]
+    titles = {
+        template["filename"]: template["title"]
+        for template in [*charts.chart_templates, *cycle_templates]
+    }
+    titles.update({filename: chart["title"] for filename, chart in SPECIAL_CHARTS.items()})
+    return {
+        filename: {
+            "filename": filename,
+            "title": titles[filename],
+            "height": 640 if filename == "Bitcoin_Price" else None,
+            "bytes": len(filename),
+            "hash": f"{index:016x}",
+            "preview": f"previews/{filename}.svg",
+        }
+        for index, filename in enumerate(
+            name for names in CATEGORY_FILES.values() for name in names
+        )
+    }
+
+
+def test_catalog_is_built_from_the_render_manifest_without_reading_charts(tmp_path):
+    manifest = _render_manifest()
+    (tmp_path / "index.html").write_text("<html></html>", encoding="utf-8")
+
+    catalog = build_chart_catalog(
+        report_date="2026-10-19",
+        chart_templates=charts.chart_templates,
+        cycle_templates=[charts.chart_drawdowns, charts.chart_cycle_lows, charts.chart_halvings],
+        output_dir=tmp_path,
+        logo_path=PROJECT_ROOT / "Secret_Satoshis_Logo.png",
+        manifest=manifest,
+    )
+
+    entries = {entry["filename"]: entry for entry in catalog["charts"]}
+    assert catalog["chart_count"] == EXPECTED_CHART_COUNT
+    assert catalog["viewer_frame_pool"] == VIEWER_FRAME_POOL
+    assert entries["Bitcoin_Price"]["height"] == 640
+    assert entries["Bitcoin_RV"]["preview"] == "previews/Bitcoin_RV.svg"
+    assert not list(tmp_path.glob("Bitcoin_*.html"))
+
+
+def test_verification_pass_reports_documents_that_differ_from_the_manifest(tmp_path):
+    manifest = _render_manifest()
+    for filename, entry in manifest.items():
+        (tmp_path / f"{filename}.html").write_text(filename, encoding="utf-8")
+        entry["hash"] = None
+    (tmp_path / "Bitcoin_RV.html").write_text("edited after render", encoding="utf-8")
+    (tmp_path / "Bitcoin_Stray.html").write_text("stray", encoding="utf-8")
+
+    with pytest.raises(ValueError) as error:
+        verify_chart_outputs(tmp_path, manifest)
+    message = str(error.value)
+    assert "size mismatch: Bitcoin_RV" in message
+    assert "uncataloged output: Bitcoin_Stray" in message
+    assert "Bitcoin_Price" not in message
@@ -0,0 +1,376 @@
+import gzip
+import threading
+import urllib.error
+from functools import partial
+from http.server import BaseHTTPRequestHandler, SimpleHTTPRequestHandler, ThreadingHTTPServer
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import chart_data
+import chart_definitions
+from chart_data import (
+    ConnectionPool,
+    InputLoadError,
+    MASTER_CSV,
+    compact_master_frame,
+    latest_metric_summaries,
+    load_cycle_data,
+    load_inputs,
+    load_master_incremental,
+    load_master_metrics,
+    master_schema,
+    read_csv_header,
+    template_metric_gaps,
+)
+from chart_server import create_server
+from chart_templates import chart_halvings, chart_templates, primary_series
+
+
+def _template(filename, *series):
+    return {"filename": filename, "y_data": list(series)}
+
+
+def test_primary_series_prefers_the_metric_overlaid_on_price():
+    templates = {template["filename"]: template for template in chart_templates}
+
+    assert primary_series(templates["Bitcoin_NUPL"])["data"] == "nupl"
+    assert primary_series(templates["Bitcoin_Puell_Multiple"])["data"] == "puell_multiple"
+    assert primary_series(templates["Bitcoin_Price"])["data"] == "price_close"
+    assert primary_series(templates["Bitcoin_Hashrate"])["data"] == "hash_rate"
+
+
+def test_latest_summaries_use_the_last_observation_and_calendar_lookbacks():
+    dates = pd.date_range("2024-01-01", periods=400)
+    frame = pd.DataFrame(
+        {
+            "price_close": np.arange(1, 401, dtype=float),
+            "nupl": np.linspace(-0.5, 0.5, 400),
+            "hash_rate": np.nan,
+        },
+        index=dates,
+    )
+    # The latest NUPL print lags the price by two days.
+    frame.loc[dates[-2:], "nupl"] = np.nan
+
+    summaries = latest_metric_summaries(
+        frame,
+        [
+            _template("Price", {"name": "Price", "data": "price_close"}),
+            _template(
+                "NUPL",
+                {"name": "Price", "data": "price_close", "yaxis": "y"},
+                {"name": "NUPL", "data": "nupl", "yaxis": "y2"},
+            ),
+            _template("Hashrate", {"name": "Hash Rate", "data": "hash_rate"}),
+            _template("Unpublished", {"name": "Missing", "data": "not_published"}),
+        ],
+    )
+
+    assert set(summaries) == {"Price", "NUPL"}
+    price = summaries["Price"]
+    assert price["date"] == "2025-02-03"
+    assert price["value"] == 400
+    assert price["change_30d"] == 30
+    assert price["pct_change_30d"] == pytest.approx((400 / 370 - 1) * 100, rel=1e-5)
+    assert price["pct_change_365d"] == pytest.approx((400 / 35 - 1) * 100, rel=1e-5)
+
+    nupl = summaries["NUPL"]
+    assert nupl["series"] == "NUPL"
+    assert nupl["date"] == "2025-02-01"
+    assert nupl["value"] == float(f"{frame['nupl'].iloc[-3]:.6g}")
+    # A non-positive starting value has no meaningful percentage change.
+    assert nupl["change_365d"] is not None
+    assert nupl["pct_change_365d"] is None
+
+
+class _QuietHandler(SimpleHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    clients = set()
+
+    def do_GET(self):
+        self.clients.add(self.client_address)
+        super().do_GET()
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def remote_inputs(tmp_path, monkeypatch):
+    master = "time,price_close,nupl\n2024-01-01,1.5,0.1\n2024-01-02,2.5,0.2\n"
+    (tmp_path / MASTER_CSV).write_bytes(gzip.compress(master.encode("utf-8")))
+    (tmp_path / "drawdown_data.csv").write_text("days,drawdown,Cycle\n0,1.0,A\n", encoding="utf-8")
+    _QuietHandler.clients = set()
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), partial(_QuietHandler, directory=str(tmp_path)))
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    monkeypatch.setattr(
+        chart_definitions, "REPORT_CSV_DIR", f"http://127.0.0.1:{httpd.server_address[1]}"
+    )
+    yield tmp_path
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def test_inputs_load_concurrently_over_pooled_connections(remote_inputs):
+    report_data, cycle_data, timings = load_inputs(
+        {"nupl"}, ["drawdown_data.csv"], load_master=True
+    )
+
+    assert list(report_data.columns) == ["nupl"]
+    assert report_data.index[-1] == pd.Timestamp("2024-01-02")
+    assert cycle_data["drawdown_data.csv"]["Cycle"].tolist() == ["A"]
+    assert set(timings) == {MASTER_CSV, "drawdown_data.csv"}
+
+    _QuietHandler.clients = set()
+    with ConnectionPool() as pool:
+        for _ in range(3):
+            with pool.open(f"{chart_definitions.REPORT_CSV_DIR}/drawdown_data.csv") as response:
+                response.read()
+    # Three sequential requests reuse one connection.
+    assert len(_QuietHandler.clients) == 1
+
+    with pytest.raises(InputLoadError) as error:
+        load_inputs(set(), ["halving_data.csv"], load_master=False)
+    assert error.value.filename == "halving_data.csv"
+
+
+class _RedirectHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    targets = {}
+
+    def do_GET(self):
+        self.send_response(302 if self.path in self.targets else 200)
+        if self.path in self.targets:
+            self.send_header("Location", self.targets[self.path])
+            body = b""
+        else:
+            # Standing in for a proxy: echo the absolute URL it was asked for.
+            body = self.path.encode()
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def test_pooled_requests_follow_redirects_and_honour_proxies(remote_inputs, monkeypatch):
+    origin = chart_definitions.REPORT_CSV_DIR
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _RedirectHandler)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    other = f"http://127.0.0.1:{httpd.server_address[1]}"
+    _RedirectHandler.targets = {
+        "/moved.csv": f"{origin}/drawdown_data.csv",
+        "/relative.csv": "/moved.csv",
+    }
+    try:
+        with ConnectionPool() as pool:
+            # A relative redirect, then one to another host.
+            with pool.open(f"{other}/relative.csv") as response:
+                assert response.read() == b"days,drawdown,Cycle\n0,1.0,A\n"
+
+        monkeypatch.delenv("no_proxy", raising=False)
+        monkeypatch.delenv("NO_PROXY", raising=False)
+        monkeypatch.setenv("http_proxy", other)
+        with ConnectionPool() as pool, pool.open(f"{origin}/drawdown_data.csv") as response:
+            assert response.read() == f"{origin}/drawdown_data.csv".encode()
+    finally:
+        httpd.shutdown()
+        httpd.server_close()
+
+
+def test_exhausted_redirects_close_the_last_connection(monkeypatch):
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _RedirectHandler)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    _RedirectHandler.targets = {"/loop.csv": "/loop.csv"}
+    connections = []
+    try:
+        with ConnectionPool() as pool:
+            send = pool._get
+
+            def recording_get(url):
+                key, connection, response = send(url)
+                connections.append(connection)
+                return key, connection, response
+
+            monkeypatch.setattr(pool, "_get", recording_get)
+            with pytest.raises(urllib.error.HTTPError, match="Too many redirects"):
+                with pool.open(f"http://127.0.0.1:{httpd.server_address[1]}/loop.csv"):
+                    pass
+
+            # Earlier hops reuse one pooled connection; the last hop closes it.
+            assert len(connections) == chart_data.MAX_REDIRECTS + 1
+            assert connections[-1].sock is None
+            assert not any(pool._idle.values())
+    finally:
+        httpd.shutdown()
+        httpd.server_close()
+
+
+def _write_master(directory, rows):
+    lines = ["time,price_close,nupl", *(f"{day},{price},{nupl}" for day, price, nupl in rows)]
+    (directory / MASTER_CSV).write_bytes(gzip.compress(("\n".join(lines) + "\n").encode()))
+
+
+def test_incremental_ingestion_appends_new_rows_and_catches_restatements(tmp_path, monkeypatch):
+    monkeypatch.setattr(chart_definitions, "REPORT_CSV_DIR", str(tmp_path))
+    cache_dir = tmp_path / "ingest"
+    parsed_rows = []
+    parse_master = chart_data._parse_master
+
+    def counting_parse(*args):
+        frame = parse_master(*args)
+        parsed_rows.append(len(frame))
+        return frame
+
+    monkeypatch.setattr(chart_data, "_parse_master", counting_parse)
+    rows = [(f"2024-01-{day:02d}", day * 10.0, day / 100) for day in range(1, 21)]
+    _write_master(tmp_path, rows)
+    first = load_master_incremental(cache_dir=cache_dir, tail_rows=3)
+    assert parsed_rows == [20]
+
+    rows.append(("2024-01-21", 210.0, 0.21))
+    _write_master(tmp_path, rows)
+    appended = load_master_incremental({"nupl"}, cache_dir=cache_dir, tail_rows=3)
+    # Only the three tail rows and the new row are parsed.
+    assert parsed_rows == [20, 4]
+    pd.testing.assert_frame_equal(appended, load_master_metrics({"nupl"}))
+    assert len(appended) == len(first) + 1
+
+    rows[-2] = ("2024-01-20", 999.0, 0.2)
+    _write_master(tmp_path, rows)
+    restated = load_master_incremental(cache_dir=cache_dir, tail_rows=3)
+    assert restated.loc["2024-01-20", "price_close"] == 999.0
+    pd.testing.assert_frame_equal(restated, load_master_metrics())
+
+
+def test_master_schema_types_every_template_metric_as_float():
+    schema = master_schema()
+
+    assert schema["price_close"] == "float64"
+    assert schema["nupl"] == "float64"
+    assert set(schema.values()) == {"float64"}
+
+
+def test_pyarrow_engine_matches_the_c_parser(tmp_path, monkeypatch):
+    pytest.importorskip("pyarrow")
+    monkeypatch.setattr(chart_definitions, "REPORT_CSV_DIR", str(tmp_path))
+    _write_master(tmp_path, [("2024-01-01", 1.5, ""), ("2024-01-02", 2.5, 0.25)])
+
+    expected = load_master_metrics({"price_close", "nupl"})
+    actual = load_master_metrics({"price_close", "nupl"}, engine="pyarrow")
+
+    pd.testing.assert_frame_equal(actual, expected)
+
+
+def test_remote_header_is_read_with_widening_range_requests(tmp_path, monkeypatch):
+    header = ["time", *(f"metric_{index}" for index in range(300))]
+    rows = "".join(f"2024-01-{day:02d}{',1.5' * 300}\n" for day in range(1, 29))
+    (tmp_path / MASTER_CSV).write_bytes(gzip.compress((",".join(header) + "\n" + rows).encode()))
+    httpd = create_server(str(tmp_path), port=0)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    monkeypatch.setattr(
+        chart_definitions, "REPORT_CSV_DIR", f"http://127.0.0.1:{httpd.server_address[1]}"
+    )
+    # Far smaller than the compressed header, so the range has to be widened.
+    monkeypatch.setattr(chart_data, "HEADER_RANGE_BYTES", 64)
+    try:
+        assert read_csv_header(MASTER_CSV) == header
+    finally:
+        httpd.shutdown()
+        httpd.server_close()
+
+
+def test_template_metric_gaps_report_every_missing_metric_by_chart():
+    templates = [
+        _template("A", {"data": "price_close"}, {"data": "gone"}),
+        _template("B", {"data": "gone"}, {"data": "maybe", "optional": True}),
+        _template("C", {"data": "nupl"}),
+    ]
+
+    missing_required, missing_optional = template_metric_gaps(
+        ["time", "price_close", "nupl"], templates, {"price_close": ["R"], "price_usd": ["S"]}
+    )
+
+    assert missing_required == {"gone": ["A", "B"], "price_usd": ["S"]}
+    assert missing_optional == {"maybe": ["B"]}
+
+
+def test_compaction_narrows_only_columns_whose_labels_survive():
+    index = pd.date_range("2010-07-18", periods=1000, name="time")
+    frame = pd.DataFrame(
+        {
+            "realized_price": np.round(np.linspace(0.05, 15_000.0, 1000), 2),
+            "nupl": np.round(np.linspace(-0.5, 0.75, 1000), 2),
+            "puell_multiple": np.linspace(0.5, 4.0, 1000),
+            "market_cap": np.linspace(1e9, 2.4e12, 1000),
+            "unplotted": 1.0,
+        },
+        index=index,
+    )
+    frame.loc[index[:600], "nupl"] = np.nan
+    # 0.015 is off by 3e-10 in float32, but on the other side of the rounding boundary.
+    frame.loc[index[-1], "puell_multiple"] = 0.015
+    frame["realized_price"] = frame["realized_price"].astype(object)
+    columns = ["realized_price", "nupl", "puell_multiple", "market_cap"]
+
+    compact = compact_master_frame(frame, columns)
+
+    assert list(compact.columns) == columns
+    assert compact.dtypes.to_dict() == {
+        "realized_price": np.float32,
+        "nupl": pd.SparseDtype(np.float32, np.nan),
+        "puell_multiple": np.float64,
+        "market_cap": np.float64,
+    }
+    pd.testing.assert_index_equal(compact.index, frame.index)
+    np.testing.assert_array_equal(
+        np.round(compact.to_numpy(dtype=float), 2),
+        np.round(frame[columns].to_numpy(dtype=float), 2),
+    )
+    assert compact["nupl"].isna().sum() == 600
+    columns_bytes = compact.memory_usage(index=False, deep=True).sum()
+    assert columns_bytes < frame.memory_usage(index=False, deep=True).sum() / 2
+
+
+def test_compaction_stores_leading_nan_runs_as_an_offset():
+    index = pd.date_range("2010-07-18", periods=4000, name="time")
+    rng = np.random.default_rng(0)
+    # Full-precision values no float32 copy could label identically.
+    frame = pd.DataFrame(rng.uniform(1_000, 60_000, size=(4000, 4)), index=index)
+    frame.columns = ["hash_rate", "nupl", "mvrv", "price_close"]
+    for column, start in zip(frame.columns, (3000, 2000, 500, 0)):
+        frame.iloc[:start, frame.columns.get_loc(column)] = np.nan
+
+    compact = compact_master_frame(frame)
+
+    assert [str(dtype) for dtype in compact.dtypes] == [
+        "Sparse[float64, nan]",
+        "Sparse[float64, nan]",
+        "float64",
+        "float64",
+    ]
+    # Only the values from each sparse column's first observation on are stored.
+    assert compact["hash_rate"].sparse.npoints == 1000
+    pd.testing.assert_frame_equal(compact.astype(np.float64), frame)
+    # The 5,000 leading NaNs of the two sparse columns are no longer held.
+    saved = frame.memory_usage(index=False).sum() - compact.memory_usage(index=False).sum()
+    assert saved >= 0.99 * (3000 + 2000) * 8
+
+
+def test_cycle_data_is_typed_and_sorted_by_day(tmp_path, monkeypatch):
+    monkeypatch.setattr(chart_definitions, "REPORT_CSV_DIR", str(tmp_path))
+    (tmp_path / "halving_data.csv").write_text(
+        "days_since_halving,index_value,Era\n1,1.1,2nd Era\n0,1.0,2nd Era\n0,1,3rd Era\n",
+        encoding="utf-8",
+    )
+
+    frame = load_cycle_data("halving_data.csv", template=chart_halvings)
+
+    assert isinstance(frame["Era"].dtype, pd.CategoricalDtype)
+    assert frame["index_value"].dtype == np.float64
+    assert np.issubdtype(frame["days_since_halving"].dtype, np.integer)
+    assert frame["days_since_halving"].tolist() == [0, 0, 1]
+    assert frame["Era"].tolist() == ["2nd Era", "3rd Era", "2nd Era"]
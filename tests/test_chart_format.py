@@ -1,4 +1,7 @@
 import datetime
+import subprocess
+import sys
+from pathlib import Path
 
 import numpy as np
 import pandas as pd
@@ -8,7 +11,7 @@ import chart_format as charts
 
 
 def _disable_writes(monkeypatch):
-    monkeypatch.setattr(charts, "save_chart_html", lambda fig, filename: None)
+    monkeypatch.setattr(charts, "save_chart_html", lambda fig, filename, manifest=None: None)
 
 
 def _set_today(monkeypatch, year, month, day):
@@ -272,3 +275,67 @@ def test_selected_recent_bitcoin_industry_events_are_annotated():
     assert "Bitcoin ETF Options" not in events_by_name
     assert "SAB 121 Rescinded" not in events_by_name
     assert "In-Kind ETF Approval" not in events_by_name
+
+
+def test_template_registry_imports_without_the_plotting_stack():
+    script = (
+        "import sys, chart_templates; "
+        "chart_templates.chart_templates; "
+        "print(sorted({'plotly', 'pandas', 'numpy'} & set(sys.modules)))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script],
+        cwd=Path(charts.__file__).parent,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    assert result.stdout.strip() == "[]"
+
+
+def test_date_dependent_templates_follow_the_current_day(monkeypatch):
+    _set_today(monkeypatch, 2027, 2, 14)
+
+    assert charts.mtd_return["title"] == "Month To Date Return Comparison - February 2027"
+    assert charts.mtd_return["filter_start_date"] == "2027-02-01"
+    assert charts.ytd_return_full["filter_start_date"] == "2027-01-01"
+    assert charts.ytd_return in charts.chart_templates
+
+    _set_today(monkeypatch, 2028, 1, 3)
+
+    assert charts.ytd_return["title"] == "Year To Date Return (2028)"
+    assert charts.ytd_return in charts.chart_templates
+
+
+def test_days_since_chart_splits_unsorted_groups_in_order(monkeypatch):
+    _disable_writes(monkeypatch)
+    cycles = pd.DataFrame(
+        {
+            "days": [2, 0, 1, 1, 0, 2, 3],
+            "value": [3.0, 1.0, 2.0, 20.0, 10.0, np.nan, 40.0],
+            "Era": ["A", "A", "A", "B", "B", "B", "B"],
+        }
+    )
+    template = {
+        "x_data": "days",
+        "value_col": "value",
+        "group_col": "Era",
+        "y_data": [
+            {"name": "Era B", "group": "B"},
+            {"name": "Era C", "group": "C"},
+            {"name": "Era A", "group": "A"},
+        ],
+        "title": "Eras",
+        "x_label": "Days",
+        "y1_label": "Value",
+        "filename": "Eras",
+    }
+
+    for frame in (cycles, cycles.astype({"Era": "category"})):
+        figure = charts.create_days_since_chart(frame, template)
+
+        assert [trace.name for trace in figure.data] == ["Era B", "Era A"]
+        assert list(figure.data[0].x) == [0, 1, 3]
+        assert list(figure.data[0].y) == [10.0, 20.0, 40.0]
+        assert list(figure.data[1].x) == [0, 1, 2]
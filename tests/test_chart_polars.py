@@ -0,0 +1,69 @@
+import datetime
+import gzip
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import chart_definitions
+import chart_format as charts
+from chart_data import MASTER_CSV, load_master_metrics
+from chart_polars import PolarsMaster
+
+
+@pytest.fixture
+def master(tmp_path, monkeypatch):
+    """A gzip master from 2013 through today with a skipped day and a late-starting metric."""
+    pytest.importorskip("polars")
+    monkeypatch.setattr(chart_definitions, "REPORT_CSV_DIR", str(tmp_path))
+    monkeypatch.setattr(charts, "save_chart_html", lambda fig, filename, manifest=None: None)
+    index = pd.date_range("2013-06-01", datetime.date.today(), name="time")
+    rng = np.random.default_rng(7)
+    frame = pd.DataFrame(
+        {
+            "price_close": np.round(100 * np.exp(np.cumsum(rng.normal(0, 0.03, len(index)))), 2),
+            "nupl": np.round(rng.uniform(-0.3, 0.8, len(index)), 4),
+        },
+        index=index,
+    )
+    frame.loc[: "2016-12-31", "nupl"] = np.nan
+    frame = frame.drop(pd.Timestamp("2019-03-10"))
+    (tmp_path / MASTER_CSV).write_bytes(gzip.compress(frame.to_csv().encode()))
+    with PolarsMaster() as polars_master:
+        yield polars_master
+
+
+def test_scans_match_projecting_and_slicing_the_pandas_frame(master):
+    expected = load_master_metrics().loc["2018-01-01":"2020-06-30", ["nupl"]]
+
+    selected = master.select(["nupl", "not_published"], "2018-01-01", "2020-06-30")
+
+    pd.testing.assert_frame_equal(selected, expected, check_freq=False)
+    assert master.columns == ["price_close", "nupl"]
+    assert master.last_date() == pd.Timestamp(datetime.date.today())
+
+
+@pytest.mark.parametrize(
+    "create_chart",
+    [
+        charts.create_monthly_returns,
+        charts.create_indexed_monthly_returns,
+        charts.create_yearly_returns,
+        charts.create_indexed_yearly_returns,
+    ],
+)
+def test_return_charts_match_the_pandas_path(master, create_chart):
+    expected = create_chart(load_master_metrics())
+    actual = create_chart(master)
+
+    assert actual.layout.title.text == expected.layout.title.text
+    assert [trace.name for trace in actual.data] == [trace.name for trace in expected.data]
+    for expected_trace, actual_trace in zip(expected.data, actual.data):
+        np.testing.assert_array_equal(np.asarray(actual_trace.x), np.asarray(expected_trace.x))
+        # Polars parses decimal text with correct rounding; pandas' default
+        # parser can differ in the last bit.
+        np.testing.assert_allclose(
+            np.asarray(actual_trace.y, dtype=float),
+            np.asarray(expected_trace.y, dtype=float),
+            rtol=1e-12,
+        )
@@ -0,0 +1,67 @@
+import re
+
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+
+import chart_format as charts
+from chart_preview import PREVIEW_POINT_BUDGET, figure_preview_svg
+
+
+def _polylines(svg):
+    return re.findall(r'<polyline points="([^"]+)" stroke="([^"]+)"', svg)
+
+
+def test_preview_traces_each_axis_in_its_own_scale_within_the_viewport():
+    dates = pd.date_range("2012-01-01", periods=4_000)
+    figure = go.Figure(
+        [
+            go.Scatter(x=dates, y=np.geomspace(1, 100_000, 4_000), line=dict(color="#FF9900")),
+            go.Scatter(x=dates, y=np.linspace(0, 1, 4_000), yaxis="y2"),
+            go.Scatter(x=dates, y=np.ones(4_000), visible="legendonly"),
+        ],
+        layout=dict(yaxis=dict(type="log"), yaxis2=dict(overlaying="y")),
+    )
+
+    svg = figure_preview_svg(figure, width=240, height=72)
+    (price, price_color), (ratio, ratio_color) = _polylines(svg)
+    price_points = [tuple(map(float, pair.split(","))) for pair in price.split()]
+    ratio_points = [tuple(map(float, pair.split(","))) for pair in ratio.split()]
+
+    # Without its own colour, the second trace takes Plotly's second template colour.
+    assert price_color == "#FF9900"
+    assert ratio_color == figure.layout.template.layout.colorway[1]
+    assert len(price_points) + len(ratio_points) <= PREVIEW_POINT_BUDGET
+    assert all(2 <= x <= 238 and 2 <= y <= 70 for x, y in price_points + ratio_points)
+    # On a log axis a geometric series is a straight line from corner to corner.
+    assert price_points[0] == (2.0, 70.0) and price_points[-1] == (238.0, 2.0)
+    assert abs(price_points[len(price_points) // 2][1] - 36) < 2
+    assert ratio_points[-1] == (238.0, 2.0)
+
+
+def test_preview_colours_follow_the_layout_colorway_by_trace_number():
+    figure = go.Figure(
+        [go.Scatter(y=[1, 2, 3]), go.Scatter(y=[3, 2, 1]), go.Scatter(y=[2, 2, 3])],
+        layout=dict(colorway=["#111111", "#222222"]),
+    )
+
+    assert [color for _, color in _polylines(figure_preview_svg(figure))] == [
+        "#111111",
+        "#222222",
+        "#111111",
+    ]
+
+
+def test_figures_without_line_data_have_no_preview():
+    assert figure_preview_svg(go.Figure()) is None
+    assert figure_preview_svg(go.Figure(go.Scatter(x=[1], y=[float("nan")]))) is None
+
+
+def test_chart_export_writes_a_preview_next_to_the_html(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    figure = go.Figure(go.Scatter(x=[1, 2, 3], y=[3, 1, 2]))
+
+    charts.save_chart_html(figure, "Bitcoin_Test_Metric")
+
+    preview = (tmp_path / "Charts/previews/Bitcoin_Test_Metric.svg").read_text(encoding="utf-8")
+    assert preview.startswith("<svg") and len(_polylines(preview)) == 1
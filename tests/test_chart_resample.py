@@ -0,0 +1,49 @@
+import numpy as np
+import pytest
+
+from chart_resample import lttb, min_max, window
+
+
+def test_lttb_keeps_endpoints_and_the_point_budget():
+    x = np.arange(10_000, dtype=float)
+    y = np.sin(x / 300)
+    y[5_000] = 50.0
+
+    reduced_x, reduced_y = lttb(x, y, 500)
+
+    assert len(reduced_x) == 500
+    assert reduced_x[0] == 0 and reduced_x[-1] == 9_999
+    assert np.all(np.diff(reduced_x) > 0)
+    assert 50.0 in reduced_y
+
+
+def test_lttb_drops_missing_values_and_leaves_short_series_alone():
+    x = np.arange(6, dtype=float)
+    y = np.array([np.nan, 1.0, 2.0, np.nan, 4.0, 5.0])
+
+    reduced_x, reduced_y = lttb(x, y, 100)
+
+    assert reduced_x.tolist() == [1.0, 2.0, 4.0, 5.0]
+    assert reduced_y.tolist() == [1.0, 2.0, 4.0, 5.0]
+
+
+def test_min_max_preserves_extremes_and_gaps():
+    x = np.arange("2020-01-01", "2021-01-01", dtype="datetime64[D]")
+    y = np.linspace(0, 1, len(x))
+    y[:100] = np.nan
+    y[200] = -7.0
+
+    reduced_x, reduced_y = min_max(x, y, 60)
+
+    assert len(reduced_x) <= 60
+    assert reduced_x.dtype == x.dtype
+    assert -7.0 in reduced_y
+    assert reduced_x[0] >= x[100]
+
+
+@pytest.mark.parametrize(
+    "start, end, expected",
+    [(None, None, slice(0, 10)), (2.5, 5.5, slice(2, 7)), (-3, 100, slice(0, 10))],
+)
+def test_window_pads_the_visible_range_by_one_point(start, end, expected):
+    assert window(np.arange(10, dtype=float), start, end) == expected
@@ -0,0 +1,84 @@
+import gzip
+import http.client
+import json
+import threading
+
+import pytest
+
+from chart_server import create_server, parse_range
+
+
+@pytest.fixture
+def server(tmp_path):
+    (tmp_path / "index.html").write_text("<html>catalog</html>", encoding="utf-8")
+    (tmp_path / "Bitcoin_Price.html").write_text("x" * 1000, encoding="utf-8")
+    (tmp_path / "Bitcoin_Price.html.gz").write_bytes(gzip.compress(b"x" * 1000))
+    (tmp_path / "vercel.json").write_text(
+        json.dumps(
+            {
+                "headers": [
+                    {
+                        "source": "/:chart.html",
+                        "headers": [{"key": "Cache-Control", "value": "public, max-age=60"}],
+                    }
+                ]
+            }
+        ),
+        encoding="utf-8",
+    )
+    httpd = create_server(str(tmp_path), port=0)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd.server_address[1]
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def _get(port, path, **headers):
+    connection = http.client.HTTPConnection("127.0.0.1", port, timeout=5)
+    connection.request("GET", path, headers=headers)
+    response = connection.getresponse()
+    body = response.read()
+    connection.close()
+    return response, body
+
+
+def test_precompressed_variant_and_vercel_headers_are_served(server):
+    response, body = _get(server, "/Bitcoin_Price.html", **{"Accept-Encoding": "br, gzip"})
+    assert response.status == 200
+    assert response.getheader("Content-Encoding") == "gzip"
+    assert response.getheader("Content-Type") == "text/html"
+    assert response.getheader("Cache-Control") == "public, max-age=60"
+    assert gzip.decompress(body) == b"x" * 1000
+
+    response, body = _get(server, "/")
+    assert body == b"<html>catalog</html>"
+    assert response.getheader("Content-Encoding") is None
+    assert response.getheader("Cache-Control") == "public, max-age=0, must-revalidate"
+
+
+def test_conditional_and_range_requests(server):
+    response, _ = _get(server, "/Bitcoin_Price.html")
+    etag = response.getheader("ETag")
+
+    response, body = _get(server, "/Bitcoin_Price.html", **{"If-None-Match": etag})
+    assert response.status == 304
+    assert body == b""
+
+    response, body = _get(server, "/Bitcoin_Price.html", Range="bytes=990-")
+    assert response.status == 206
+    assert response.getheader("Content-Range") == "bytes 990-999/1000"
+    assert body == b"x" * 10
+
+    response, _ = _get(server, "/Bitcoin_Price.html", Range="bytes=5000-")
+    assert response.status == 416
+    assert _get(server, "/missing.html")[0].status == 404
+
+
+def test_range_parsing():
+    assert parse_range(None, 100) is None
+    assert parse_range("bytes=0-9", 100) == (0, 9)
+    assert parse_range("bytes=-10", 100) == (90, 99)
+    assert parse_range("bytes=95-200", 100) == (95, 99)
+    assert parse_range("bytes=0-1,5-6", 100) is None
+    assert parse_range("bytes=100-", 100) is False
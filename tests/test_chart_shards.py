@@ -0,0 +1,217 @@
+import gzip
+import threading
+import warnings
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import chart_data
+import chart_definitions
+from chart_data import (
+    MASTER_CSV,
+    load_inputs,
+    load_master_frame,
+    load_master_metrics,
+    source_record,
+)
+from chart_definitions import MASTER_SHARD_DIR
+from chart_shards import write_columnar_master, write_master_shards
+
+
+class _RecordingHandler(SimpleHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    paths = []
+
+    def do_GET(self):
+        self.paths.append(self.path)
+        super().do_GET()
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def sharded_source(tmp_path, monkeypatch):
+    """A remote source publishing both the master CSV and its shards."""
+    source = tmp_path / "csv"
+    source.mkdir()
+    index = pd.date_range("2020-01-01", periods=60, name="time")
+    frame = pd.DataFrame(
+        {
+            "price_close": np.linspace(7_000.5, 9_000.25, 60),
+            "nupl": np.r_[[np.nan] * 20, np.linspace(0.1, 0.5, 38), [np.nan] * 2],
+            "block_height": np.arange(600_000, 600_060),
+            "cycle": ["A"] * 60,
+        },
+        index=index,
+    )
+    (source / MASTER_CSV).write_bytes(gzip.compress(frame.to_csv().encode()))
+    monkeypatch.setattr(chart_definitions, "REPORT_CSV_DIR", str(source))
+    # Recorded against the local file, so remote readers compare the CSV's tail.
+    write_master_shards(load_master_metrics(), source / MASTER_SHARD_DIR, source_record())
+
+    _RecordingHandler.paths = []
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), partial(_RecordingHandler, directory=str(source)))
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    monkeypatch.setattr(
+        chart_definitions, "REPORT_CSV_DIR", f"http://127.0.0.1:{httpd.server_address[1]}"
+    )
+    yield source
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def test_shards_load_the_same_frame_as_the_csv(sharded_source, tmp_path):
+    cache_dir = tmp_path / "cache"
+    expected = load_master_metrics()
+
+    everything, _, _ = load_inputs(None, shard_cache_dir=cache_dir)
+    projected, _, _ = load_inputs({"nupl", "block_height"}, shard_cache_dir=cache_dir)
+
+    # The text column has no shard; every numeric column round-trips exactly.
+    pd.testing.assert_frame_equal(everything, expected.drop(columns="cycle"))
+    pd.testing.assert_frame_equal(projected, expected[["nupl", "block_height"]])
+
+
+def test_only_referenced_and_changed_shards_are_fetched(sharded_source, tmp_path):
+    cache_dir = tmp_path / "cache"
+
+    load_inputs({"nupl"}, shard_cache_dir=cache_dir)
+    # The CSV itself is only read for its fingerprint: the shards recorded a local
+    # mtime, which the server's Last-Modified cannot be compared with.
+    assert sorted(_RecordingHandler.paths) == [
+        f"/{MASTER_SHARD_DIR}/index.npy.gz",
+        f"/{MASTER_SHARD_DIR}/manifest.json",
+        f"/{MASTER_SHARD_DIR}/nupl.npy.gz",
+        f"/{MASTER_CSV}",
+    ]
+
+    # Republishing with only the price changed: the cached nupl and index
+    # shards keep their hashes and are not fetched again.
+    frame = pd.read_csv(sharded_source / MASTER_CSV, index_col=0, parse_dates=True)
+    frame["price_close"] *= 2
+    (sharded_source / MASTER_CSV).write_bytes(gzip.compress(frame.to_csv().encode()))
+    write_master_shards(frame, sharded_source / MASTER_SHARD_DIR, source_record())
+    _RecordingHandler.paths = []
+
+    reloaded, _, _ = load_inputs({"nupl", "price_close"}, shard_cache_dir=cache_dir)
+
+    # Recorded through the same server, so its Last-Modified and size match and
+    # the CSV is not read at all.
+    assert sorted(_RecordingHandler.paths) == [
+        f"/{MASTER_SHARD_DIR}/manifest.json",
+        f"/{MASTER_SHARD_DIR}/price_close.npy.gz",
+    ]
+    pd.testing.assert_series_equal(reloaded["price_close"], frame["price_close"], check_freq=False)
+
+
+def test_shards_published_without_a_source_record_are_trusted(sharded_source, tmp_path):
+    write_master_shards(load_master_metrics(), sharded_source / MASTER_SHARD_DIR)
+    _RecordingHandler.paths = []
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        reloaded, _, _ = load_inputs({"nupl"}, shard_cache_dir=tmp_path / "cache")
+
+    assert f"/{MASTER_CSV}" not in _RecordingHandler.paths
+    assert reloaded["nupl"].notna().sum() == 38
+
+
+def test_shards_older_than_the_csv_are_ignored(sharded_source, tmp_path):
+    frame = pd.read_csv(sharded_source / MASTER_CSV, index_col=0, parse_dates=True)
+    frame.loc[frame.index[-1], "price_close"] = 9_500.75
+    (sharded_source / MASTER_CSV).write_bytes(gzip.compress(frame.to_csv().encode()))
+    _RecordingHandler.paths = []
+
+    with pytest.warns(RuntimeWarning, match="not written from the current"):
+        reloaded, _, _ = load_inputs({"price_close"}, shard_cache_dir=tmp_path / "cache")
+
+    assert reloaded["price_close"].iloc[-1] == 9_500.75
+    assert f"/{MASTER_SHARD_DIR}/price_close.npy.gz" not in _RecordingHandler.paths
+
+
+@pytest.mark.parametrize("filename", chart_data.MASTER_COLUMNAR)
+def test_columnar_copies_published_upstream_are_read_without_checking_the_csv(
+    tmp_path, monkeypatch, filename
+):
+    pytest.importorskip("pyarrow")
+    from chart_server import create_server
+
+    index = pd.date_range("2020-01-01", periods=30, name="time")
+    frame = pd.DataFrame({"price_close": np.linspace(7_000.5, 9_000.25, 30)}, index=index)
+    # Written by other tooling: no source record in the schema metadata.
+    write_columnar_master(frame, str(tmp_path / filename))
+    (tmp_path / MASTER_CSV).write_bytes(b"")
+    for name in ("load_master_metrics", "source_fingerprint", "_source_validators"):
+        monkeypatch.setattr(chart_data, name, lambda *args, name=name: pytest.fail(name))
+
+    httpd = create_server(str(tmp_path), port=0)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    monkeypatch.setattr(
+        chart_definitions, "REPORT_CSV_DIR", f"http://127.0.0.1:{httpd.server_address[1]}"
+    )
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            loaded = load_master_frame({"price_close"})
+    finally:
+        httpd.shutdown()
+        httpd.server_close()
+
+    pd.testing.assert_frame_equal(loaded, frame, check_freq=False)
+
+
+@pytest.mark.parametrize("filename", chart_data.MASTER_COLUMNAR)
+def test_current_columnar_sibling_is_preferred_locally_and_remotely(tmp_path, monkeypatch, filename):
+    pytest.importorskip("pyarrow")
+    from chart_server import create_server
+
+    source = tmp_path / "csv"
+    source.mkdir()
+    index = pd.date_range("2020-01-01", periods=60, name="time")
+    frame = pd.DataFrame(
+        {
+            "price_close": np.linspace(7_000.5, 9_000.25, 60),
+            "nupl": np.r_[[np.nan] * 20, np.linspace(0.1, 0.5, 40)],
+        },
+        index=index,
+    )
+    (source / MASTER_CSV).write_bytes(gzip.compress(frame.to_csv().encode()))
+    monkeypatch.setattr(chart_definitions, "REPORT_CSV_DIR", str(source))
+    expected = load_master_metrics({"nupl"})
+    assert chart_data.find_columnar_master() is None
+
+    write_columnar_master(load_master_metrics(), str(source / filename), source_record())
+    parse_csv, fingerprint = chart_data.load_master_metrics, chart_data.source_fingerprint
+    # Fail on any CSV parse: only the columnar file may be read from here on. The
+    # CSV's mtime still matches the record, so its tail is not read either.
+    monkeypatch.setattr(chart_data, "load_master_metrics", lambda *args: pytest.fail("CSV read"))
+    monkeypatch.setattr(chart_data, "source_fingerprint", lambda *args: pytest.fail("tail read"))
+    master_format = chart_data.resolve_master_format()
+    assert master_format == (filename, ["time", "price_close", "nupl"], None)
+    pd.testing.assert_frame_equal(load_master_frame({"nupl"}), expected)
+    # Read remotely, the local mtime cannot be compared, so the tail decides.
+    monkeypatch.setattr(chart_data, "source_fingerprint", fingerprint)
+
+    httpd = create_server(str(source), port=0)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    monkeypatch.setattr(
+        chart_definitions, "REPORT_CSV_DIR", f"http://127.0.0.1:{httpd.server_address[1]}"
+    )
+    try:
+        pd.testing.assert_frame_equal(load_master_frame({"nupl"}), expected)
+
+        # A CSV updated after the columnar copy was written is read instead.
+        frame.loc[index[-1], "nupl"] = 0.75
+        (source / MASTER_CSV).write_bytes(gzip.compress(frame.to_csv().encode()))
+        monkeypatch.setattr(chart_data, "load_master_metrics", parse_csv)
+        with pytest.warns(RuntimeWarning, match=f"Ignoring {filename}"):
+            assert chart_data.resolve_master_format() == (MASTER_CSV, None, None)
+        with pytest.warns(RuntimeWarning):
+            assert load_master_frame({"nupl"})["nupl"].iloc[-1] == 0.75
+    finally:
+        httpd.shutdown()
+        httpd.server_close()
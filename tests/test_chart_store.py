@@ -0,0 +1,74 @@
+import numpy as np
+import pandas as pd
+
+import chart_format as charts
+from chart_store import MetricStore
+
+
+def _frame():
+    index = pd.date_range("2020-01-01", periods=400, name="time")
+    frame = pd.DataFrame(
+        {
+            "price_close": np.linspace(7_000, 60_000, 400),
+            "nupl": np.linspace(-0.2, 0.7, 400),
+            "hash_rate": np.linspace(1e8, 4e8, 400),
+        },
+        index=index,
+    )
+    frame.loc[index[:100], "nupl"] = np.nan
+    return frame
+
+
+def test_store_range_queries_match_slicing_the_frame(tmp_path):
+    frame = _frame()
+    store = MetricStore(tmp_path / "metrics.sqlite")
+    store.ingest(frame, signature=(1, 2))
+
+    selected = store.select(["nupl", "price_close", "not_published"], "2020-03-01", "2020-06-30")
+    expected = frame.loc["2020-03-01":"2020-06-30", ["price_close", "nupl"]]
+
+    pd.testing.assert_frame_equal(selected, expected, check_freq=False)
+    assert store.columns == ["price_close", "nupl", "hash_rate"]
+    assert store.last_date() == frame.index[-1]
+    assert store.is_current((1, 2))
+    assert not store.is_current((1, 3))
+
+
+def test_object_columns_are_stored_as_numbers(tmp_path):
+    frame = _frame()
+    frame["nupl"] = frame["nupl"].astype(object)
+    frame.loc[frame.index[-1], "nupl"] = "n/a"
+    frame.loc[frame.index[-2], "nupl"] = "0.5"
+    store = MetricStore(tmp_path / "metrics.sqlite")
+    store.ingest(frame)
+
+    # The same values the in-memory path plots after compact_master_frame.
+    expected = pd.to_numeric(frame["nupl"], errors="coerce")
+    pd.testing.assert_series_equal(store.select(["nupl"])["nupl"], expected, check_freq=False)
+
+
+def test_charts_render_the_same_figure_from_a_store(tmp_path):
+    frame = _frame()
+    store = MetricStore(tmp_path / "metrics.sqlite")
+    store.ingest(frame)
+    template = {
+        "y_data": [
+            {"name": "Price", "data": "price_close", "yaxis": "y"},
+            {"name": "NUPL", "data": "nupl", "yaxis": "y2"},
+        ],
+        "title": "NUPL",
+        "x_label": "Date",
+        "y1_label": "Price",
+        "y2_label": "NUPL",
+        "filename": "Bitcoin_NUPL",
+        "data_source": "Data Source: Test",
+        "filter_start_date": "2020-02-01",
+    }
+
+    from_frame = charts.create_line_chart(template, frame.copy())
+    from_store = charts.create_line_chart(template, store)
+
+    for expected, actual in zip(from_frame.data, from_store.data):
+        np.testing.assert_array_equal(np.asarray(actual.x), np.asarray(expected.x))
+        np.testing.assert_array_equal(np.asarray(actual.y), np.asarray(expected.y))
+    pd.testing.assert_series_equal(charts._price_series(store), charts._price_series(frame))
@@ -0,0 +1,139 @@
+import json
+
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+import pytest
+from dash import dcc, html
+from plotly.utils import PlotlyJSONEncoder
+
+import dash_app
+
+
+@pytest.fixture
+def registered_figures(monkeypatch):
+    registered = dash_app.FigureStore()
+    registered.update(
+        (filename, go.Figure(go.Scatter(x=[1, 2], y=[3, 4], name=filename)))
+        for filename in ("Bitcoin_Price", "Bitcoin_RV", "Bitcoin_Hashrate")
+    )
+    monkeypatch.setattr(dash_app, "figures", registered)
+    return registered
+
+
+def _graph_ids(children):
+    container = html.Div(children)
+    return [
+        component.id["index"]
+        for component in container._traverse()
+        if isinstance(component, dcc.Graph)
+    ]
+
+
+def test_initial_layout_carries_no_figure_data(registered_figures):
+    app = dash_app.generate_dash_app()
+    layout = json.dumps(app.layout, cls=PlotlyJSONEncoder)
+
+    assert "chart-graph" not in layout
+    assert '"Mining and Security"' in layout
+    assert '"Relative Valuation"' in layout
+    assert '"Holder Behavior"' not in layout
+
+
+def test_pages_route_to_a_single_category_or_chart(registered_figures):
+    assert _graph_ids(dash_app._page("/")) == ["Bitcoin_Price"]
+    assert _graph_ids(dash_app._page("/relative-valuation")) == ["Bitcoin_RV"]
+    assert _graph_ids(dash_app._page("/chart/Bitcoin_Hashrate")) == ["Bitcoin_Hashrate"]
+    assert "figure" not in json.dumps(dash_app._page("/"), cls=PlotlyJSONEncoder)
+
+
+def test_figure_responses_are_precompressed_and_revalidate_with_etags(registered_figures):
+    client = dash_app.generate_dash_app().server.test_client()
+
+    response = client.get(
+        "/figures/Bitcoin_RV.json", headers={"Accept-Encoding": "gzip"}
+    )
+    assert response.status_code == 200
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert response.data == registered_figures.payload("Bitcoin_RV").body
+
+    revalidated = client.get(
+        "/figures/Bitcoin_RV.json",
+        headers={"Accept-Encoding": "gzip", "If-None-Match": response.headers["ETag"]},
+    )
+    assert revalidated.status_code == 304
+    assert revalidated.data == b""
+
+    plain = client.get("/figures/Bitcoin_RV.json")
+    assert json.loads(plain.data)["data"][0]["name"] == "Bitcoin_RV"
+    assert plain.headers["ETag"] != response.headers["ETag"]
+    assert client.get("/figures/Bitcoin_Unknown.json").status_code == 404
+
+
+def test_figure_payload_cache_is_bounded_with_lru_eviction():
+    store = dash_app.FigureStore(max_bytes=1)
+    store["first"] = go.Figure(go.Scatter(y=[1, 2, 3]))
+    first_payload = store.payload("first")
+    store["second"] = go.Figure(go.Scatter(y=[4, 5, 6]))
+
+    assert list(store._payloads) == ["second"]
+    assert set(store) == {"first", "second"}
+    assert store.payload("first") == first_payload
+    assert list(store._payloads) == ["first"]
+
+
+def test_long_traces_are_served_coarse_and_resampled_for_the_visible_window():
+    dates = pd.date_range("2010-01-01", periods=5_000)
+    store = dash_app.FigureStore(max_points=400)
+    store["Bitcoin_Price"] = go.Figure(
+        [
+            go.Scatter(x=dates, y=np.arange(5_000.0), name="long"),
+            go.Scatter(x=dates[:3], y=[1, 2, 3], name="short"),
+        ]
+    )
+
+    coarse = store["Bitcoin_Price"]
+    assert len(coarse.data[0].x) == 400
+    assert len(coarse.data[1].x) == 3
+    assert coarse.layout.uirevision == "Bitcoin_Price"
+
+    zoom = {"xaxis.range[0]": "2012-01-01 00:00:00", "xaxis.range[1]": "2012-03-01"}
+    [(index, x, y)] = store.resample("Bitcoin_Price", *dash_app._relayout_x_range(zoom))
+    assert index == 0
+    assert x[0] == np.datetime64("2011-12-31") and x[-1] == np.datetime64("2012-03-02")
+    assert len(x) == 63 and y[1] == float((pd.Timestamp("2012-01-01") - dates[0]).days)
+
+    reset = dash_app._relayout_x_range({"xaxis.autorange": True})
+    [(_, full_x, _)] = store.resample("Bitcoin_Price", *reset)
+    assert len(full_x) == 400
+    assert dash_app._relayout_x_range({"yaxis.type": "log"}) is None
+
+
+def test_exported_figures_load_and_resample_like_in_process_figures(tmp_path, monkeypatch):
+    from chart_format import export_figure_json
+
+    dates = pd.date_range("2010-01-01", periods=3_000)
+    figure = go.Figure(go.Scatter(x=dates, y=np.arange(3_000.0)))
+    export_figure_json(figure, "Bitcoin_Price", tmp_path)
+    store = dash_app.FigureStore(max_points=300)
+    monkeypatch.setattr(dash_app, "figures", store)
+
+    assert dash_app.load_figures(tmp_path) == 1
+    assert len(store["Bitcoin_Price"].data[0].x) == 300
+    [(_, x, y)] = store.resample("Bitcoin_Price", "2015-01-01", "2015-01-31")
+    assert x[1] == np.datetime64("2015-01-01") and y[1] == 1826.0
+
+
+def test_compression_skips_precompressed_figures_and_small_responses(registered_figures):
+    app = dash_app.generate_dash_app()
+    dash_app.enable_compression(app.server, minimum_size=200)
+    client = app.server.test_client()
+
+    page = client.get("/_dash-layout", headers={"Accept-Encoding": "gzip"})
+    figure = client.get("/figures/Bitcoin_RV.json", headers={"Accept-Encoding": "gzip"})
+    plain = client.get("/_dash-layout")
+
+    assert page.headers["Content-Encoding"] in {"gzip", "br"}
+    assert "Accept-Encoding" in page.headers["Vary"]
+    assert figure.data == registered_figures.payload("Bitcoin_RV").body
+    assert "Content-Encoding" not in plain.headers
@@ -0,0 +1,121 @@
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+import pytest
+
+import dash_app
+import dash_live
+
+
+def test_file_tail_feed_reads_only_new_complete_lines(tmp_path):
+    path = tmp_path / "ticks.csv"
+    path.write_text("timestamp,price\n2026-10-19T10:00:00Z,67000.5\n2026-10-19T10:01")
+    feed = dash_live.FileTailFeed(str(path))
+
+    assert feed.read() == [(np.datetime64("2026-10-19T10:00:00"), 67000.5)]
+    with path.open("a") as handle:
+        handle.write(":00+00:00,67010\n1792404120,67020\n")
+    assert feed.read() == [
+        (np.datetime64("2026-10-19T10:01:00"), 67010.0),
+        (np.datetime64("2026-10-19T10:02:00"), 67020.0),
+    ]
+    assert feed.read() == []
+
+    path.write_text("2026-10-19T11:00:00,1\n")
+    assert feed.read() == [(np.datetime64("2026-10-19T11:00:00"), 1.0)]
+
+
+class ListFeed:
+    def __init__(self, points):
+        self.points = points
+
+    def read(self):
+        points, self.points = self.points, []
+        return points
+
+
+def _sequence(stamp):
+    return int(np.datetime64(stamp, "us").astype(np.int64))
+
+
+def test_live_tail_keeps_a_bounded_window_of_points_numbered_by_timestamp():
+    points = [(np.datetime64("2026-10-19T10:00") + np.timedelta64(i, "m"), float(i)) for i in range(5)]
+    tail = dash_live.LiveTail(ListFeed(points), window=3)
+
+    assert tail.poll() == 5
+    x, y, latest = tail.since(0)
+    assert (y, latest) == ([2.0, 3.0, 4.0], _sequence("2026-10-19T10:04"))
+    assert x[0] == "2026-10-19T10:02:00"
+    assert tail.since(_sequence("2026-10-19T10:03"))[1] == [4.0]
+    assert tail.since(0, until=_sequence("2026-10-19T10:02"))[1] == [2.0]
+    assert tail.since(0, after=np.datetime64("2026-10-19T10:03"))[1] == [4.0]
+
+
+def test_workers_tailing_one_feed_agree_on_sequence_numbers(tmp_path):
+    path = tmp_path / "ticks.csv"
+    path.write_text("".join(f"2026-10-19T10:{minute:02d}:00,{minute}\n" for minute in range(10)))
+    early = dash_live.LiveTail(dash_live.FileTailFeed(str(path), backlog=4), window=4)
+    early.poll()
+    with path.open("a") as handle:
+        handle.write("2026-10-19T10:10:00,10\n2026-10-19T10:09:00,99\n")
+    late = dash_live.LiveTail(dash_live.FileTailFeed(str(path), backlog=4), window=4)
+    late.poll()
+
+    # Started before the last lines were written, one worker has not read them
+    # yet; a client it served keeps polling the other one without repeats.
+    _, y, sequence = early.since(0)
+    assert y == [6.0, 7.0, 8.0, 9.0]
+    # The out-of-order 10:09 line is dropped.
+    assert late.since(sequence)[1] == [10.0]
+    # A client ahead of a lagging worker is not sent everything again.
+    assert early.since(late.sequence) == ([], [], late.sequence)
+
+
+@pytest.fixture
+def live_price(monkeypatch):
+    dates = pd.date_range("2010-01-01", "2026-10-18")
+    store = dash_app.FigureStore(max_points=500)
+    store["Bitcoin_Price"] = go.Figure(
+        [
+            go.Scatter(x=dates, y=np.ones(len(dates)), name="Market Cap"),
+            go.Scatter(x=dates, y=np.arange(len(dates), dtype=float), name="Bitcoin Price USD"),
+        ]
+    )
+    store["Bitcoin_Hashrate"] = go.Figure(go.Scatter(x=dates, y=np.ones(len(dates))))
+    points = [
+        (np.datetime64("2026-10-18T00:00"), 1.0),
+        (np.datetime64("2026-10-19T09:00"), 2.0),
+        (np.datetime64("2026-10-19T09:05"), 3.0),
+    ]
+    tail = dash_live.LiveTail(ListFeed(points), window=100)
+    tail.poll()
+    monkeypatch.setattr(dash_app, "figures", store)
+    monkeypatch.setattr(dash_app, "live", tail)
+    return tail
+
+
+def test_live_ticks_extend_only_the_price_trace_with_unseen_points(live_price):
+    update, sequence = dash_app._live_extension("Bitcoin_Price", 0)
+    assert update == (
+        {"x": [["2026-10-19T09:00:00", "2026-10-19T09:05:00"]], "y": [[2.0, 3.0]]},
+        [1],
+        600,
+    )
+    assert sequence == _sequence("2026-10-19T09:05")
+    assert dash_app._live_extension("Bitcoin_Price", sequence) == (dash_app.no_update, sequence)
+    assert dash_app._live_extension("Bitcoin_Hashrate", 0)[0] is dash_app.no_update
+    # Graphs whose figure has not loaded yet are left alone.
+    assert dash_app._live_extension("Bitcoin_Price", None)[0] is dash_app.no_update
+
+
+def test_replaced_price_trace_keeps_the_live_points_it_already_showed(live_price):
+    patch = dash_app._figure_patch(
+        "Bitcoin_Price", sequence=_sequence("2026-10-19T09:00")
+    ).to_plotly_json()
+    extended = [op for op in patch["operations"] if op["operation"] == "Extend"]
+
+    assert [op["location"] for op in extended] == [["data", 1, "x"], ["data", 1, "y"]]
+    assert extended[1]["params"]["value"] == [2.0]
+    assert dash_app._figure_patch("Bitcoin_Price").to_plotly_json()["operations"][-1][
+        "location"
+    ] == ["layout", "title", "text"]
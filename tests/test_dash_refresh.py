@@ -0,0 +1,149 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import chart_definitions
+import dash_app
+import dash_refresh
+from chart_data import MASTER_CSV, source_fingerprint
+from chart_format import export_figure_json, export_figure_source
+from chart_templates import chart_templates
+
+COLUMNS = ["price_close", "market_cap", "hash_rate", "30_day_ma_hash_rate", "365_day_ma_hash_rate"]
+
+
+def _write_master(directory, frame, mtime):
+    path = directory / MASTER_CSV
+    frame.to_csv(path, compression="gzip")
+    os.utime(path, (mtime, mtime))
+
+
+@pytest.fixture
+def report_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(chart_definitions, "REPORT_CSV_DIR", str(tmp_path))
+    return tmp_path
+
+
+def test_refresher_rebuilds_only_figures_whose_metrics_changed(report_dir):
+    dates = pd.date_range("2011-01-01", periods=400, name="time")
+    frame = pd.DataFrame(
+        {column: np.arange(400.0) + offset for offset, column in enumerate(COLUMNS)},
+        index=dates,
+    )
+    _write_master(report_dir, frame, mtime=1_000)
+
+    store = dash_app.FigureStore()
+    templates = {t["filename"]: t for t in chart_templates}
+    store.replace(
+        {
+            filename: dash_refresh.create_line_chart(templates[filename], frame.copy())
+            for filename in ("Bitcoin_Price", "Bitcoin_Hashrate")
+        }
+    )
+    # As main.py records it for the figures it just built.
+    store.source = source_fingerprint()
+    revisions = {filename: store.revision(filename) for filename in store}
+    refresher = dash_refresh.DataRefresher(store, interval=60)
+
+    assert refresher.check() == []
+    assert refresher.check() == []
+
+    # A touch without new content does not reload the data.
+    _write_master(report_dir, frame, mtime=2_000)
+    assert refresher.check() == []
+
+    frame.loc[dates[-1], "hash_rate"] = 10_000.0
+    _write_master(report_dir, frame, mtime=3_000)
+    assert refresher.check() == ["Bitcoin_Hashrate"]
+    assert store.revision("Bitcoin_Price") == revisions["Bitcoin_Price"]
+    assert store.revision("Bitcoin_Hashrate") != revisions["Bitcoin_Hashrate"]
+    assert store["Bitcoin_Hashrate"].data[0].y[-1] == 10_000.0
+
+
+def _hashrate_frame(dates, last=400.0):
+    frame = pd.DataFrame(
+        {column: np.arange(len(dates), dtype=float) for column in COLUMNS}, index=dates
+    )
+    frame.loc[dates[-1], "hash_rate"] = last
+    return frame
+
+
+def test_a_failed_read_is_retried_and_unrecorded_figures_are_rebuilt(report_dir, monkeypatch):
+    dates = pd.date_range("2011-01-01", periods=400, name="time")
+    template = next(t for t in chart_templates if t["filename"] == "Bitcoin_Hashrate")
+    store = dash_app.FigureStore()
+    store["Bitcoin_Hashrate"] = dash_refresh.create_line_chart(template, _hashrate_frame(dates))
+    # The served figure predates the file; nothing records what it was built from.
+    _write_master(report_dir, _hashrate_frame(dates, last=10_000.0), mtime=1_000)
+    refresher = dash_refresh.DataRefresher(store, interval=60)
+
+    load = dash_refresh.load_master_metrics
+
+    def failing_load(columns):
+        raise OSError("truncated download")
+
+    monkeypatch.setattr(dash_refresh, "load_master_metrics", failing_load)
+    with pytest.raises(OSError):
+        refresher.check()
+    monkeypatch.setattr(dash_refresh, "load_master_metrics", load)
+
+    assert refresher.check() == ["Bitcoin_Hashrate"]
+    assert store["Bitcoin_Hashrate"].data[0].y[-1] == 10_000.0
+    assert store.source == source_fingerprint()
+    assert refresher.check() == []
+
+
+def test_only_the_lock_holder_reads_the_source_and_other_workers_reload(report_dir, tmp_path):
+    dates = pd.date_range("2011-01-01", periods=400, name="time")
+    template = next(t for t in chart_templates if t["filename"] == "Bitcoin_Hashrate")
+    frame = _hashrate_frame(dates)
+    _write_master(report_dir, frame, mtime=1_000)
+    figure_dir = tmp_path / "figures"
+    export_figure_json(dash_refresh.create_line_chart(template, frame), "Bitcoin_Hashrate", figure_dir)
+    export_figure_source(source_fingerprint(), figure_dir)
+
+    leader, follower = dash_app.FigureStore(), dash_app.FigureStore()
+    dash_app.load_figures(figure_dir, leader)
+    dash_app.load_figures(figure_dir, follower)
+    refresher = dash_refresh.DataRefresher(leader, interval=60, figure_dir=str(figure_dir))
+    reloader = dash_refresh.FigureReloader(follower, interval=60)
+
+    # Both start from figures that match the source.
+    assert refresher.check() == []
+    assert reloader.check() == []
+
+    _write_master(report_dir, _hashrate_frame(dates, last=10_000.0), mtime=2_000)
+    assert refresher.check() == ["Bitcoin_Hashrate"]
+    assert reloader.check() == ["Bitcoin_Hashrate"]
+    assert dash_app._trace_array(follower["Bitcoin_Hashrate"].data[0].y)[-1] == 10_000.0
+    assert follower.source == leader.source == source_fingerprint()
+
+
+def test_refresh_patch_carries_new_trace_data_for_the_visible_window(monkeypatch):
+    dates = pd.date_range("2010-01-01", periods=5_000)
+    store = dash_app.FigureStore(max_points=400)
+    monkeypatch.setattr(dash_app, "figures", store)
+    store["Bitcoin_Price"] = dash_app.go.Figure(
+        dash_app.go.Scatter(x=dates, y=np.arange(5_000.0)), layout={"title": "Old"}
+    )
+    store["Bitcoin_Price"] = dash_app.go.Figure(
+        dash_app.go.Scatter(x=dates, y=np.arange(5_000.0) * 2), layout={"title": "New"}
+    )
+
+    full = dash_app._figure_patch("Bitcoin_Price").to_plotly_json()
+    zoomed = dash_app._figure_patch(
+        "Bitcoin_Price", {"xaxis.range[0]": "2012-01-01", "xaxis.range[1]": "2012-03-01"}
+    ).to_plotly_json()
+
+    def assigned(patch, *location):
+        return next(
+            op["params"]["value"]
+            for op in reversed(patch["operations"])
+            if op["operation"] == "Assign" and op["location"] == list(location)
+        )
+
+    assert len(assigned(full, "data", 0, "y")) == 400
+    assert len(assigned(zoomed, "data", 0, "x")) == 63
+    assert assigned(full, "layout", "title", "text") == "New"
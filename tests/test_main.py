@@ -0,0 +1,73 @@
+import pytest
+
+import main
+
+
+def test_selection_combines_named_charts_and_categories():
+    args = main.parse_args(
+        ["--only", "Bitcoin_Price,Bitcoin_RV", "--category", "Cycle Analysis"]
+    )
+
+    assert args.selected == {
+        "Bitcoin_Price",
+        "Bitcoin_RV",
+        "Bitcoin_ATH_Drawdown",
+        "Bitcoin_Cycle_Low",
+        "Bitcoin_Halving_Cycle",
+    }
+    assert main.parse_args([]).selected is None
+
+
+def test_unknown_chart_selection_is_rejected():
+    with pytest.raises(SystemExit):
+        main.parse_args(["--only", "Bitcoin_Not_A_Chart"])
+
+
+def test_selected_charts_load_only_their_inputs():
+    columns, cycle_csvs = main.required_inputs({"Bitcoin_Hashrate", "Bitcoin_Cycle_Low"})
+
+    assert columns == {
+        "hash_rate",
+        "30_day_ma_hash_rate",
+        "365_day_ma_hash_rate",
+        "price_close",
+    }
+    assert cycle_csvs == ["cycle_low_data.csv"]
+
+    columns, cycle_csvs = main.required_inputs({"Bitcoin_ATH_Drawdown"})
+    assert columns == set()
+    assert cycle_csvs == ["drawdown_data.csv"]
+
+    # A full build loads every metric some chart plots, and nothing else.
+    columns, cycle_csvs = main.required_inputs(None)
+    assert columns == {
+        series["data"] for template in main.chart_templates for series in template["y_data"]
+    } | {"price_close"}
+    assert cycle_csvs == ["drawdown_data.csv", "cycle_low_data.csv", "halving_data.csv"]
+
+
+def test_preflight_lists_every_missing_required_metric_before_loading(monkeypatch, capsys):
+    monkeypatch.setattr(main, "read_csv_header", lambda filename: ["time", "price_close"])
+
+    with pytest.raises(SystemExit):
+        main.preflight_master_header({"Bitcoin_Hashrate", "Bitcoin_NUPL"})
+
+    output = capsys.readouterr().out
+    assert "missing 4 metric(s)" in output
+    assert "  hash_rate (used by Bitcoin_Hashrate)" in output
+    assert "  nupl (used by Bitcoin_NUPL)" in output
+
+    assert main.preflight_master_header({"Bitcoin_MTD_Return_By_Month_Indexed"}) == [
+        "time",
+        "price_close",
+    ]
+
+
+def test_preflight_checks_the_header_of_the_format_it_will_load(monkeypatch, capsys):
+    monkeypatch.setattr(main, "read_csv_header", lambda filename: pytest.fail("CSV header read"))
+    master_format = ("master_metrics_data.parquet", ["time", "price_close"], None)
+
+    with pytest.raises(SystemExit):
+        main.preflight_master_header({"Bitcoin_NUPL"}, master_format=master_format)
+
+    assert "Error: master_metrics_data.parquet is missing 1 metric(s)" in capsys.readouterr().out